@@ -0,0 +1,29 @@
+"""Add composite index for PRD keyset pagination
+
+Revision ID: 143915f64ee2
+Revises: 6f9ca3e22e95
+Create Date: 2026-10-19 09:12:40.318204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '143915f64ee2'
+down_revision = '6f9ca3e22e95'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        'ix_prd_user_id_created_at_id',
+        'prd',
+        ['user_id', sa.text('created_at DESC'), 'id'],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index('ix_prd_user_id_created_at_id', table_name='prd')
@@ -0,0 +1,75 @@
+"""Store PRD content in the compressed binary format
+
+Revision ID: 5e2f9a0c7d14
+Revises: d4a8c61f0b57
+Create Date: 2026-10-19 13:40:52.114860
+
+"""
+from alembic import context, op
+import sqlalchemy as sa
+
+from app.core.compression import compress_text, decompress_text
+
+
+# revision identifiers, used by Alembic.
+revision = '5e2f9a0c7d14'
+down_revision = 'd4a8c61f0b57'
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 500
+
+prd_table = sa.table(
+    'prd',
+    sa.column('id', sa.Uuid()),
+    sa.column('content'),
+)
+
+
+def _rewrite_content(encode):
+    """Re-encode every PRD's content in id-ordered batches."""
+    bind = op.get_bind()
+    last_id = None
+    while True:
+        query = sa.select(prd_table.c.id, prd_table.c.content).order_by(prd_table.c.id).limit(BATCH_SIZE)
+        if last_id is not None:
+            query = query.where(prd_table.c.id > last_id)
+        rows = bind.execute(query).all()
+        if not rows:
+            break
+        for prd_id, content in rows:
+            bind.execute(
+                prd_table.update()
+                .where(prd_table.c.id == prd_id)
+                .values(content=encode(decompress_text(content)))
+            )
+        last_id = rows[-1].id
+
+
+def upgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        # Existing text becomes raw-marked bytes; compression happens below
+        op.execute(
+            "ALTER TABLE prd ALTER COLUMN content TYPE BYTEA "
+            "USING '\\x00'::bytea || convert_to(content, 'UTF8')"
+        )
+    
+    if context.is_offline_mode():
+        return
+    
+    # Compress with the configured codec (raw-marked when compression is off)
+    _rewrite_content(compress_text)
+
+
+def downgrade():
+    if not context.is_offline_mode():
+        _rewrite_content(lambda text: compress_text(text, codec='none'))
+    
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute(
+            "ALTER TABLE prd ALTER COLUMN content TYPE TEXT "
+            "USING convert_from(substring(content from 2), 'UTF8')"
+        )
+    elif not context.is_offline_mode():
+        # SQLite keeps dynamic typing; store plain text again
+        op.execute("UPDATE prd SET content = CAST(substr(content, 2) AS TEXT) WHERE typeof(content) = 'blob'")
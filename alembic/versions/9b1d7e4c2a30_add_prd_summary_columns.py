@@ -0,0 +1,65 @@
+"""Add precomputed summary columns to PRD
+
+Revision ID: 9b1d7e4c2a30
+Revises: 143915f64ee2
+Create Date: 2026-10-19 10:03:17.552091
+
+"""
+from alembic import context, op
+import sqlalchemy as sa
+
+from app.models.prd import SNIPPET_LENGTH, build_snippet
+
+
+# revision identifiers, used by Alembic.
+revision = '9b1d7e4c2a30'
+down_revision = '143915f64ee2'
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 500
+
+prd_table = sa.table(
+    'prd',
+    sa.column('id', sa.Uuid()),
+    sa.column('content', sa.Text()),
+    sa.column('content_length', sa.Integer()),
+    sa.column('snippet', sa.String()),
+)
+
+
+def upgrade():
+    op.add_column(
+        'prd',
+        sa.Column('content_length', sa.Integer(), nullable=False, server_default='0'),
+    )
+    op.add_column(
+        'prd',
+        sa.Column('snippet', sa.String(length=SNIPPET_LENGTH), nullable=False, server_default=''),
+    )
+    
+    if context.is_offline_mode():
+        return
+    
+    # Backfill existing rows in id order, one batch at a time
+    bind = op.get_bind()
+    last_id = None
+    while True:
+        query = sa.select(prd_table.c.id, prd_table.c.content).order_by(prd_table.c.id).limit(BATCH_SIZE)
+        if last_id is not None:
+            query = query.where(prd_table.c.id > last_id)
+        rows = bind.execute(query).all()
+        if not rows:
+            break
+        for prd_id, content in rows:
+            bind.execute(
+                prd_table.update()
+                .where(prd_table.c.id == prd_id)
+                .values(content_length=len(content or ''), snippet=build_snippet(content))
+            )
+        last_id = rows[-1].id
+
+
+def downgrade():
+    op.drop_column('prd', 'snippet')
+    op.drop_column('prd', 'content_length')
@@ -0,0 +1,151 @@
+"""Move PRD bodies into the content-addressed prd_blob table
+
+Revision ID: a7c3e5f19b62
+Revises: 5e2f9a0c7d14
+Create Date: 2026-10-19 15:02:31.408127
+
+"""
+import hashlib
+from collections import Counter
+
+from alembic import context, op
+import sqlalchemy as sa
+
+from app.core.compression import compress_text, decompress_text
+
+
+# revision identifiers, used by Alembic.
+revision = 'a7c3e5f19b62'
+down_revision = '5e2f9a0c7d14'
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 500
+
+prd_table = sa.table(
+    'prd',
+    sa.column('id', sa.Uuid()),
+    sa.column('content'),
+    sa.column('content_hash', sa.String()),
+)
+
+blob_table = sa.table(
+    'prd_blob',
+    sa.column('hash', sa.String()),
+    sa.column('content'),
+    sa.column('size', sa.Integer()),
+    sa.column('ref_count', sa.Integer()),
+    sa.column('created_at', sa.DateTime()),
+)
+
+
+def _backfill_blobs():
+    """Hash existing content in id-ordered batches and build the blob table."""
+    bind = op.get_bind()
+    last_id = None
+    while True:
+        query = sa.select(prd_table.c.id, prd_table.c.content).order_by(prd_table.c.id).limit(BATCH_SIZE)
+        if last_id is not None:
+            query = query.where(prd_table.c.id > last_id)
+        rows = bind.execute(query).all()
+        if not rows:
+            break
+        
+        contents = {}
+        counts = Counter()
+        for prd_id, content in rows:
+            text = decompress_text(content)
+            digest = hashlib.sha256(text.encode('utf-8')).hexdigest()
+            contents[digest] = text
+            counts[digest] += 1
+            bind.execute(
+                prd_table.update().where(prd_table.c.id == prd_id).values(content_hash=digest)
+            )
+        
+        existing = set(bind.execute(
+            sa.select(blob_table.c.hash).where(blob_table.c.hash.in_(list(counts)))
+        ).scalars())
+        for digest, count in counts.items():
+            if digest in existing:
+                bind.execute(
+                    blob_table.update()
+                    .where(blob_table.c.hash == digest)
+                    .values(ref_count=blob_table.c.ref_count + count)
+                )
+            else:
+                text = contents[digest]
+                bind.execute(blob_table.insert().values(
+                    hash=digest,
+                    content=compress_text(text),
+                    size=len(text.encode('utf-8')),
+                    ref_count=count,
+                    created_at=sa.func.now(),
+                ))
+        last_id = rows[-1].id
+
+
+def _restore_content():
+    """Copy blob content back onto each PRD row."""
+    bind = op.get_bind()
+    last_id = None
+    while True:
+        query = (
+            sa.select(prd_table.c.id, blob_table.c.content)
+            .join(blob_table, blob_table.c.hash == prd_table.c.content_hash)
+            .order_by(prd_table.c.id)
+            .limit(BATCH_SIZE)
+        )
+        if last_id is not None:
+            query = query.where(prd_table.c.id > last_id)
+        rows = bind.execute(query).all()
+        if not rows:
+            break
+        for prd_id, content in rows:
+            bind.execute(prd_table.update().where(prd_table.c.id == prd_id).values(content=content))
+        last_id = rows[-1].id
+
+
+def upgrade():
+    op.create_table(
+        'prd_blob',
+        sa.Column('hash', sa.String(length=64), nullable=False),
+        sa.Column('content', sa.LargeBinary(), nullable=False),
+        sa.Column('size', sa.Integer(), nullable=False),
+        sa.Column('ref_count', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('hash')
+    )
+    op.create_index(
+        'ix_prd_blob_orphans',
+        'prd_blob',
+        ['hash'],
+        unique=False,
+        postgresql_where=sa.text('ref_count <= 0'),
+        sqlite_where=sa.text('ref_count <= 0'),
+    )
+    op.add_column('prd', sa.Column('content_hash', sa.String(length=64), nullable=True))
+    
+    if not context.is_offline_mode():
+        _backfill_blobs()
+    
+    with op.batch_alter_table('prd') as batch_op:
+        batch_op.alter_column('content_hash', existing_type=sa.String(length=64), nullable=False)
+        batch_op.create_foreign_key('fk_prd_content_hash_prd_blob', 'prd_blob', ['content_hash'], ['hash'])
+        batch_op.create_index('ix_prd_content_hash', ['content_hash'], unique=False)
+        batch_op.drop_column('content')
+
+
+def downgrade():
+    op.add_column('prd', sa.Column('content', sa.LargeBinary(), nullable=True))
+    
+    if not context.is_offline_mode():
+        _restore_content()
+    
+    with op.batch_alter_table('prd') as batch_op:
+        batch_op.alter_column('content', existing_type=sa.LargeBinary(), nullable=False)
+        batch_op.drop_index('ix_prd_content_hash')
+        batch_op.drop_constraint('fk_prd_content_hash_prd_blob', type_='foreignkey')
+        batch_op.drop_column('content_hash')
+    
+    op.drop_index('ix_prd_blob_orphans', table_name='prd_blob')
+    op.drop_table('prd_blob')
@@ -0,0 +1,36 @@
+"""Add delta-compressed PRD revision history
+
+Revision ID: b3d9e61a4f70
+Revises: f5a19d2e8c43
+Create Date: 2026-10-19 21:12:08.530417
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b3d9e61a4f70'
+down_revision = 'f5a19d2e8c43'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # No foreign key to prd: a partitioned prd table has no unique key on
+    # id alone. The purge and partition retirement delete history rows.
+    op.create_table(
+        'prd_revision',
+        sa.Column('prd_id', sa.Uuid(), nullable=False),
+        sa.Column('number', sa.Integer(), nullable=False),
+        sa.Column('is_full', sa.Boolean(), nullable=False),
+        sa.Column('data', sa.LargeBinary(), nullable=False),
+        sa.Column('content_hash', sa.String(length=64), nullable=False),
+        sa.Column('size', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('prd_id', 'number')
+    )
+
+
+def downgrade():
+    op.drop_table('prd_revision')
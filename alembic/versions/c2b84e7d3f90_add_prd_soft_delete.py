@@ -0,0 +1,55 @@
+"""Add soft-delete columns and partial indexes to PRDs
+
+Revision ID: c2b84e7d3f90
+Revises: a7c3e5f19b62
+Create Date: 2026-10-19 16:21:07.552381
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c2b84e7d3f90'
+down_revision = 'a7c3e5f19b62'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('prd', sa.Column('is_deleted', sa.Boolean(), server_default=sa.false(), nullable=False))
+    op.add_column('prd', sa.Column('deleted_at', sa.DateTime(), nullable=True))
+    
+    # Listing index only covers live rows
+    op.drop_index('ix_prd_user_id_created_at_id', table_name='prd')
+    op.create_index(
+        'ix_prd_user_id_created_at_id',
+        'prd',
+        ['user_id', sa.text('created_at DESC'), 'id'],
+        unique=False,
+        postgresql_where=sa.text('is_deleted = false'),
+        sqlite_where=sa.text('is_deleted = 0'),
+    )
+    op.create_index(
+        'ix_prd_deleted_at',
+        'prd',
+        ['deleted_at'],
+        unique=False,
+        postgresql_where=sa.text('is_deleted = true'),
+        sqlite_where=sa.text('is_deleted = 1'),
+    )
+
+
+def downgrade():
+    # Soft-deleted rows become visible again unless purged first
+    op.drop_index('ix_prd_deleted_at', table_name='prd')
+    op.drop_index('ix_prd_user_id_created_at_id', table_name='prd')
+    op.create_index(
+        'ix_prd_user_id_created_at_id',
+        'prd',
+        ['user_id', sa.text('created_at DESC'), 'id'],
+        unique=False,
+    )
+    with op.batch_alter_table('prd') as batch_op:
+        batch_op.drop_column('deleted_at')
+        batch_op.drop_column('is_deleted')
@@ -0,0 +1,45 @@
+"""Add API keys for machine clients
+
+Revision ID: c5f82a7d9e13
+Revises: b3d9e61a4f70
+Create Date: 2026-10-19 23:41:27.104862
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c5f82a7d9e13'
+down_revision = 'b3d9e61a4f70'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'api_key',
+        sa.Column('user_id', sa.Uuid(), nullable=False),
+        sa.Column('name', sa.String(length=100), nullable=False),
+        sa.Column('prefix', sa.String(length=16), nullable=False),
+        sa.Column('secret_hash', sa.String(length=64), nullable=False),
+        sa.Column('scopes', sa.String(length=255), nullable=False),
+        sa.Column('last_used_at', sa.DateTime(), nullable=True),
+        sa.Column('revoked_at', sa.DateTime(), nullable=True),
+        sa.Column('id', sa.Uuid(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['user.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    # Authentication finds a key by its prefix alone
+    op.create_index(op.f('ix_api_key_prefix'), 'api_key', ['prefix'], unique=True)
+    op.create_index(op.f('ix_api_key_user_id'), 'api_key', ['user_id'], unique=False)
+    op.create_index(op.f('ix_api_key_id'), 'api_key', ['id'], unique=False)
+
+
+def downgrade():
+    op.drop_index(op.f('ix_api_key_id'), table_name='api_key')
+    op.drop_index(op.f('ix_api_key_user_id'), table_name='api_key')
+    op.drop_index(op.f('ix_api_key_prefix'), table_name='api_key')
+    op.drop_table('api_key')
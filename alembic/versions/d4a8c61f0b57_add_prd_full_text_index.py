@@ -0,0 +1,88 @@
+"""Add full-text search index for PRDs
+
+Revision ID: d4a8c61f0b57
+Revises: 9b1d7e4c2a30
+Create Date: 2026-10-19 11:24:05.907713
+
+"""
+from alembic import context, op
+import sqlalchemy as sa
+
+from app.models.prd_search import (
+    POSTGRES_CREATE_DDL,
+    POSTGRES_DROP_DDL,
+    SQLITE_CREATE_DDL,
+    SQLITE_DROP_DDL,
+)
+
+
+# revision identifiers, used by Alembic.
+revision = 'd4a8c61f0b57'
+down_revision = '9b1d7e4c2a30'
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 500
+
+prd_table = sa.table(
+    'prd',
+    sa.column('id', sa.Uuid()),
+    sa.column('user_id', sa.Uuid()),
+    sa.column('title', sa.String()),
+    sa.column('content', sa.Text()),
+)
+
+
+def upgrade():
+    is_postgres = op.get_bind().dialect.name == 'postgresql'
+    for statement in POSTGRES_CREATE_DDL if is_postgres else SQLITE_CREATE_DDL:
+        op.execute(statement)
+    
+    if context.is_offline_mode():
+        return
+    
+    # Backfill the index from existing rows in id order, one batch at a time
+    bind = op.get_bind()
+    last_id = None
+    while True:
+        query = sa.select(prd_table).order_by(prd_table.c.id).limit(BATCH_SIZE)
+        if last_id is not None:
+            query = query.where(prd_table.c.id > last_id)
+        rows = bind.execute(query).all()
+        if not rows:
+            break
+        if is_postgres:
+            bind.execute(
+                sa.text(
+                    "INSERT INTO prd_search (prd_id, user_id, title, body) "
+                    "VALUES (:prd_id, :user_id, :title, :body)"
+                ),
+                [
+                    {"prd_id": row.id, "user_id": row.user_id, "title": row.title, "body": row.content}
+                    for row in rows
+                ],
+            )
+        else:
+            bind.execute(
+                sa.text(
+                    "INSERT INTO prd_fts (rowid, title, content, owner, prd_id) "
+                    "VALUES (:rowid, :title, :content, :owner, :prd_id)"
+                ),
+                [
+                    {
+                        "rowid": row.id.int >> 65,
+                        "title": row.title,
+                        "content": row.content,
+                        "owner": row.user_id.hex,
+                        "prd_id": row.id.hex,
+                    }
+                    for row in rows
+                ],
+            )
+        last_id = rows[-1].id
+
+
+def downgrade():
+    is_postgres = op.get_bind().dialect.name == 'postgresql'
+    for statement in POSTGRES_DROP_DDL if is_postgres else SQLITE_DROP_DDL:
+        op.execute(statement)
@@ -0,0 +1,75 @@
+"""Add incrementally maintained per-user PRD statistics
+
+Revision ID: e81f0a5c6b27
+Revises: c2b84e7d3f90
+Create Date: 2026-10-19 17:05:44.209318
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'e81f0a5c6b27'
+down_revision = 'c2b84e7d3f90'
+branch_labels = None
+depends_on = None
+
+prd_table = sa.table(
+    'prd',
+    sa.column('user_id', sa.Uuid()),
+    sa.column('template_type', sa.String()),
+    sa.column('content_hash', sa.String()),
+    sa.column('content_length', sa.Integer()),
+    sa.column('is_deleted', sa.Boolean()),
+)
+
+blob_table = sa.table(
+    'prd_blob',
+    sa.column('hash', sa.String()),
+    sa.column('size', sa.Integer()),
+)
+
+
+def upgrade():
+    stats_table = op.create_table(
+        'user_prd_stats',
+        sa.Column('user_id', sa.Uuid(), nullable=False),
+        # Reuses the enum type created with the prd table
+        sa.Column(
+            'template_type',
+            postgresql.ENUM('CRUD', 'AI_AGENT', 'SAAS', 'CUSTOM', name='templatetype', create_type=False),
+            nullable=False
+        ),
+        sa.Column('prd_count', sa.Integer(), nullable=False),
+        sa.Column('content_bytes', sa.BigInteger(), nullable=False),
+        sa.Column('tokens_generated', sa.BigInteger(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['user.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id', 'template_type')
+    )
+    
+    # Backfill from existing rows; historical token usage is estimated the
+    # same way as new generations (about four characters per token)
+    live = sa.case((prd_table.c.is_deleted, 0), else_=1)
+    totals = (
+        sa.select(
+            prd_table.c.user_id,
+            prd_table.c.template_type,
+            sa.func.sum(live),
+            sa.func.sum(live * blob_table.c.size),
+            sa.func.sum((prd_table.c.content_length + 3) // 4),
+        )
+        .select_from(prd_table.join(blob_table, blob_table.c.hash == prd_table.c.content_hash))
+        .group_by(prd_table.c.user_id, prd_table.c.template_type)
+    )
+    op.execute(
+        stats_table.insert().from_select(
+            ['user_id', 'template_type', 'prd_count', 'content_bytes', 'tokens_generated'],
+            totals,
+        )
+    )
+
+
+def downgrade():
+    op.drop_table('user_prd_stats')
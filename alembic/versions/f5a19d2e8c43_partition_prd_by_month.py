@@ -0,0 +1,109 @@
+"""Optionally range-partition the PRD table by created_at month (Postgres)
+
+Applies only on Postgres when PRD_PARTITIONING is enabled or the migration
+runs with ``-x partition_prd=true``; otherwise it is a no-op. The table is
+rebuilt as a partitioned table whose primary key includes ``created_at``,
+with one partition per month from the oldest row to
+PRD_PARTITION_MONTHS_AHEAD months ahead plus a default partition. In
+offline (``--sql``) mode pass ``-x partition_from=YYYY-MM`` to choose the
+first month; older rows land in the default partition.
+
+Revision ID: f5a19d2e8c43
+Revises: e81f0a5c6b27
+Create Date: 2026-10-19 17:48:12.660914
+
+"""
+from datetime import date, datetime
+
+from alembic import context, op
+import sqlalchemy as sa
+
+from app.core.config import settings
+from app.db.partitions import (
+    add_months,
+    create_default_partition_sql,
+    create_partition_sql,
+    iter_months,
+    month_start,
+)
+
+
+# revision identifiers, used by Alembic.
+revision = 'f5a19d2e8c43'
+down_revision = 'e81f0a5c6b27'
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    "CREATE INDEX ix_prd_id ON prd (id)",
+    "CREATE INDEX ix_prd_title ON prd (title)",
+    "CREATE INDEX ix_prd_user_id ON prd (user_id)",
+    "CREATE INDEX ix_prd_content_hash ON prd (content_hash)",
+    "CREATE INDEX ix_prd_user_id_created_at_id ON prd (user_id, created_at DESC, id) WHERE is_deleted = false",
+    "CREATE INDEX ix_prd_deleted_at ON prd (deleted_at) WHERE is_deleted = true",
+]
+
+FOREIGN_KEYS = [
+    "ALTER TABLE prd ADD CONSTRAINT prd_user_id_fkey "
+    "FOREIGN KEY (user_id) REFERENCES \"user\" (id) ON DELETE CASCADE",
+    "ALTER TABLE prd ADD CONSTRAINT fk_prd_content_hash_prd_blob "
+    "FOREIGN KEY (content_hash) REFERENCES prd_blob (hash)",
+]
+
+
+def _enabled():
+    """Whether this deployment opted into partitioning."""
+    if context.get_context().dialect.name != 'postgresql':
+        return False
+    flag = context.get_x_argument(as_dictionary=True).get('partition_prd')
+    if flag is None:
+        return settings.PRD_PARTITIONING
+    return flag.lower() in ('1', 'true', 'yes')
+
+
+def _first_month():
+    """Month of the oldest PRD (or the month given with -x partition_from)."""
+    option = context.get_x_argument(as_dictionary=True).get('partition_from')
+    if option:
+        return month_start(datetime.strptime(option, '%Y-%m'))
+    if context.is_offline_mode():
+        return month_start(date.today())
+    oldest = op.get_bind().execute(sa.text("SELECT min(created_at) FROM prd")).scalar()
+    return month_start(oldest or date.today())
+
+
+def _rebuild(create_sql, extra_sql, primary_key):
+    """Copy prd into a new table built by ``create_sql`` and swap it in."""
+    op.execute("ALTER TABLE prd RENAME TO prd_old")
+    op.execute(create_sql)
+    for statement in extra_sql:
+        op.execute(statement)
+    op.execute("INSERT INTO prd SELECT * FROM prd_old")
+    # Dropping the old table frees its index and constraint names
+    op.execute("DROP TABLE prd_old")
+    op.execute(f"ALTER TABLE prd ADD CONSTRAINT prd_pkey PRIMARY KEY ({primary_key})")
+    for statement in FOREIGN_KEYS + INDEXES:
+        op.execute(statement)
+
+
+def upgrade():
+    if not _enabled():
+        return
+    
+    first = _first_month()
+    last = add_months(month_start(date.today()), settings.PRD_PARTITION_MONTHS_AHEAD)
+    partitions = [create_partition_sql(month) for month in iter_months(first, last)]
+    _rebuild(
+        "CREATE TABLE prd (LIKE prd_old INCLUDING DEFAULTS) PARTITION BY RANGE (created_at)",
+        partitions + [create_default_partition_sql()],
+        # Unique constraints on a partitioned table must include the key
+        "id, created_at",
+    )
+
+
+def downgrade():
+    if not _enabled():
+        return
+    
+    # Detached or archived partitions are not brought back
+    _rebuild("CREATE TABLE prd (LIKE prd_old INCLUDING DEFAULTS)", [], "id")
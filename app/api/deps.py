@@ -1,17 +1,25 @@
 """API dependencies for FastAPI endpoints."""
 
-from typing import Optional
+from typing import Callable, Optional
 import uuid
 
-from fastapi import Depends, HTTPException, status, Header
-from sqlalchemy.orm import Session
-from jose import jwt, JWTError
+from fastapi import Depends, HTTPException, Request, status, Header
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.session import get_db
-from app.core.config import settings
+from app.core.rate_limit import STATE_KEY, rate_limiter
+from app.core.security import decode_access_token
+from app.services.api_key_service import APIKeyService, is_api_key
 from app.services.user_service import UserService
 from app.models.user import User as UserModel
 
+# request.state attribute holding the scopes of the API key in use (unset
+# for JWT sessions, which may do everything)
+API_KEY_SCOPES = "api_key_scopes"
+
+# Scope no API key is ever granted: routes requiring it need a user session
+SESSION_SCOPE = "session"
+
 # Simple function to get token from Authorization header
 def get_token(authorization: Optional[str] = Header(None)) -> Optional[str]:
     """Extract JWT token from Authorization header."""
@@ -25,41 +33,49 @@ def get_token(authorization: Optional[str] = Header(None)) -> Optional[str]:
     return parts[1]
 
 # Function to get current user (without requiring authentication)
-def get_current_user(
-    db: Session = Depends(get_db),
-    token: Optional[str] = Depends(get_token)
+async def get_current_user(
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    token: Optional[str] = Depends(get_token),
+    x_api_key: Optional[str] = Header(None),
 ) -> Optional[UserModel]:
     """
-    Get current user from JWT token without requiring authentication.
+    Get current user from a JWT or API key without requiring authentication.
+    
+    API keys are accepted in ``X-API-Key`` or as a bearer token starting
+    with ``pk_``; their scopes are stored on ``request.state``.
     
     Args:
+        request: Current request
         db: Database session
-        token: JWT token
+        token: JWT token or API key
+        x_api_key: API key header
         
     Returns:
-        User if token is valid, None otherwise
+        User if the credential is valid, None otherwise
     """
+    api_key = x_api_key or (token if token and is_api_key(token) else None)
+    if api_key:
+        db_key = await APIKeyService.authenticate(db, api_key)
+        if db_key is None:
+            return None
+        setattr(request.state, API_KEY_SCOPES, db_key.scope_set)
+        return await UserService.get_principal(db, db_key.user_id)
+    
     if not token:
         return None
         
-    try:
-        payload = jwt.decode(
-            token, 
-            settings.SECRET_KEY, 
-            algorithms=[settings.ALGORITHM]
-        )
-        user_id = payload.get("sub")
-        if not user_id:
-            return None
-    except JWTError:
+    payload = decode_access_token(token)
+    user_id = payload.get("sub") if payload else None
+    if not user_id:
         return None
         
-    user = UserService.get_by_id(db, uuid.UUID(user_id))
+    user = await UserService.get_principal(db, uuid.UUID(user_id))
     return user
 
 # Function to get current active user (requiring authentication)
-def get_current_active_user(
-    db: Session = Depends(get_db),
+async def get_current_active_user(
+    db: AsyncSession = Depends(get_db),
     current_user: Optional[UserModel] = Depends(get_current_user)
 ) -> UserModel:
     """
@@ -113,3 +129,63 @@ def get_current_active_superuser(
         )
         
     return current_user
+
+# Scope checks for API key callers
+def require_scope(scope: str) -> Callable:
+    """
+    Build a dependency requiring a scope from API key callers.
+    
+    JWT sessions pass every scope check.
+    
+    Args:
+        scope: Scope name, e.g. ``"prd:read"``
+        
+    Returns:
+        Dependency raising 403 when the caller's API key lacks the scope
+    """
+    async def check_scope(
+        request: Request,
+        current_user: UserModel = Depends(get_current_active_user),
+    ) -> None:
+        scopes = getattr(request.state, API_KEY_SCOPES, None)
+        if scopes is not None and scope not in scopes:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=f"API key lacks the {scope} scope",
+            )
+    
+    return check_scope
+
+# Rate limiting for a route (budgets are configured in settings)
+def rate_limit(budget: str) -> Callable:
+    """
+    Build a dependency enforcing a rate-limit budget on a route.
+    
+    Args:
+        budget: Budget name, e.g. ``"generate"`` or ``"read"``
+        
+    Returns:
+        Dependency raising 429 once the caller's user or IP bucket is empty
+    """
+    async def check_rate_limit(
+        request: Request,
+        current_user: Optional[UserModel] = Depends(get_current_user),
+    ) -> None:
+        route = request.scope.get("route")
+        decision = await rate_limiter.check(
+            budget,
+            route.path if route is not None else request.url.path,
+            str(current_user.id) if current_user else None,
+            request.client.host if request.client else None,
+        )
+        if decision is None:
+            return
+        if not decision.allowed:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Rate limit exceeded",
+                headers=decision.headers(),
+            )
+        setattr(request.state, STATE_KEY, decision.headers())
+    
+    return check_rate_limit
@@ -0,0 +1,85 @@
+"""API key management endpoints."""
+
+import uuid
+from typing import Any, List
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import SESSION_SCOPE, get_current_active_user, get_db, require_scope
+from app.models.user import User
+from app.schemas.api_key import APIKeyCreate, APIKeyCreated, APIKeyInfo
+from app.services.api_key_service import APIKeyService
+
+# Keys are managed from a user session only; a key cannot mint or revoke keys
+router = APIRouter(dependencies=[Depends(require_scope(SESSION_SCOPE))])
+
+
+@router.post("/", response_model=APIKeyCreated, status_code=status.HTTP_201_CREATED)
+async def create_api_key(
+    key_in: APIKeyCreate,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+) -> Any:
+    """
+    Create an API key for the current user.
+    
+    Args:
+        key_in: Name and scopes
+        db: Database session
+        current_user: Current authenticated user
+        
+    Returns:
+        The key, including the full key string which is shown only once
+    """
+    db_key, raw_key = await APIKeyService.create(db, current_user.id, key_in)
+    return APIKeyCreated.model_validate(
+        {**APIKeyInfo.model_validate(db_key).model_dump(), "key": raw_key}
+    )
+
+
+@router.get("/", response_model=List[APIKeyInfo])
+async def list_api_keys(
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+) -> Any:
+    """
+    List the current user's API keys.
+    
+    Args:
+        db: Database session
+        current_user: Current authenticated user
+        
+    Returns:
+        API keys without their secrets, newest first
+    """
+    return await APIKeyService.list_for_user(db, current_user.id)
+
+
+@router.delete("/{key_id}", response_model=APIKeyInfo)
+async def revoke_api_key(
+    key_id: uuid.UUID,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+) -> Any:
+    """
+    Revoke an API key.
+    
+    Args:
+        key_id: API key ID
+        db: Database session
+        current_user: Current authenticated user
+        
+    Returns:
+        The revoked key
+        
+    Raises:
+        HTTPException: If the key is not found or doesn't belong to the user
+    """
+    db_key = await APIKeyService.get(db, key_id)
+    if not db_key or db_key.user_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="API key not found",
+        )
+    return await APIKeyService.revoke(db, db_key)
@@ -5,7 +5,7 @@ from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
 from app.core.security import create_access_token
@@ -21,7 +21,7 @@ router = APIRouter()
 @router.post("/login", response_model=Token)
 async def login_access_token(
     form_data: OAuth2PasswordRequestForm = Depends(),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> Any:
     """
     OAuth2 compatible token login, get an access token for future requests.
@@ -40,7 +40,7 @@ async def login_access_token(
     print(f"Login attempt for user: {form_data.username}")
     
     # Authenticate user
-    user = UserService.authenticate(
+    user = await UserService.authenticate(
         db, email=form_data.username, password=form_data.password
     )
     if not user:
@@ -72,7 +72,7 @@ async def login_access_token(
 @router.post("/register", response_model=UserSchema, status_code=status.HTTP_201_CREATED)
 async def register_user(
     user_in: UserCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> Any:
     """
     Register a new user.
@@ -91,7 +91,7 @@ async def register_user(
     print(f"Registration attempt for email: {user_in.email}")
     
     # Check if user already exists
-    user = UserService.get_by_email(db, email=user_in.email)
+    user = await UserService.get_by_email(db, email=user_in.email)
     if user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -99,7 +99,7 @@ async def register_user(
         )
     
     # Create user
-    user = UserService.create(db, user_in=user_in)
+    user = await UserService.create(db, user_in=user_in)
     
     # Log successful registration
     print(f"User registered successfully: {user_in.email}")
@@ -2,26 +2,97 @@
 
 import uuid
 from datetime import datetime
-from typing import Any, List
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, File, HTTPException, Path, Query, Request, Response, UploadFile, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_active_user, get_db
+from app.api.deps import get_current_active_user, get_db, rate_limit, require_scope
+from app.core.config import settings
+from app.core.http_cache import http_date, is_not_modified, make_etag, make_list_etag
+from app.core.pagination import decode_cursor, encode_cursor
+from app.core.responses import RowSerializer
 from app.db.session import get_db
 from app.models.user import User
-from app.schemas.prd import PRDCreate, PRDResponse, PRDUpdate, PRDInDB
+from app.schemas.api_key import APIKeyScope
+from app.schemas.prd import ExportFormat, PRDCreate, PRDImportReport, PRDResponse, PRDRevisionInfo, PRDRevisionResponse, PRDSearchResult, PRDSummary, PRDUpdate, PRDInDB
+from app.services.export_service import PRDExportService
+from app.services.import_service import PRDImportService
 from app.services.llm_service import generate_prd_content, ModelProvider
 from app.services.prd_service import PRDService
+from app.services.revision_service import RevisionService
+from app.services.search_service import PRDSearchService
+from app.services.stats_service import StatsService
 
 router = APIRouter()
 
+# Route guards: the API key scope a route needs, then its rate-limit budget
+_READ = [Depends(require_scope(APIKeyScope.PRD_READ.value)), Depends(rate_limit("read"))]
+_WRITE = [Depends(require_scope(APIKeyScope.PRD_WRITE.value))]
+_GENERATE = _WRITE + [Depends(rate_limit("generate"))]
 
-@router.post("/generate", response_model=PRDResponse)
+
+def _parse_cursor(cursor: Optional[str]) -> Optional[Tuple[datetime, uuid.UUID]]:
+    """Decode an optional pagination cursor, rejecting malformed values."""
+    if not cursor:
+        return None
+    try:
+        return decode_cursor(cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+def _set_next_cursor(response: Response, items: Sequence[Any], limit: int) -> None:
+    """Set ``X-Next-Cursor`` when a full page suggests more rows follow."""
+    if items and len(items) == limit:
+        last = items[-1]
+        response.headers["X-Next-Cursor"] = encode_cursor(last.created_at, last.id)
+
+
+async def _set_total_count(response: Response, db: AsyncSession, user_id: uuid.UUID) -> None:
+    """Set ``X-Total-Count`` from the user's maintained PRD count."""
+    response.headers["X-Total-Count"] = str(await StatsService.count_for_user(db, user_id))
+
+
+# Precompiled serializers for the fast response path (FAST_JSON_RESPONSES)
+PRD_ROWS = RowSerializer(PRDResponse)
+SUMMARY_ROWS = RowSerializer(PRDSummary)
+SEARCH_ROWS = RowSerializer(PRDSearchResult)
+
+# Browsers may keep authenticated PRDs but must revalidate them on each use
+CACHE_CONTROL = "private, no-cache"
+
+
+def _is_conditional(request: Request) -> bool:
+    """Whether the request carries a conditional GET header."""
+    return "if-none-match" in request.headers or "if-modified-since" in request.headers
+
+
+def _validator_headers(prd: Any) -> Dict[str, str]:
+    """Return the ETag, Last-Modified and Cache-Control headers of a PRD."""
+    return {
+        "ETag": make_etag(prd.content_hash, prd.updated_at),
+        "Last-Modified": http_date(prd.updated_at),
+        "Cache-Control": CACHE_CONTROL,
+    }
+
+
+def _page_etag(items: Sequence[Any]) -> str:
+    """Return the ETag of a listing page."""
+    return make_list_etag((item.id, item.content_hash, item.updated_at) for item in items)
+
+
+def _not_modified(headers: Dict[str, str]) -> Response:
+    """Build an empty 304 response carrying ``headers``."""
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+
+@router.post("/generate", response_model=PRDResponse, dependencies=_GENERATE)
 async def generate_prd(
     request: Request,
     prd_data: PRDCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
 ) -> Any:
     """
@@ -44,7 +115,7 @@ async def generate_prd(
         )
         
         # Save the PRD to the database
-        db_prd = PRDService.create(
+        db_prd = await PRDService.create(
             db=db,
             prd_in=prd_data,
             content=content,
@@ -67,41 +138,223 @@ async def generate_prd(
         raise HTTPException(status_code=500, detail=f"PRD generation failed: {str(e)}")
 
 
-@router.get("/", response_model=List[PRDResponse])
-def read_prds(
+@router.get("/", response_model=List[PRDResponse], dependencies=_READ)
+async def read_prds(
+    request: Request,
+    response: Response,
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
 ) -> Any:
     """
     Retrieve PRDs for the current user.
     
+    Pages can be walked with ``cursor`` (keyset pagination): each response
+    carries an ``X-Next-Cursor`` header when more rows may follow, and an
+    ``X-Total-Count`` header with the user's PRD count. The ``skip``
+    offset is kept for compatibility and ignored when a cursor is given.
+    
+    Each page carries an ``ETag``; a matching ``If-None-Match`` is
+    answered with 304 from the listing index, without loading content.
+    
     Args:
+        request: Incoming request (checked for conditional headers)
+        response: Outgoing response (used to set the next cursor header)
         skip: Number of items to skip for pagination
         limit: Maximum number of items to return
+        cursor: Opaque cursor from a previous ``X-Next-Cursor`` header
         db: Database session
         current_user: Current authenticated user
         
     Returns:
         List of PRDs belonging to the current user
     """
-    prds = PRDService.get_by_user(
-        db=db, user_id=current_user.id, skip=skip, limit=limit
-    )
+    position = _parse_cursor(cursor)
+    if _is_conditional(request):
+        versions = await PRDService.get_versions_by_user(
+            db=db, user_id=current_user.id, skip=skip, limit=limit, cursor=position
+        )
+        etag = _page_etag(versions)
+        if is_not_modified(request, etag):
+            not_modified = _not_modified({"ETag": etag, "Cache-Control": CACHE_CONTROL})
+            _set_next_cursor(not_modified, versions, limit)
+            await _set_total_count(not_modified, db, current_user.id)
+            return not_modified
+    
+    if settings.FAST_JSON_RESPONSES:
+        prds = await PRDService.get_rows_by_user(
+            db=db, user_id=current_user.id, skip=skip, limit=limit, cursor=position
+        )
+    else:
+        prds = await PRDService.get_by_user(
+            db=db, user_id=current_user.id, skip=skip, limit=limit, cursor=position
+        )
+    _set_next_cursor(response, prds, limit)
+    await _set_total_count(response, db, current_user.id)
+    response.headers["ETag"] = _page_etag(prds)
+    response.headers["Cache-Control"] = CACHE_CONTROL
+    if settings.FAST_JSON_RESPONSES:
+        return PRD_ROWS.response(prds, response.headers)
     return prds
 
 
-@router.get("/{prd_id}", response_model=PRDResponse)
-def read_prd(
+@router.get("/summaries", response_model=List[PRDSummary], dependencies=_READ)
+async def read_prd_summaries(
+    request: Request,
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+) -> Any:
+    """
+    Retrieve lightweight PRD summaries for the current user.
+    
+    Returns listing fields and a precomputed snippet without loading PRD
+    content; fetch ``/{prd_id}`` for the full document. Pagination and
+    ETags work as for the full listing.
+    
+    Args:
+        request: Incoming request (checked for conditional headers)
+        response: Outgoing response (used to set the next cursor header)
+        skip: Number of items to skip for pagination
+        limit: Maximum number of items to return
+        cursor: Opaque cursor from a previous ``X-Next-Cursor`` header
+        db: Database session
+        current_user: Current authenticated user
+        
+    Returns:
+        List of PRD summaries belonging to the current user
+    """
+    position = _parse_cursor(cursor)
+    rows = await PRDService.get_summaries_by_user(
+        db=db, user_id=current_user.id, skip=skip, limit=limit, cursor=position
+    )
+    _set_next_cursor(response, rows, limit)
+    await _set_total_count(response, db, current_user.id)
+    response.headers["ETag"] = _page_etag(rows)
+    response.headers["Cache-Control"] = CACHE_CONTROL
+    if is_not_modified(request, response.headers["ETag"]):
+        return _not_modified(dict(response.headers))
+    if settings.FAST_JSON_RESPONSES:
+        return SUMMARY_ROWS.response(rows, response.headers)
+    return rows
+
+
+@router.get("/search", response_model=List[PRDSearchResult], dependencies=_READ)
+async def search_prds(
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+) -> Any:
+    """
+    Full-text search over the current user's PRDs.
+    
+    Args:
+        q: Search query
+        limit: Maximum number of results to return
+        offset: Number of results to skip for pagination
+        db: Database session
+        current_user: Current authenticated user
+        
+    Returns:
+        Ranked matches with highlighted title and content excerpt
+    """
+    rows = await PRDSearchService.search(
+        db=db, user_id=current_user.id, query=q, limit=limit, offset=offset
+    )
+    if settings.FAST_JSON_RESPONSES:
+        return SEARCH_ROWS.response(rows)
+    return rows
+
+
+@router.get("/export", dependencies=_READ)
+async def export_prds(
+    format: ExportFormat = Query(ExportFormat.NDJSON),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+) -> StreamingResponse:
+    """
+    Stream all of the current user's PRDs as NDJSON or a ZIP archive.
+    
+    Rows are read through a server-side cursor and written to the
+    response as they arrive, so memory use does not grow with the number
+    of PRDs.
+    
+    Args:
+        format: ``ndjson`` (one JSON object per line) or ``zip`` (one
+            document plus metadata file per PRD)
+        db: Database session
+        current_user: Current authenticated user
+        
+    Returns:
+        Streaming download of the export
+    """
+    records = PRDExportService.stream_records(db, current_user.id)
+    if format == ExportFormat.ZIP:
+        body, media_type = PRDExportService.zip_archive(records), "application/zip"
+    else:
+        body, media_type = PRDExportService.ndjson_lines(records), "application/x-ndjson"
+    filename = f"prds-{datetime.utcnow():%Y%m%d}.{format.value}"
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.post("/import", response_model=PRDImportReport, dependencies=_WRITE)
+async def import_prds(
+    file: UploadFile = File(...),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+) -> Any:
+    """
+    Import PRDs from an NDJSON or ZIP upload.
+    
+    NDJSON uploads hold one object per line with the ``PRDCreate`` fields
+    and ``content``; ZIP uploads may contain NDJSON members or the
+    document and ``.meta.json`` pairs written by ``/export``. Valid items
+    are inserted in batches; invalid ones are listed in the report.
+    
+    Args:
+        file: Uploaded NDJSON or ZIP file
+        db: Database session
+        current_user: Current authenticated user
+        
+    Returns:
+        Counts of imported and rejected items with per-item errors
+    """
+    # The upload is spooled to disk by the framework; parse it from there
+    is_zip = file.file.read(4) == b"PK\x03\x04"
+    file.file.seek(0)
+    items = (PRDImportService.iter_zip if is_zip else PRDImportService.iter_ndjson)(file.file)
+    return await PRDImportService.run(db, items, current_user.id)
+
+
+@router.get("/{prd_id}", response_model=PRDResponse, dependencies=_READ)
+async def read_prd(
+    request: Request,
+    response: Response,
     prd_id: uuid.UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
 ) -> Any:
     """
     Get a specific PRD by ID.
     
+    The response carries a strong ``ETag`` and ``Last-Modified``. When
+    ``If-None-Match`` or ``If-Modified-Since`` still matches, 304 is
+    returned after reading only the PRD's hash and timestamps.
+    
     Args:
+        request: Incoming request (checked for conditional headers)
+        response: Outgoing response (used to set validator headers)
         prd_id: PRD ID
         db: Database session
         current_user: Current authenticated user
@@ -112,7 +365,14 @@ def read_prd(
     Raises:
         HTTPException: If PRD not found or doesn't belong to user
     """
-    prd = PRDService.get_by_id(db=db, prd_id=prd_id)
+    if _is_conditional(request):
+        version = await PRDService.get_version(db=db, prd_id=prd_id)
+        if version is not None and version.user_id == current_user.id:
+            headers = _validator_headers(version)
+            if is_not_modified(request, headers["ETag"], version.updated_at):
+                return _not_modified(headers)
+    
+    prd = await PRDService.get_by_id(db=db, prd_id=prd_id)
     if not prd:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -123,13 +383,87 @@ def read_prd(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not enough permissions",
         )
+    response.headers.update(_validator_headers(prd))
     return prd
 
 
-@router.delete("/{prd_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_prd(
+async def _get_owned_version(db: AsyncSession, prd_id: uuid.UUID, user: User) -> Any:
+    """Return a PRD's version row, raising 404/403 like ``read_prd``."""
+    version = await PRDService.get_version(db=db, prd_id=prd_id)
+    if version is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="PRD not found",
+        )
+    if version.user_id != user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not enough permissions",
+        )
+    return version
+
+
+@router.get("/{prd_id}/revisions", response_model=List[PRDRevisionInfo], dependencies=_READ)
+async def read_prd_revisions(
+    prd_id: uuid.UUID,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+) -> Any:
+    """
+    List the content revisions of a PRD, oldest first.
+    
+    Args:
+        prd_id: PRD ID
+        db: Database session
+        current_user: Current authenticated user
+        
+    Returns:
+        Revision metadata (without content)
+        
+    Raises:
+        HTTPException: If PRD not found or doesn't belong to user
+    """
+    version = await _get_owned_version(db, prd_id, current_user)
+    return await RevisionService.list_revisions(db, version)
+
+
+@router.get("/{prd_id}/revisions/{number}", response_model=PRDRevisionResponse, dependencies=_READ)
+async def read_prd_revision(
+    prd_id: uuid.UUID,
+    number: int = Path(..., ge=1),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+) -> Any:
+    """
+    Get the content of a PRD as of one revision.
+    
+    Args:
+        prd_id: PRD ID
+        number: Revision number (1 is the originally generated content)
+        db: Database session
+        current_user: Current authenticated user
+        
+    Returns:
+        Reconstructed revision
+        
+    Raises:
+        HTTPException: If the PRD or revision is not found, or the PRD
+            doesn't belong to user
+    """
+    version = await _get_owned_version(db, prd_id, current_user)
+    revision = await RevisionService.get_revision(db, version, number)
+    if revision is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Revision not found",
+        )
+    return revision
+
+
+@router.delete("/{prd_id}", status_code=status.HTTP_204_NO_CONTENT, dependencies=_WRITE)
+async def delete_prd(
     prd_id: uuid.UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
 ) -> None:
     """
@@ -143,7 +477,7 @@ def delete_prd(
     Raises:
         HTTPException: If PRD not found or doesn't belong to user
     """
-    prd = PRDService.get_by_id(db=db, prd_id=prd_id)
+    prd = await PRDService.get_by_id(db=db, prd_id=prd_id)
     if not prd:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -154,4 +488,4 @@ def delete_prd(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not enough permissions",
         )
-    PRDService.delete(db=db, db_prd=prd)
+    await PRDService.delete(db=db, db_prd=prd)
@@ -3,18 +3,19 @@
 from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_active_user, get_current_user, get_db
+from app.api.deps import SESSION_SCOPE, get_current_active_user, get_current_user, get_db, require_scope
 from app.models.user import User
+from app.services.stats_service import StatsService
 from app.services.user_service import UserService
-from app.schemas.user import User as UserSchema, UserUpdate
+from app.schemas.user import User as UserSchema, UserStats, UserUpdate
 
 router = APIRouter()
 
 
 @router.get("/me", response_model=UserSchema)
-def read_users_me(
+async def read_users_me(
     current_user: User = Depends(get_current_active_user),
 ) -> Any:
     """
@@ -29,10 +30,32 @@ def read_users_me(
     return current_user
 
 
-@router.put("/me", response_model=UserSchema)
-def update_users_me(
+@router.get("/me/stats", response_model=UserStats)
+async def read_users_me_stats(
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+) -> Any:
+    """
+    Get PRD statistics for the current user.
+    
+    Totals are maintained incrementally, so this is constant-time
+    regardless of history size.
+    
+    Args:
+        db: Database session
+        current_user: Current authenticated user
+        
+    Returns:
+        PRD count, stored bytes and tokens generated, with a per-template
+        breakdown
+    """
+    return await StatsService.get_for_user(db, current_user.id)
+
+
+@router.put("/me", response_model=UserSchema, dependencies=[Depends(require_scope(SESSION_SCOPE))])
+async def update_users_me(
     *,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     user_in: UserUpdate,
     current_user: User = Depends(get_current_active_user),
 ) -> Any:
@@ -47,5 +70,5 @@ def update_users_me(
     Returns:
         Updated user information
     """
-    user = UserService.update(db, db_user=current_user, user_in=user_in)
+    user = await UserService.update(db, db_user=current_user, user_in=user_in)
     return user
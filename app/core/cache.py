@@ -0,0 +1,192 @@
+"""In-process TTL/LRU caches with optional cross-process invalidation."""
+
+import asyncio
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Generic, Hashable, List, Optional, Tuple, TypeVar
+
+from app.core.metrics import metrics
+
+try:
+    from redis import asyncio as redis_asyncio
+except ImportError:  # pragma: no cover - optional dependency
+    redis_asyncio = None
+
+logger = logging.getLogger(__name__)
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """
+    Size-bounded LRU cache whose entries expire after a fixed TTL.
+    
+    Thread-safe. Hits, misses and evictions are counted under
+    ``cache.<name>.*`` and the current size is exposed as a gauge.
+    """
+    
+    def __init__(self, name: str, max_size: int, ttl: float, clock: Callable[[], float] = time.monotonic) -> None:
+        """
+        Initialize an empty cache.
+        
+        Args:
+            name: Name used for metrics
+            max_size: Maximum number of entries (least recently used go first)
+            ttl: Seconds an entry stays valid after it is stored
+            clock: Monotonic time source (overridable for tests)
+        """
+        self.name = name
+        self.max_size = max_size
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[K, Tuple[float, V]]" = OrderedDict()
+        metrics.gauge(f"cache.{name}.size", lambda: len(self._entries))
+        metrics.gauge(f"cache.{name}.hit_ratio", self.hit_ratio)
+    
+    def hit_ratio(self) -> float:
+        """Share of lookups served from the cache since metrics were reset."""
+        hits = metrics.counter(f"cache.{self.name}.hits")
+        total = hits + metrics.counter(f"cache.{self.name}.misses")
+        return round(hits / total, 4) if total else 0.0
+    
+    def get(self, key: K) -> Optional[V]:
+        """Return a live entry and mark it recently used, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > self._clock():
+                    self._entries.move_to_end(key)
+                    metrics.increment(f"cache.{self.name}.hits")
+                    return entry[1]
+                del self._entries[key]
+        metrics.increment(f"cache.{self.name}.misses")
+        return None
+    
+    def set(self, key: K, value: V, ttl: Optional[float] = None) -> None:
+        """
+        Store an entry, evicting the least recently used ones when full.
+        
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Lifetime of this entry if shorter than the cache's TTL
+        """
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        if self.max_size <= 0 or ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (self._clock() + ttl, value)
+            self._entries.move_to_end(key)
+            evicted = 0
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                evicted += 1
+        if evicted:
+            metrics.increment(f"cache.{self.name}.evictions", evicted)
+    
+    def invalidate(self, key: K) -> None:
+        """Drop an entry if present."""
+        with self._lock:
+            self._entries.pop(key, None)
+    
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+    
+    def __len__(self) -> int:
+        """Number of stored entries, including expired ones not yet dropped."""
+        return len(self._entries)
+
+
+class InvalidationChannel:
+    """
+    Redis pub/sub channel broadcasting cache invalidations between workers.
+    
+    ``publish`` sends a key to every subscribed process; ``start`` runs a
+    listener that passes received keys to the registered handlers. Each
+    (re)subscription first delivers ``"*"`` so handlers can drop entries
+    whose invalidations may have been missed while disconnected. With
+    no Redis URL (or without the ``redis`` package) the channel is a no-op
+    and each process relies on explicit local invalidation plus TTLs.
+    """
+    
+    def __init__(self, name: str, url: Optional[str]) -> None:
+        """
+        Initialize an idle channel.
+        
+        Args:
+            name: Redis channel name
+            url: Redis URL, or None to disable broadcasting
+        """
+        self.name = name
+        self.url = url if redis_asyncio is not None else None
+        self._handlers: List[Callable[[str], None]] = []
+        self._client: Optional[Any] = None
+        self._task: Optional[asyncio.Task] = None
+    
+    @property
+    def enabled(self) -> bool:
+        """Whether invalidations are broadcast."""
+        return self.url is not None
+    
+    def subscribe(self, handler: Callable[[str], None]) -> None:
+        """Call ``handler(key)`` for every invalidation received."""
+        self._handlers.append(handler)
+    
+    async def publish(self, key: str) -> None:
+        """Broadcast an invalidation; failures are logged, never raised."""
+        if not self.enabled:
+            return
+        try:
+            if self._client is None:
+                self._client = redis_asyncio.from_url(self.url)
+            await self._client.publish(self.name, key)
+        except Exception:
+            logger.exception("Could not publish invalidation on %s", self.name)
+            metrics.increment(f"cache.invalidation.{self.name}.failed")
+    
+    def start(self) -> None:
+        """Start listening on the running event loop."""
+        if self.enabled and self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._listen())
+    
+    async def stop(self) -> None:
+        """Stop listening and close the connection."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+    
+    async def _listen(self) -> None:
+        """Dispatch received keys, reconnecting after errors."""
+        while True:
+            try:
+                async with redis_asyncio.from_url(self.url) as client, client.pubsub() as pubsub:
+                    await pubsub.subscribe(self.name)
+                    self._dispatch("*")
+                    async for message in pubsub.listen():
+                        if message.get("type") != "message":
+                            continue
+                        key = message["data"]
+                        self._dispatch(key.decode() if isinstance(key, bytes) else key)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Invalidation listener on %s failed; reconnecting", self.name)
+                await asyncio.sleep(1)
+    
+    def _dispatch(self, key: str) -> None:
+        """Pass one key to every handler."""
+        for handler in self._handlers:
+            handler(key)
@@ -0,0 +1,101 @@
+"""Compression codecs for text stored at rest."""
+
+import logging
+import zlib
+from typing import Optional, Union
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+# Format marker stored as the first byte of every encoded value
+MARKER_RAW = 0x00
+MARKER_ZLIB = 0x01
+MARKER_ZSTD = 0x02
+
+CODECS = ("none", "zlib", "zstd")
+
+
+def _resolve_codec(codec: Optional[str]) -> str:
+    """Return the codec to use, falling back to zlib when zstd is unavailable."""
+    codec = (codec or settings.PRD_CONTENT_COMPRESSION).lower()
+    if codec not in CODECS:
+        raise ValueError(f"Unsupported compression codec: {codec}")
+    if codec == "zstd" and zstandard is None:
+        logger.warning("zstandard is not installed; falling back to zlib compression")
+        return "zlib"
+    return codec
+
+
+def compress_text(
+    text: str,
+    codec: Optional[str] = None,
+    level: Optional[int] = None,
+    min_size: Optional[int] = None,
+) -> bytes:
+    """
+    Encode text as bytes prefixed with a format marker.
+    
+    Values shorter than ``min_size`` bytes, or that do not shrink, are
+    stored raw so tiny documents never pay the codec overhead.
+    
+    Args:
+        text: Text to encode
+        codec: ``none``, ``zlib`` or ``zstd`` (defaults to settings)
+        level: Compression level (defaults to settings)
+        min_size: Minimum size in bytes worth compressing (defaults to settings)
+        
+    Returns:
+        Marker byte followed by the (possibly compressed) UTF-8 payload
+    """
+    raw = text.encode("utf-8")
+    codec = _resolve_codec(codec)
+    level = settings.PRD_COMPRESSION_LEVEL if level is None else level
+    min_size = settings.PRD_COMPRESSION_MIN_BYTES if min_size is None else min_size
+    
+    if codec != "none" and len(raw) >= min_size:
+        if codec == "zstd":
+            compressed = bytes([MARKER_ZSTD]) + zstandard.ZstdCompressor(level=level).compress(raw)
+        else:
+            compressed = bytes([MARKER_ZLIB]) + zlib.compress(raw, min(level, 9))
+        if len(compressed) < len(raw) + 1:
+            return compressed
+    return bytes([MARKER_RAW]) + raw
+
+
+def decompress_text(data: Union[bytes, memoryview, str, None]) -> Optional[str]:
+    """
+    Decode a value produced by :func:`compress_text`.
+    
+    Plain strings (rows written before compression was enabled) are
+    returned unchanged.
+    
+    Args:
+        data: Encoded value
+        
+    Returns:
+        Decoded text
+        
+    Raises:
+        ValueError: If the format marker is unknown
+    """
+    if data is None or isinstance(data, str):
+        return data
+    data = bytes(data)
+    if not data:
+        return ""
+    marker, payload = data[0], data[1:]
+    if marker == MARKER_RAW:
+        return payload.decode("utf-8")
+    if marker == MARKER_ZLIB:
+        return zlib.decompress(payload).decode("utf-8")
+    if marker == MARKER_ZSTD:
+        if zstandard is None:
+            raise ValueError("zstd-compressed value found but zstandard is not installed")
+        return zstandard.ZstdDecompressor().decompress(payload).decode("utf-8")
+    raise ValueError(f"Unknown compression marker: {marker:#04x}")
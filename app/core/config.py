@@ -22,6 +22,116 @@ class Settings(BaseSettings):
     POSTGRES_PASSWORD: str = "postgres"
     POSTGRES_DB: str = "prd_generator"
     SQLALCHEMY_DATABASE_URI: Optional[str] = None
+    # Optional explicit async URI; derived from SQLALCHEMY_DATABASE_URI when unset
+    ASYNC_SQLALCHEMY_DATABASE_URI: Optional[str] = None
+    # Optional comma-separated read replica URIs for replica-safe reads
+    READ_REPLICA_URIS: Optional[str] = None
+    
+    # Connection Pool Settings
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE: int = 1800  # seconds; -1 disables recycling
+    DB_POOL_TIMEOUT: int = 30  # seconds to wait for a free connection
+    
+    # SQLite Settings (applied to every new connection)
+    SQLITE_WAL: bool = True
+    SQLITE_SYNCHRONOUS: str = "NORMAL"
+    SQLITE_MMAP_SIZE: int = 256 * 1024 * 1024  # bytes
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+    
+    # PRD Content Storage
+    PRD_CONTENT_COMPRESSION: str = "none"  # Options: none, zlib, zstd
+    PRD_COMPRESSION_LEVEL: int = 6
+    PRD_COMPRESSION_MIN_BYTES: int = 256
+    
+    # Write-behind persistence for generated PRDs (group commit)
+    PRD_WRITE_BEHIND: bool = False
+    PRD_WRITE_BATCH_SIZE: int = 100
+    PRD_WRITE_FLUSH_INTERVAL_MS: int = 50
+    PRD_WRITE_QUEUE_SIZE: int = 10000
+    # Rows failing with transient errors are retried with exponential backoff;
+    # rows failing permanently are appended to the dead-letter file (NDJSON,
+    # accepted by /prd/import)
+    PRD_WRITE_RETRY_BASE_MS: int = 200
+    PRD_WRITE_RETRY_MAX_MS: int = 30000
+    PRD_WRITE_DEAD_LETTER_PATH: str = "prd_write_dead_letter.ndjson"
+    
+    # Purge of soft-deleted PRDs
+    PRD_PURGE_ENABLED: bool = False
+    PRD_PURGE_RETENTION_DAYS: int = 7
+    PRD_PURGE_BATCH_SIZE: int = 200
+    PRD_PURGE_BATCH_PAUSE_MS: int = 200
+    PRD_PURGE_INTERVAL_SECONDS: int = 900
+    PRD_PURGE_WINDOW: str = ""  # UTC hours "start-end", e.g. "1-5"; empty = any time
+    
+    # Monthly partitioning of the PRD table (Postgres only, applied by migration)
+    PRD_PARTITIONING: bool = False
+    PRD_PARTITION_MONTHS_AHEAD: int = 3
+    
+    # Rows fetched per round trip while streaming exports
+    PRD_EXPORT_BATCH_SIZE: int = 200
+    
+    # Bulk imports: PRDs per transaction, largest accepted item, errors listed
+    PRD_IMPORT_BATCH_SIZE: int = 500
+    PRD_IMPORT_MAX_ITEM_BYTES: int = 5_000_000
+    PRD_IMPORT_MAX_ERRORS: int = 1000
+    
+    # Revision history: every Nth revision is stored in full, the rest as deltas
+    PRD_REVISION_CHECKPOINT_INTERVAL: int = 10
+    
+    # HTTP response compression (brotli/zstd are used only when installed)
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_ENCODINGS: str = "zstd,br,gzip"  # server preference order
+    COMPRESSION_MIN_SIZE: int = 1024
+    COMPRESSION_THREAD_MIN_SIZE: int = 65536  # compress off the event loop from here
+    COMPRESSION_SKIP_PATHS: str = "/api/v1/prd/export"  # comma-separated path prefixes
+    
+    # Serialize responses with orjson and list pages straight from rows
+    FAST_JSON_RESPONSES: bool = False
+    
+    # bcrypt runs in a bounded thread pool; calls beyond workers + queue get 429
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_QUEUE_LIMIT: int = 16
+    
+    # Password hash scheme and cost ("bcrypt", or "argon2" with argon2-cffi);
+    # hashes made with other settings are upgraded at the next login.
+    # Tune with "python -m app.manage calibrate-hash".
+    PASSWORD_HASH_SCHEME: str = "bcrypt"
+    PASSWORD_BCRYPT_ROUNDS: int = 12
+    PASSWORD_ARGON2_TIME_COST: int = 3
+    PASSWORD_ARGON2_MEMORY_KIB: int = 65536
+    PASSWORD_ARGON2_PARALLELISM: int = 2
+    
+    # Sample event-loop lag (scheduling delay) into the metrics endpoint
+    EVENT_LOOP_LAG_MONITOR: bool = True
+    EVENT_LOOP_LAG_INTERVAL_MS: int = 250
+    
+    # Optional Redis, used to broadcast cache invalidations between workers
+    REDIS_URL: Optional[str] = None
+    
+    # Authenticated users cached by id (0 disables), trusted for the TTL
+    PRINCIPAL_CACHE_MAX_SIZE: int = 10000
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 60
+    PRINCIPAL_CACHE_CHANNEL: str = "prdgen:principal-invalidate"
+    
+    # Verified JWT payloads cached by token digest, never beyond their exp
+    TOKEN_CACHE_MAX_SIZE: int = 10000
+    TOKEN_CACHE_TTL_SECONDS: int = 300
+    
+    # Token-bucket rate limits ("<count>/<second|minute|hour|day>", empty or 0
+    # disables); buckets are per route. Backend: "memory" or "redis" (REDIS_URL)
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_BACKEND: str = "memory"
+    RATE_LIMIT_MAX_KEYS: int = 100000  # memory backend only
+    RATE_LIMIT_GENERATE_PER_USER: str = "10/minute"
+    RATE_LIMIT_GENERATE_PER_IP: str = "30/minute"
+    RATE_LIMIT_READ_PER_USER: str = "600/minute"
+    RATE_LIMIT_READ_PER_IP: str = "1200/minute"
+    
+    # API keys: secrets are stored as HMAC-SHA256 under this key (defaults to
+    # SECRET_KEY); last-used times are written in batches every N seconds
+    API_KEY_HMAC_KEY: Optional[str] = None
+    API_KEY_USAGE_FLUSH_SECONDS: int = 60
 
     def _build_db_connection(self) -> str:
         """Build SQLAlchemy connection string."""
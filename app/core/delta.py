@@ -0,0 +1,60 @@
+"""Line-based deltas for storing document revisions compactly."""
+
+import difflib
+import json
+from typing import List, Union
+
+# A delta is a list of segments: ``[start, end]`` copies those lines of the
+# base text, a string is inserted literally
+Segment = Union[List[int], str]
+
+
+def make_delta(base: str, target: str) -> str:
+    """
+    Encode ``target`` as edits against ``base``.
+    
+    Unchanged runs of lines become ``[start, end]`` references into
+    ``base``; everything else is stored literally.
+    
+    Args:
+        base: Text the delta is applied to
+        target: Text the delta reproduces
+        
+    Returns:
+        Compact JSON encoding of the delta
+    """
+    base_lines = base.splitlines(keepends=True)
+    target_lines = target.splitlines(keepends=True)
+    matcher = difflib.SequenceMatcher(None, base_lines, target_lines, autojunk=False)
+    segments: List[Segment] = []
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            segments.append([i1, i2])
+        elif j2 > j1:
+            literal = "".join(target_lines[j1:j2])
+            if segments and isinstance(segments[-1], str):
+                segments[-1] += literal
+            else:
+                segments.append(literal)
+    return json.dumps(segments, ensure_ascii=False, separators=(",", ":"))
+
+
+def apply_delta(base: str, delta: str) -> str:
+    """
+    Rebuild the target text of a delta from its base.
+    
+    Args:
+        base: Text the delta was made against
+        delta: Output of :func:`make_delta`
+        
+    Returns:
+        Target text
+    """
+    base_lines = base.splitlines(keepends=True)
+    parts = []
+    for segment in json.loads(delta):
+        if isinstance(segment, str):
+            parts.append(segment)
+        else:
+            parts.extend(base_lines[segment[0]:segment[1]])
+    return "".join(parts)
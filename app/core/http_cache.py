@@ -0,0 +1,89 @@
+"""Validators for conditional GET requests (ETag / Last-Modified)."""
+
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Iterable, Optional, Tuple
+
+from fastapi import Request
+
+
+def make_etag(content_hash: str, updated_at: datetime) -> str:
+    """
+    Build a strong ETag for one stored document.
+    
+    The content hash changes with the body and ``updated_at`` with every
+    other field, so together they identify the representation.
+    
+    Args:
+        content_hash: SHA-256 of the content
+        updated_at: Last modification time
+        
+    Returns:
+        Quoted entity tag
+    """
+    micros = int(updated_at.replace(tzinfo=timezone.utc).timestamp() * 1_000_000)
+    return f'"{content_hash[:32]}-{micros:x}"'
+
+
+def make_list_etag(items: Iterable[Tuple[object, str, datetime]]) -> str:
+    """
+    Build a strong ETag for an ordered page of documents.
+    
+    Args:
+        items: ``(id, content_hash, updated_at)`` for every item on the page
+        
+    Returns:
+        Quoted entity tag that changes when any item, or the page
+        membership or order, changes
+    """
+    digest = hashlib.sha256()
+    for item_id, content_hash, updated_at in items:
+        digest.update(f"{item_id}:{make_etag(content_hash, updated_at)};".encode())
+    return f'"{digest.hexdigest()[:40]}"'
+
+
+def http_date(moment: datetime) -> str:
+    """Format a naive UTC datetime as an HTTP date."""
+    return format_datetime(moment.replace(tzinfo=timezone.utc, microsecond=0), usegmt=True)
+
+
+def _parse_http_date(value: str) -> Optional[datetime]:
+    """Parse an HTTP date into a naive UTC datetime, or None if malformed."""
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def is_not_modified(request: Request, etag: str, last_modified: Optional[datetime] = None) -> bool:
+    """
+    Evaluate ``If-None-Match`` and ``If-Modified-Since`` (RFC 9110).
+    
+    ``If-Modified-Since`` is only consulted when the request carries no
+    ``If-None-Match``.
+    
+    Args:
+        request: Incoming request
+        etag: Current entity tag
+        last_modified: Current modification time (naive UTC)
+        
+    Returns:
+        True when a 304 response may be sent
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+        # Weak comparison, as required for If-None-Match
+        candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return etag in candidates
+    
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None or last_modified is None:
+        return False
+    since = _parse_http_date(if_modified_since)
+    return since is not None and last_modified.replace(microsecond=0) <= since
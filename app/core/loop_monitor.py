@@ -0,0 +1,60 @@
+"""Event-loop lag sampling."""
+
+import asyncio
+from typing import Optional
+
+from app.core.config import settings
+from app.core.metrics import metrics
+
+
+class EventLoopLagMonitor:
+    """
+    Measures how late the event loop wakes a sleeping task.
+    
+    Every ``interval`` seconds the monitor sleeps and records how much
+    longer than requested the wake-up took. Any blocking work on the loop
+    (e.g. CPU-heavy code in an ``async def``) shows up directly as lag.
+    Samples go to the ``event_loop.lag`` timing; the latest one is also
+    exposed as the ``event_loop.lag_ms`` gauge.
+    """
+    
+    def __init__(self, interval: Optional[float] = None) -> None:
+        """
+        Initialize an idle monitor.
+        
+        Args:
+            interval: Seconds between samples
+        """
+        self.interval = interval or settings.EVENT_LOOP_LAG_INTERVAL_MS / 1000
+        self.last_lag = 0.0
+        self._task: Optional[asyncio.Task] = None
+    
+    def start(self) -> None:
+        """Start sampling on the running event loop."""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+            metrics.gauge("event_loop.lag_ms", lambda: round(self.last_lag * 1000, 3))
+    
+    async def stop(self) -> None:
+        """Stop sampling."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+    
+    async def _run(self) -> None:
+        """Record the wake-up delay of each sleep."""
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            self.last_lag = max(0.0, loop.time() - expected)
+            metrics.observe("event_loop.lag", self.last_lag)
+
+
+# Process-wide monitor, started by the application when EVENT_LOOP_LAG_MONITOR is set
+loop_monitor = EventLoopLagMonitor()
@@ -0,0 +1,104 @@
+"""In-process metrics registry for runtime instrumentation."""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, Union
+
+Number = Union[int, float]
+
+
+class TimingStat:
+    """Running count, total and maximum of observed durations (seconds)."""
+    
+    def __init__(self) -> None:
+        """Initialize an empty timing statistic."""
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+    
+    def observe(self, seconds: float) -> None:
+        """Record a single duration."""
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+    
+    def snapshot(self) -> Dict[str, Number]:
+        """Return the statistic as a JSON-friendly dictionary (milliseconds)."""
+        return {
+            "count": self.count,
+            "total_ms": round(self.total * 1000, 3),
+            "avg_ms": round(self.total * 1000 / self.count, 3) if self.count else 0.0,
+            "max_ms": round(self.max * 1000, 3),
+        }
+
+
+class MetricsRegistry:
+    """
+    Registry of counters, timings and gauges.
+    
+    Counters and timings are updated in place; gauges are callables
+    evaluated lazily whenever a snapshot is taken.
+    """
+    
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Number] = {}
+        self._timings: Dict[str, TimingStat] = {}
+        self._gauges: Dict[str, Callable[[], Number]] = {}
+    
+    def increment(self, name: str, value: Number = 1) -> None:
+        """Increase a counter by ``value``."""
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+    
+    def counter(self, name: str) -> Number:
+        """Return the current value of a counter (0 if never incremented)."""
+        with self._lock:
+            return self._counters.get(name, 0)
+    
+    def observe(self, name: str, seconds: float) -> None:
+        """Record a duration for a timing statistic."""
+        with self._lock:
+            stat = self._timings.get(name)
+            if stat is None:
+                stat = self._timings[name] = TimingStat()
+            stat.observe(seconds)
+    
+    @contextmanager
+    def timer(self, name: str) -> Iterator[None]:
+        """Context manager recording the duration of the wrapped block."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start)
+    
+    def gauge(self, name: str, func: Callable[[], Number]) -> None:
+        """Register a gauge callback evaluated at snapshot time."""
+        with self._lock:
+            self._gauges[name] = func
+    
+    def snapshot(self) -> Dict[str, Dict]:
+        """Return all metrics as a JSON-friendly dictionary."""
+        with self._lock:
+            counters = dict(self._counters)
+            timings = {name: stat.snapshot() for name, stat in self._timings.items()}
+            gauges = dict(self._gauges)
+        return {
+            "counters": counters,
+            "timings": timings,
+            "gauges": {name: func() for name, func in gauges.items()},
+        }
+    
+    def reset(self) -> None:
+        """Clear counters and timings (gauges stay registered)."""
+        with self._lock:
+            self._counters.clear()
+            self._timings.clear()
+
+
+# Global registry instance
+metrics = MetricsRegistry()
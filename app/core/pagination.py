@@ -0,0 +1,43 @@
+"""Opaque cursor helpers for keyset pagination."""
+
+import base64
+import json
+import uuid
+from datetime import datetime
+from typing import Tuple
+
+
+def encode_cursor(created_at: datetime, item_id: uuid.UUID) -> str:
+    """
+    Encode a ``(created_at, id)`` position as an opaque cursor string.
+    
+    Args:
+        created_at: Creation timestamp of the last item on the page
+        item_id: ID of the last item on the page
+        
+    Returns:
+        URL-safe cursor string
+    """
+    raw = json.dumps([created_at.isoformat(), str(item_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, uuid.UUID]:
+    """
+    Decode a cursor produced by :func:`encode_cursor`.
+    
+    Args:
+        cursor: Opaque cursor string
+        
+    Returns:
+        Tuple of ``(created_at, id)``
+        
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, item_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(created_at), uuid.UUID(item_id)
+    except (TypeError, ValueError, UnicodeDecodeError) as e:
+        raise ValueError("Invalid pagination cursor") from e
@@ -0,0 +1,338 @@
+"""Token-bucket rate limiting with in-memory and Redis backends."""
+
+import logging
+import math
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.metrics import metrics
+
+try:
+    from redis import asyncio as redis_asyncio
+except ImportError:  # pragma: no cover - optional dependency
+    redis_asyncio = None
+
+logger = logging.getLogger(__name__)
+
+_PERIODS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
+
+# Key under ``request.state`` holding the headers of the request's decision
+STATE_KEY = "rate_limit_headers"
+
+
+class Limit(NamedTuple):
+    """Bucket capacity and the period over which it refills completely."""
+    
+    capacity: int
+    period: float
+    
+    @property
+    def rate(self) -> float:
+        """Tokens added per second."""
+        return self.capacity / self.period
+    
+    @classmethod
+    def parse(cls, spec: str) -> Optional["Limit"]:
+        """
+        Parse ``"<count>/<period>"``, e.g. ``"10/minute"``.
+        
+        Args:
+            spec: Limit string; empty or ``"0"`` means unlimited
+            
+        Returns:
+            Parsed limit, or None when unlimited
+        """
+        count, _, period = spec.strip().partition("/")
+        if not count or int(count) <= 0:
+            return None
+        seconds = _PERIODS.get(period.strip().lower() or "second")
+        if seconds is None:
+            raise ValueError(f"Invalid rate limit: {spec!r}")
+        return cls(int(count), float(seconds))
+
+
+class Decision(NamedTuple):
+    """Outcome of taking a token from one bucket."""
+    
+    allowed: bool
+    limit: Limit
+    tokens: float
+    
+    @property
+    def remaining(self) -> int:
+        """Whole requests left right now."""
+        return int(self.tokens)
+    
+    @property
+    def reset(self) -> int:
+        """Seconds until the bucket is full again."""
+        return math.ceil((self.limit.capacity - self.tokens) / self.limit.rate)
+    
+    @property
+    def retry_after(self) -> int:
+        """Seconds until the next request would be allowed."""
+        return max(1, math.ceil((1 - self.tokens) / self.limit.rate)) if not self.allowed else 0
+    
+    def headers(self) -> Dict[str, str]:
+        """``RateLimit-*`` response headers (IETF draft) for this decision."""
+        headers = {
+            "RateLimit-Limit": str(self.limit.capacity),
+            "RateLimit-Remaining": str(self.remaining),
+            "RateLimit-Reset": str(self.reset),
+            "RateLimit-Policy": f"{self.limit.capacity};w={int(self.limit.period)}",
+        }
+        if not self.allowed:
+            headers["Retry-After"] = str(self.retry_after)
+        return headers
+
+
+class MemoryBackend:
+    """
+    Token buckets held in this process.
+    
+    Suitable for a single worker. At most ``max_keys`` buckets are kept;
+    the least recently used are dropped first, which only ever refills a
+    bucket early.
+    """
+    
+    def __init__(self, max_keys: Optional[int] = None) -> None:
+        """Initialize with no buckets."""
+        self.max_keys = max_keys or settings.RATE_LIMIT_MAX_KEYS
+        self._lock = threading.Lock()
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+    
+    async def take(self, key: str, limit: Limit, now: Optional[float] = None) -> Decision:
+        """Refill a bucket for the elapsed time and take one token if available."""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            tokens, updated = self._buckets.pop(key, (limit.capacity, now))
+            tokens = min(limit.capacity, tokens + max(0.0, now - updated) * limit.rate)
+            allowed = tokens >= 1
+            if allowed:
+                tokens -= 1
+            self._buckets[key] = (tokens, now)
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        return Decision(allowed, limit, tokens)
+    
+    async def refund(self, key: str, limit: Limit) -> None:
+        """Give back a token taken for a request that was denied elsewhere."""
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is not None:
+                self._buckets[key] = (min(limit.capacity, bucket[0] + 1), bucket[1])
+    
+    def reset(self) -> None:
+        """Forget every bucket."""
+        with self._lock:
+            self._buckets.clear()
+
+
+# Refill and take one token atomically, using the Redis server clock so all
+# workers agree. Returns {allowed, tokens as a string (floats are truncated)}.
+TAKE_SCRIPT = """
+redis.replicate_commands()
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local updated = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - updated) * rate)
+local allowed = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil((capacity - tokens) / rate * 1000) + 1000)
+return {allowed, tostring(tokens)}
+"""
+
+# Give one token back (capped at capacity) if the bucket still exists
+REFUND_SCRIPT = """
+local tokens = tonumber(redis.call('HGET', KEYS[1], 'tokens'))
+if tokens then
+    redis.call('HSET', KEYS[1], 'tokens', tostring(math.min(tonumber(ARGV[1]), tokens + 1)))
+end
+return 1
+"""
+
+
+class RedisBackend:
+    """
+    Token buckets shared by all workers through Redis.
+    
+    Each take is one round trip running ``TAKE_SCRIPT``; buckets expire
+    once they would be full again. If Redis is unreachable requests are
+    allowed (and ``rate_limit.backend_errors`` is counted), so an outage
+    of the limiter never takes the API down with it.
+    """
+    
+    def __init__(self, url: str, prefix: str = "prdgen:rl:") -> None:
+        """
+        Initialize the backend; connects on first use.
+        
+        Args:
+            url: Redis URL
+            prefix: Namespace for bucket keys
+        """
+        if redis_asyncio is None:
+            raise RuntimeError("The redis rate-limit backend needs the redis package")
+        self.prefix = prefix
+        self._client = redis_asyncio.from_url(url)
+        self._script = self._client.register_script(TAKE_SCRIPT)
+        self._refund_script = self._client.register_script(REFUND_SCRIPT)
+    
+    async def take(self, key: str, limit: Limit) -> Decision:
+        """Take one token from a shared bucket."""
+        try:
+            allowed, tokens = await self._script(
+                keys=[self.prefix + key], args=[limit.capacity, limit.rate]
+            )
+        except Exception:
+            logger.exception("Rate-limit backend unavailable; allowing request")
+            metrics.increment("rate_limit.backend_errors")
+            return Decision(True, limit, float(limit.capacity))
+        return Decision(bool(allowed), limit, float(tokens))
+    
+    async def refund(self, key: str, limit: Limit) -> None:
+        """Give back a token taken for a request that was denied elsewhere."""
+        try:
+            await self._refund_script(keys=[self.prefix + key], args=[limit.capacity])
+        except Exception:
+            logger.exception("Rate-limit backend unavailable; token not refunded")
+            metrics.increment("rate_limit.backend_errors")
+    
+    def reset(self) -> None:
+        """Buckets in Redis expire on their own."""
+
+
+class RateLimiter:
+    """
+    Applies the configured budgets to a request.
+    
+    Each budget (e.g. ``generate`` or ``read``) has a per-user and a
+    per-IP limit, read from ``RATE_LIMIT_<BUDGET>_PER_USER`` and
+    ``RATE_LIMIT_<BUDGET>_PER_IP``. Buckets are kept per route, so a
+    flood of one endpoint does not use up the budget of another.
+    """
+    
+    def __init__(self, backend=None) -> None:
+        """
+        Initialize the limiter.
+        
+        Args:
+            backend: Bucket store (defaults to the one selected in settings)
+        """
+        self._backend = backend
+    
+    @property
+    def backend(self):
+        """Bucket store, created from settings on first use."""
+        if self._backend is None:
+            if settings.RATE_LIMIT_BACKEND == "redis" and settings.REDIS_URL:
+                self._backend = RedisBackend(settings.REDIS_URL)
+            else:
+                self._backend = MemoryBackend()
+        return self._backend
+    
+    @staticmethod
+    def limits(budget: str) -> Tuple[Optional[Limit], Optional[Limit]]:
+        """Return the (per-user, per-IP) limits of a budget."""
+        prefix = f"RATE_LIMIT_{budget.upper()}"
+        return (
+            Limit.parse(getattr(settings, f"{prefix}_PER_USER")),
+            Limit.parse(getattr(settings, f"{prefix}_PER_IP")),
+        )
+    
+    async def check(
+        self, budget: str, route: str, user_id: Optional[str], client_ip: Optional[str]
+    ) -> Optional[Decision]:
+        """
+        Take a token from every bucket that applies to a request.
+        
+        Buckets are tried in turn. The first denial stops the check and the
+        tokens already taken are refunded, so a rejected request costs
+        nothing: a client spinning on 429s cannot drain the IP bucket it
+        shares with others behind the same NAT.
+        
+        Args:
+            budget: Budget name
+            route: Route path template
+            user_id: Authenticated user, if any
+            client_ip: Client address, if known
+            
+        Returns:
+            The most restrictive decision (a denial if any bucket is
+            empty), or None when no limit applies
+        """
+        if not settings.RATE_LIMIT_ENABLED:
+            return None
+        user_limit, ip_limit = self.limits(budget)
+        buckets = []
+        if user_limit is not None and user_id is not None:
+            buckets.append((f"{budget}:{route}:u:{user_id}", user_limit))
+        if ip_limit is not None and client_ip is not None:
+            buckets.append((f"{budget}:{route}:ip:{client_ip}", ip_limit))
+        decisions: List[Decision] = []
+        for index, (key, limit) in enumerate(buckets):
+            decisions.append(await self.backend.take(key, limit))
+            if not decisions[-1].allowed:
+                for taken_key, taken_limit in buckets[:index]:
+                    await self.backend.refund(taken_key, taken_limit)
+                break
+        if not decisions:
+            return None
+        decision = min(decisions, key=lambda d: (d.allowed, d.remaining))
+        if not decision.allowed:
+            metrics.increment(f"rate_limit.{budget}.rejected")
+        return decision
+    
+    def reset(self) -> None:
+        """Forget local bucket state (tests, settings reloads)."""
+        if self._backend is not None:
+            self._backend.reset()
+
+
+class RateLimitHeadersMiddleware:
+    """
+    Adds the ``RateLimit-*`` headers of a request's decision to its response.
+    
+    The limiter dependency stores the headers in ``request.state``; doing
+    the final step here covers responses returned directly by endpoints
+    (304s, fast JSON, streams), which bypass the injected ``Response``.
+    """
+    
+    def __init__(self, app: ASGIApp) -> None:
+        """Wrap ``app``."""
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Inject stored headers into ``http.response.start``."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                stored = scope.get("state", {}).get(STATE_KEY)
+                if stored:
+                    headers = MutableHeaders(scope=message)
+                    for name, value in stored.items():
+                        if name not in headers:
+                            headers[name] = value
+            await send(message)
+        
+        await self.app(scope, receive, send_with_headers)
+
+
+# Process-wide limiter used by the ``rate_limit`` API dependency
+rate_limiter = RateLimiter()
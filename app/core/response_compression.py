@@ -0,0 +1,245 @@
+"""ASGI middleware compressing responses with gzip, brotli or zstd."""
+
+import gzip
+import time
+from typing import Callable, Dict, List, Optional, Sequence
+
+import anyio
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.metrics import metrics
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+# Media types worth compressing (text/* always is)
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/javascript",
+    "application/x-ndjson",
+    "application/xml",
+    "image/svg+xml",
+)
+
+# Content-Encoding name -> compress(data, level)
+CODECS: Dict[str, Callable[[bytes, int], bytes]] = {
+    "gzip": lambda data, level: gzip.compress(data, compresslevel=level, mtime=0),
+}
+if brotli is not None:
+    CODECS["br"] = lambda data, level: brotli.compress(data, quality=level)
+if zstandard is not None:
+    CODECS["zstd"] = lambda data, level: zstandard.ZstdCompressor(level=level).compress(data)
+
+DEFAULT_LEVELS = {"gzip": 6, "br": 5, "zstd": 3}
+
+
+def parse_accept_encoding(header: str) -> Dict[str, float]:
+    """
+    Parse an ``Accept-Encoding`` header into coding -> q-value.
+    
+    Args:
+        header: Raw header value
+        
+    Returns:
+        Mapping of lower-cased codings (including ``*``) to their weights
+    """
+    accepted: Dict[str, float] = {}
+    for part in header.split(","):
+        coding, _, params = part.strip().partition(";")
+        if not coding:
+            continue
+        weight = 1.0
+        name, _, value = params.strip().partition("=")
+        if name.strip().lower() == "q":
+            try:
+                weight = float(value)
+            except ValueError:
+                weight = 0.0
+        accepted[coding.strip().lower()] = weight
+    return accepted
+
+
+def choose_encoding(header: str, preferred: Sequence[str]) -> Optional[str]:
+    """
+    Pick the best available encoding the client accepts.
+    
+    Args:
+        header: ``Accept-Encoding`` value
+        preferred: Encodings in server preference order
+        
+    Returns:
+        Encoding name, or None to send the body uncompressed
+    """
+    accepted = parse_accept_encoding(header)
+    best, best_weight = None, 0.0
+    for coding in preferred:
+        if coding not in CODECS:
+            continue
+        weight = accepted.get(coding, accepted.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = coding, weight
+    return best
+
+
+def _split(value: str) -> List[str]:
+    """Split a comma-separated setting into trimmed, non-empty items."""
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def _is_compressible(headers: Headers) -> bool:
+    """Whether a response's media type benefits from compression."""
+    media_type = headers.get("content-type", "").split(";")[0].strip().lower()
+    if media_type == "text/event-stream":
+        return False
+    return (
+        media_type.startswith("text/")
+        or media_type in COMPRESSIBLE_TYPES
+        or media_type.endswith("+json")
+    )
+
+
+def _match_etag_form(headers: MutableHeaders, if_none_match: str) -> None:
+    """
+    Give a 304's ETag the form its 200 carried.
+    
+    A compressed 200 carries the weakened tag, so the 304 does too, unless
+    the client revalidates with the strong tag (its 200 was too small to
+    compress).
+    """
+    etag = headers.get("etag")
+    if not etag or etag.startswith("W/"):
+        return
+    if etag not in {tag.strip() for tag in if_none_match.split(",")}:
+        headers["ETag"] = f"W/{etag}"
+
+
+def _compress(encoding: str, level: int, body: bytes) -> bytes:
+    """Compress ``body`` and record the CPU time and byte counts."""
+    start = time.thread_time()
+    compressed = CODECS[encoding](body, level)
+    metrics.observe(f"http.compression.{encoding}.cpu", time.thread_time() - start)
+    metrics.increment("http.compression.bytes_in", len(body))
+    metrics.increment("http.compression.bytes_out", len(compressed))
+    metrics.increment(f"http.compression.{encoding}.responses")
+    return compressed
+
+
+def compression_ratio() -> float:
+    """Return uncompressed / compressed bytes over all compressed responses."""
+    written = metrics.counter("http.compression.bytes_out")
+    return round(metrics.counter("http.compression.bytes_in") / written, 3) if written else 0.0
+
+
+class CompressionMiddleware:
+    """
+    Compress complete response bodies for clients that accept it.
+    
+    The encoding is negotiated from ``Accept-Encoding`` in the configured
+    preference order; brotli and zstd are offered only when their modules
+    are installed. Bodies under ``min_size`` bytes, non-text media types,
+    already encoded responses and paths under ``skip_paths`` pass through
+    untouched, as does any response sent in more than one body message
+    (streaming and server-sent events). Bodies of at least
+    ``thread_min_size`` bytes are compressed in a worker thread.
+    """
+    
+    def __init__(
+        self,
+        app: ASGIApp,
+        min_size: Optional[int] = None,
+        thread_min_size: Optional[int] = None,
+        encodings: Optional[Sequence[str]] = None,
+        skip_paths: Optional[Sequence[str]] = None,
+        levels: Optional[Dict[str, int]] = None,
+    ) -> None:
+        """
+        Wrap ``app``; unspecified options come from settings.
+        
+        Args:
+            app: ASGI application
+            min_size: Smallest body worth compressing, in bytes
+            thread_min_size: Smallest body compressed off the event loop
+            encodings: Encodings in preference order
+            skip_paths: Path prefixes never compressed
+            levels: Compression level per encoding
+        """
+        self.app = app
+        self.min_size = settings.COMPRESSION_MIN_SIZE if min_size is None else min_size
+        self.thread_min_size = (
+            settings.COMPRESSION_THREAD_MIN_SIZE if thread_min_size is None else thread_min_size
+        )
+        self.encodings = list(encodings or _split(settings.COMPRESSION_ENCODINGS))
+        self.skip_paths = tuple(
+            _split(settings.COMPRESSION_SKIP_PATHS) if skip_paths is None else skip_paths
+        )
+        self.levels = {**DEFAULT_LEVELS, **(levels or {})}
+        metrics.gauge("http.compression.ratio", compression_ratio)
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle one ASGI request."""
+        if scope["type"] != "http" or scope["path"].startswith(self.skip_paths):
+            await self.app(scope, receive, send)
+            return
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""), self.encodings)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        
+        if_none_match = Headers(scope=scope).get("if-none-match", "")
+        start_message: Optional[Message] = None
+        passthrough = False
+        
+        async def send_compressed(message: Message) -> None:
+            nonlocal start_message, passthrough
+            if passthrough:
+                await send(message)
+                return
+            if message["type"] == "http.response.start":
+                if message["status"] == 304:
+                    _match_etag_form(MutableHeaders(raw=message["headers"]), if_none_match)
+                    passthrough = True
+                    await send(message)
+                    return
+                start_message = message
+                return
+            
+            body = message.get("body", b"")
+            headers = MutableHeaders(raw=start_message["headers"])
+            if (
+                message.get("more_body", False)
+                or len(body) < self.min_size
+                or "content-encoding" in headers
+                or not _is_compressible(headers)
+            ):
+                passthrough = True
+                await send(start_message)
+                await send(message)
+                return
+            
+            if len(body) >= self.thread_min_size:
+                compressed = await anyio.to_thread.run_sync(
+                    _compress, encoding, self.levels[encoding], body
+                )
+            else:
+                compressed = _compress(encoding, self.levels[encoding], body)
+            
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(compressed))
+            headers.add_vary_header("Accept-Encoding")
+            etag = headers.get("etag")
+            if etag and not etag.startswith("W/"):
+                # The encoded bytes differ, so the tag can no longer be strong
+                headers["ETag"] = f"W/{etag}"
+            await send(start_message)
+            await send({"type": "http.response.body", "body": compressed})
+        
+        await self.app(scope, receive, send_compressed)
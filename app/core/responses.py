@@ -0,0 +1,84 @@
+"""Fast JSON response helpers (opt-in via FAST_JSON_RESPONSES)."""
+
+import logging
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Type
+
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import Row
+from typing_extensions import TypedDict
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def default_response_class() -> Type[JSONResponse]:
+    """
+    Return the response class for endpoints without an explicit one.
+    
+    ``ORJSONResponse`` when FAST_JSON_RESPONSES is set and orjson is
+    installed, otherwise FastAPI's standard ``JSONResponse``.
+    """
+    if not settings.FAST_JSON_RESPONSES:
+        return JSONResponse
+    if orjson is None:
+        logger.warning("orjson is not installed; using the standard JSON encoder")
+        return JSONResponse
+    return ORJSONResponse
+
+
+class RowSerializer:
+    """
+    Precompiled JSON serializer for lists of a response model's rows.
+    
+    The model's fields become a ``TypedDict`` wrapped in a ``TypeAdapter``
+    once, at import time. Rows are serialized from plain dicts inside
+    pydantic-core without validating them into model instances, so a page
+    goes from database row to JSON bytes in a single pass. Only the
+    model's fields are written; extra columns are dropped.
+    """
+    
+    def __init__(self, model: Type[BaseModel]) -> None:
+        """
+        Compile the serializer.
+        
+        Args:
+            model: Response model whose fields (and order) define the output
+        """
+        self.fields = tuple(model.model_fields)
+        row_type = TypedDict(
+            f"{model.__name__}Row",
+            {name: field.annotation for name, field in model.model_fields.items()},
+        )
+        self.adapter = TypeAdapter(List[row_type])
+    
+    def _as_dict(self, item: Any) -> Dict[str, Any]:
+        """Return a row, mapping or object as a dict keyed by field name."""
+        if isinstance(item, Row):
+            return dict(zip(item._fields, item))
+        if isinstance(item, Mapping):
+            return dict(item)
+        return {name: getattr(item, name) for name in self.fields}
+    
+    def dump_json(self, items: Iterable[Any]) -> bytes:
+        """Serialize rows (or ORM objects) to a JSON array."""
+        return self.adapter.dump_json([self._as_dict(item) for item in items])
+    
+    def response(self, items: Iterable[Any], headers: Optional[Mapping[str, str]] = None) -> Response:
+        """
+        Build a JSON response for ``items``.
+        
+        Args:
+            items: Rows to serialize
+            headers: Headers to send (e.g. those set on the injected response)
+            
+        Returns:
+            Response with the encoded body
+        """
+        return Response(content=self.dump_json(items), media_type="application/json", headers=headers)
@@ -1,15 +1,66 @@
 """Security utilities for authentication and authorization."""
 
+import asyncio
+import hashlib
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Any, Optional, Union
+from types import MappingProxyType
+from typing import Any, Callable, List, Mapping, Optional, Tuple, TypeVar, Union
 
-from jose import jwt
+from jose import JWTError, jwt
 from passlib.context import CryptContext
 
+from app.core.cache import TTLCache
 from app.core.config import settings
+from app.core.metrics import metrics
+
+T = TypeVar("T")
+
+# Password hashing schemes; bcrypt is always accepted for existing hashes
+PASSWORD_SCHEMES = ("bcrypt", "argon2")
+
+def build_crypt_context(scheme: Optional[str] = None, cost: Optional[int] = None) -> CryptContext:
+    """
+    Build the password hashing context from settings.
+    
+    New hashes use PASSWORD_HASH_SCHEME at the configured cost. Hashes
+    made with another scheme or at another cost still verify, but
+    ``needs_update`` reports them so they are replaced at the next login.
+    
+    Args:
+        scheme: ``bcrypt`` or ``argon2`` (defaults to the setting)
+        cost: bcrypt rounds or argon2 time cost (defaults to the setting)
+        
+    Returns:
+        Configured CryptContext
+    """
+    scheme = scheme or settings.PASSWORD_HASH_SCHEME
+    if scheme not in PASSWORD_SCHEMES:
+        raise ValueError(f"Unsupported password hash scheme: {scheme!r}")
+    bcrypt_rounds = cost if cost is not None and scheme == "bcrypt" else settings.PASSWORD_BCRYPT_ROUNDS
+    options = {
+        "bcrypt__default_rounds": bcrypt_rounds,
+        "bcrypt__min_rounds": bcrypt_rounds,
+        "bcrypt__max_rounds": bcrypt_rounds,
+    }
+    schemes = ["bcrypt"]
+    if scheme == "argon2":
+        time_cost = cost if cost is not None else settings.PASSWORD_ARGON2_TIME_COST
+        schemes.insert(0, "argon2")
+        options.update(
+            argon2__default_rounds=time_cost,
+            argon2__min_rounds=time_cost,
+            argon2__max_rounds=time_cost,
+            argon2__memory_cost=settings.PASSWORD_ARGON2_MEMORY_KIB,
+            argon2__parallelism=settings.PASSWORD_ARGON2_PARALLELISM,
+        )
+    return CryptContext(schemes=schemes, default=scheme, deprecated="auto", **options)
 
 # Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = build_crypt_context()
 
 # JWT token utilities
 def create_access_token(
@@ -38,6 +89,41 @@ def create_access_token(
     )
     return encoded_jwt
 
+# Verified access-token payloads keyed by the SHA-256 of the token
+token_cache: TTLCache[bytes, Mapping[str, Any]] = TTLCache(
+    "token", settings.TOKEN_CACHE_MAX_SIZE, settings.TOKEN_CACHE_TTL_SECONDS
+)
+
+def decode_access_token(token: str) -> Optional[Mapping[str, Any]]:
+    """
+    Verify and decode a JWT access token, reusing earlier verifications.
+    
+    Valid tokens are cached by digest until the earlier of their ``exp``
+    and TOKEN_CACHE_TTL_SECONDS, so caching never extends a token's
+    validity. Invalid tokens are not cached.
+    
+    Args:
+        token: Encoded JWT
+        
+    Returns:
+        Read-only token claims, or None if the token is invalid or expired
+    """
+    key = hashlib.sha256(token.encode()).digest()
+    payload = token_cache.get(key)
+    if payload is not None and payload.get("exp", float("inf")) > time.time():
+        return payload
+    
+    with metrics.timer("auth.jwt.decode"):
+        try:
+            payload = MappingProxyType(
+                jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+            )
+        except JWTError:
+            return None
+    exp = payload.get("exp")
+    token_cache.set(key, payload, None if exp is None else exp - time.time())
+    return payload
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     Verify a password against a hash.
@@ -51,6 +137,20 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     return pwd_context.verify(plain_password, hashed_password)
 
+def verify_and_update_password(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """
+    Verify a password and rehash it if its hash is outdated.
+    
+    Args:
+        plain_password: Plain password to verify
+        hashed_password: Stored hash
+        
+    Returns:
+        ``(valid, new_hash)``; ``new_hash`` is set only when the password
+        is valid and the stored hash uses an old scheme or cost
+    """
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
 def get_password_hash(password: str) -> str:
     """
     Hash a password.
@@ -62,3 +162,186 @@ def get_password_hash(password: str) -> str:
         Hashed password
     """
     return pwd_context.hash(password)
+
+
+class PasswordHasherBusy(Exception):
+    """Raised when the password hashing pool has no room for another call."""
+
+
+class PasswordHashPool:
+    """
+    Bounded thread pool running bcrypt off the event loop.
+    
+    bcrypt releases the GIL while hashing, so a few threads give real
+    parallelism without blocking the loop. At most ``workers`` calls run
+    at once and ``queue_limit`` more may wait; anything beyond that is
+    rejected immediately with :class:`PasswordHasherBusy` instead of
+    piling up behind a login storm.
+    """
+    
+    def __init__(self, workers: Optional[int] = None, queue_limit: Optional[int] = None) -> None:
+        """
+        Initialize the pool; threads are started on first use.
+        
+        Args:
+            workers: Concurrent hashing threads
+            queue_limit: Calls allowed to wait for a free thread
+        """
+        self.workers = workers or settings.PASSWORD_HASH_WORKERS
+        self.queue_limit = queue_limit if queue_limit is not None else settings.PASSWORD_HASH_QUEUE_LIMIT
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._executor: Optional[ThreadPoolExecutor] = None
+    
+    @property
+    def in_flight(self) -> int:
+        """Calls running or waiting in the pool."""
+        return self._in_flight
+    
+    async def run(self, name: str, func: Callable[..., T], *args: Any) -> T:
+        """
+        Run ``func(*args)`` in the pool.
+        
+        A slot is held until the thread finishes, even if the awaiting
+        request is cancelled, so abandoned logins still count against the
+        limit while their hash is computed.
+        
+        Args:
+            name: Operation name used for metrics
+            func: Blocking callable
+            *args: Arguments for ``func``
+            
+        Returns:
+            Result of ``func``
+            
+        Raises:
+            PasswordHasherBusy: If the pool and its queue are full
+        """
+        with self._lock:
+            if self._in_flight >= self.workers + self.queue_limit:
+                metrics.increment("auth.password.rejected")
+                raise PasswordHasherBusy("Too many concurrent password checks")
+            self._in_flight += 1
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix="password-hash")
+            executor = self._executor
+        
+        try:
+            future = executor.submit(func, *args)
+        except BaseException:
+            self._release()
+            raise
+        future.add_done_callback(lambda _: self._release())
+        with metrics.timer(f"auth.password.{name}"):
+            return await asyncio.wrap_future(future)
+    
+    def _release(self) -> None:
+        """Free the slot held by a finished call."""
+        with self._lock:
+            self._in_flight -= 1
+    
+    def shutdown(self) -> None:
+        """Stop the threads once queued work is done (restarted on next use)."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
+# Process-wide pool used by the async password helpers
+password_pool = PasswordHashPool()
+metrics.gauge("auth.password.in_flight", lambda: password_pool.in_flight)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify a password against a hash without blocking the event loop.
+    
+    Args:
+        plain_password: Plain password to verify
+        hashed_password: Hashed password to verify against
+        
+    Returns:
+        True if password is valid, False otherwise
+        
+    Raises:
+        PasswordHasherBusy: If too many checks are already in progress
+    """
+    return await password_pool.run("verify", verify_password, plain_password, hashed_password)
+
+
+async def verify_and_update_password_async(
+    plain_password: str, hashed_password: str
+) -> Tuple[bool, Optional[str]]:
+    """
+    Verify a password and compute its upgraded hash off the event loop.
+    
+    Args:
+        plain_password: Plain password to verify
+        hashed_password: Stored hash
+        
+    Returns:
+        ``(valid, new_hash)`` as :func:`verify_and_update_password`
+        
+    Raises:
+        PasswordHasherBusy: If too many checks are already in progress
+    """
+    return await password_pool.run(
+        "verify", verify_and_update_password, plain_password, hashed_password
+    )
+
+
+async def get_password_hash_async(password: str) -> str:
+    """
+    Hash a password without blocking the event loop.
+    
+    Args:
+        password: Plain password to hash
+        
+    Returns:
+        Hashed password
+        
+    Raises:
+        PasswordHasherBusy: If too many hashes are already in progress
+    """
+    return await password_pool.run("hash", get_password_hash, password)
+
+
+def calibrate_hash_cost(
+    target: float,
+    scheme: Optional[str] = None,
+    samples: int = 3,
+) -> Tuple[int, List[Tuple[int, float]]]:
+    """
+    Measure hashing time on this host and pick the highest affordable cost.
+    
+    bcrypt rounds are tried from 4 upwards (each step doubles the work);
+    argon2 time cost from 1 upwards at the configured memory cost.
+    Measuring stops once a cost takes more than twice ``target``.
+    
+    Args:
+        target: Acceptable seconds per hash (and so per login)
+        scheme: ``bcrypt`` or ``argon2`` (defaults to the setting)
+        samples: Hashes timed per cost (the median is used)
+        
+    Returns:
+        ``(recommended_cost, [(cost, seconds), ...])``; the recommendation
+        is the highest cost within ``target``, or the cheapest measured
+        one if none is
+    """
+    scheme = scheme or settings.PASSWORD_HASH_SCHEME
+    cost = 4 if scheme == "bcrypt" else 1
+    timings: List[Tuple[int, float]] = []
+    while cost <= 31:
+        context = build_crypt_context(scheme, cost)
+        durations = []
+        for _ in range(samples):
+            start = time.perf_counter()
+            context.hash("calibration-password")
+            durations.append(time.perf_counter() - start)
+        timings.append((cost, statistics.median(durations)))
+        if timings[-1][1] > target * 2:
+            break
+        cost += 1
+    affordable = [cost for cost, seconds in timings if seconds <= target]
+    return (max(affordable) if affordable else timings[0][0]), timings
@@ -0,0 +1,154 @@
+"""Write-once ZIP archives streamed with constant memory.
+
+``zipfile.ZipFile`` keeps a ``ZipInfo`` object per entry until the
+archive is closed. ``ZipStream`` instead packs each central directory
+record as soon as its entry is written and spools the records to a
+temporary file, so memory use does not depend on the number of entries.
+Zip64 records are added automatically when offsets or the entry count
+exceed the classic format's limits.
+"""
+
+import struct
+import tempfile
+import zlib
+from datetime import datetime
+from typing import Iterator, Optional, Tuple
+
+# Largest values the classic (non-Zip64) fields can hold
+ZIP64_LIMIT = 0xFFFFFFFF
+ZIP_MAX_ENTRIES = 0xFFFF
+
+# Field values meaning "see the Zip64 record"
+_MASK32 = 0xFFFFFFFF
+_MASK16 = 0xFFFF
+
+_LOCAL_HEADER = struct.Struct("<IHHHHHIIIHH")
+_CENTRAL_HEADER = struct.Struct("<IHHHHHHIIIHHHHHII")
+_ZIP64_END = struct.Struct("<IQHHIIQQQQ")
+_ZIP64_LOCATOR = struct.Struct("<IIQI")
+_END = struct.Struct("<IHHHHIIH")
+
+_VERSION = 20
+_VERSION_ZIP64 = 45
+_UTF8_NAMES = 0x0800
+_DEFLATED = 8
+# Regular file, rw-r--r--
+_EXTERNAL_ATTRIBUTES = 0o100644 << 16
+# Central directory bytes held in memory before spooling to disk
+_SPOOL_SIZE = 1 << 20
+
+
+def _dos_timestamp(moment: datetime) -> Tuple[int, int]:
+    """Return the MS-DOS ``(time, date)`` fields for ``moment``."""
+    moment = max(moment, datetime(1980, 1, 1))
+    return (
+        moment.hour << 11 | moment.minute << 5 | moment.second // 2,
+        (moment.year - 1980) << 9 | moment.month << 5 | moment.day,
+    )
+
+
+class ZipStream:
+    """
+    Incrementally encoded ZIP archive.
+    
+    Every call to ``add`` returns the bytes for one complete entry; once
+    all entries are added, ``close`` yields the central directory and end
+    records. The caller concatenates everything in order.
+    """
+    
+    def __init__(self, level: int = 6) -> None:
+        """
+        Start an empty archive.
+        
+        Args:
+            level: Deflate compression level
+        """
+        self.level = level
+        self._offset = 0
+        self._entries = 0
+        self._directory = tempfile.SpooledTemporaryFile(max_size=_SPOOL_SIZE)
+    
+    def add(self, name: str, data: bytes, modified: Optional[datetime] = None) -> bytes:
+        """
+        Encode one deflated entry.
+        
+        Args:
+            name: Path of the entry inside the archive
+            data: Uncompressed entry body (under 4 GiB)
+            modified: Modification time recorded for the entry (defaults to now)
+            
+        Returns:
+            Local header followed by the compressed body
+        """
+        if len(data) >= ZIP64_LIMIT:
+            raise ValueError(f"ZIP entry {name!r} is too large to stream")
+        compressor = zlib.compressobj(self.level, zlib.DEFLATED, -15)
+        body = compressor.compress(data) + compressor.flush()
+        crc = zlib.crc32(data)
+        filename = name.encode("utf-8")
+        dos_time, dos_date = _dos_timestamp(modified or datetime.utcnow())
+        
+        local = _LOCAL_HEADER.pack(
+            0x04034B50, _VERSION, _UTF8_NAMES, _DEFLATED, dos_time, dos_date,
+            crc, len(body), len(data), len(filename), 0,
+        )
+        
+        offset, extra, version = self._offset, b"", _VERSION
+        if offset >= ZIP64_LIMIT:
+            offset, extra, version = _MASK32, struct.pack("<HHQ", 1, 8, self._offset), _VERSION_ZIP64
+        self._directory.write(
+            _CENTRAL_HEADER.pack(
+                0x02014B50, version, version, _UTF8_NAMES, _DEFLATED, dos_time, dos_date,
+                crc, len(body), len(data), len(filename), len(extra), 0, 0, 0,
+                _EXTERNAL_ATTRIBUTES, offset,
+            )
+            + filename
+            + extra
+        )
+        
+        self._entries += 1
+        self._offset += len(local) + len(filename) + len(body)
+        return local + filename + body
+    
+    def close(self, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+        """
+        Yield the central directory and end records, then release the spool.
+        
+        Args:
+            chunk_size: Size of the central directory pieces yielded
+            
+        Yields:
+            Remaining archive bytes
+        """
+        directory_offset = self._offset
+        directory_size = self._directory.tell()
+        self._directory.seek(0)
+        try:
+            while True:
+                chunk = self._directory.read(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+        finally:
+            self._directory.close()
+        
+        tail = b""
+        if (
+            self._entries >= ZIP_MAX_ENTRIES
+            or directory_offset >= ZIP64_LIMIT
+            or directory_size >= ZIP64_LIMIT
+        ):
+            zip64_end_offset = directory_offset + directory_size
+            tail += _ZIP64_END.pack(
+                0x06064B50, _ZIP64_END.size - 12, _VERSION_ZIP64, _VERSION_ZIP64, 0, 0,
+                self._entries, self._entries, directory_size, directory_offset,
+            )
+            tail += _ZIP64_LOCATOR.pack(0x07064B50, 0, zip64_end_offset, 1)
+        entries = self._entries if self._entries < ZIP_MAX_ENTRIES else _MASK16
+        tail += _END.pack(
+            0x06054B50, 0, 0, entries, entries,
+            directory_size if directory_size < ZIP64_LIMIT else _MASK32,
+            directory_offset if directory_offset < ZIP64_LIMIT else _MASK32,
+            0,
+        )
+        yield tail
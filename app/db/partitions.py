@@ -0,0 +1,110 @@
+"""Monthly range partitioning of the PRD table on Postgres.
+
+Partitions are named ``prd_pYYYY_MM`` and cover one calendar month of
+``created_at``; rows outside every monthly range land in ``prd_default``.
+These helpers only build SQL and are shared by the partitioning migration
+and ``PartitionService``.
+"""
+
+import re
+from datetime import date, datetime
+from typing import Iterator, List, Optional, Union
+
+PARENT_TABLE = "prd"
+DEFAULT_PARTITION = "prd_default"
+
+_PARTITION_RE = re.compile(r"^prd_p(\d{4})_(\d{2})$")
+
+
+def month_start(value: Union[date, datetime]) -> date:
+    """Return the first day of the month containing ``value``."""
+    return date(value.year, value.month, 1)
+
+
+def add_months(month: date, count: int) -> date:
+    """Return the first day of the month ``count`` months after ``month``."""
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def iter_months(first: date, last: date) -> Iterator[date]:
+    """Yield the first day of every month from ``first`` to ``last`` inclusive."""
+    month = month_start(first)
+    while month <= last:
+        yield month
+        month = add_months(month, 1)
+
+
+def partition_name(month: date) -> str:
+    """Return the partition table name for ``month``."""
+    return f"{PARENT_TABLE}_p{month:%Y_%m}"
+
+
+def partition_month(name: str) -> Optional[date]:
+    """Return the month covered by a partition name, or None if not monthly."""
+    match = _PARTITION_RE.match(name)
+    if match is None:
+        return None
+    return date(int(match.group(1)), int(match.group(2)), 1)
+
+
+def _bounds_sql(month: date) -> str:
+    """Return the partition bound clause covering ``month``."""
+    return f"FOR VALUES FROM ('{month.isoformat()}') TO ('{add_months(month, 1).isoformat()}')"
+
+
+def _month_condition_sql(month: date) -> str:
+    """Return a WHERE condition selecting rows created in ``month``."""
+    return f"created_at >= '{month.isoformat()}' AND created_at < '{add_months(month, 1).isoformat()}'"
+
+
+def create_partition_sql(month: date) -> str:
+    """Build DDL creating the partition for ``month`` if it is missing."""
+    return (
+        f"CREATE TABLE IF NOT EXISTS {partition_name(month)} PARTITION OF {PARENT_TABLE} "
+        f"{_bounds_sql(month)}"
+    )
+
+
+def default_has_rows_sql(month: date) -> str:
+    """Build a query telling whether the catch-all partition holds rows of ``month``."""
+    return f"SELECT EXISTS (SELECT 1 FROM {DEFAULT_PARTITION} WHERE {_month_condition_sql(month)})"
+
+
+def split_default_partition_sql(month: date) -> List[str]:
+    """
+    Build the statements creating ``month``'s partition out of the default one.
+    
+    Postgres refuses ``PARTITION OF`` while the default partition holds rows
+    of the new range, so the partition is built as a plain table, the rows
+    are moved into it and it is attached. Run the statements in one
+    transaction.
+    """
+    name = partition_name(month)
+    return [
+        f"CREATE TABLE {name} (LIKE {PARENT_TABLE} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)",
+        f"WITH moved AS (DELETE FROM {DEFAULT_PARTITION} WHERE {_month_condition_sql(month)} "
+        f"RETURNING *) INSERT INTO {name} SELECT * FROM moved",
+        f"ALTER TABLE {PARENT_TABLE} ATTACH PARTITION {name} {_bounds_sql(month)}",
+    ]
+
+
+def create_default_partition_sql() -> str:
+    """Build DDL creating the catch-all partition."""
+    return f"CREATE TABLE IF NOT EXISTS {DEFAULT_PARTITION} PARTITION OF {PARENT_TABLE} DEFAULT"
+
+
+# Lists the partitions attached to the PRD table
+LIST_PARTITIONS_SQL = (
+    "SELECT child.relname FROM pg_inherits "
+    "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+    "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+    f"WHERE parent.relname = '{PARENT_TABLE}' ORDER BY child.relname"
+)
+
+# True when the PRD table is partitioned
+IS_PARTITIONED_SQL = (
+    "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table "
+    "JOIN pg_class ON pg_class.oid = pg_partitioned_table.partrelid "
+    f"WHERE pg_class.relname = '{PARENT_TABLE}')"
+)
@@ -1,39 +1,262 @@
 """Database session management."""
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+import random
+import time
+from typing import Any, AsyncGenerator, Dict, List, Optional, Sequence, Union
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import URL, Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker, declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 
 from app.core.config import settings
+from app.core.metrics import metrics
+
+# Async drivers used for each supported database backend
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+def get_async_database_url(database_uri: str) -> URL:
+    """
+    Convert a synchronous database URI to its async driver equivalent.
+    
+    Args:
+        database_uri: SQLAlchemy database URI (e.g. ``postgresql://...``)
+        
+    Returns:
+        URL using the async driver for the same backend
+    """
+    url = make_url(database_uri)
+    async_driver = ASYNC_DRIVERS.get(url.get_backend_name())
+    if async_driver is None or url.get_driver_name() in ("asyncpg", "aiosqlite"):
+        return url
+    return url.set(drivername=async_driver)
+
+
+class _TimedCheckoutMixin:
+    """Pool mixin recording how long callers wait for a connection."""
+    
+    metrics_name = "db.primary"
+    
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            metrics.observe(
+                f"{self.metrics_name}.pool.checkout_wait", time.perf_counter() - start
+            )
+
+
+class TimedQueuePool(_TimedCheckoutMixin, QueuePool):
+    """QueuePool that records checkout wait time."""
+
+
+class TimedAsyncQueuePool(_TimedCheckoutMixin, AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that records checkout wait time."""
+
+
+def _is_sqlite_memory(url: URL) -> bool:
+    """Return True for in-memory SQLite databases."""
+    return url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:")
+
+
+def get_engine_options(url: Union[str, URL], is_async: bool = False) -> Dict[str, Any]:
+    """
+    Build engine keyword arguments from settings for the given database URL.
+    
+    Args:
+        url: Database URL the engine will connect to
+        is_async: Whether the options are for an async engine
+        
+    Returns:
+        Keyword arguments for ``create_engine``/``create_async_engine``
+    """
+    url = make_url(url)
+    options: Dict[str, Any] = {"pool_pre_ping": True}
+    
+    if url.get_backend_name() == "sqlite":
+        # Connections are handed between threads by the pool; sqlite3 must not
+        # pin them to the creating thread
+        options["connect_args"] = {"check_same_thread": False}
+        if _is_sqlite_memory(url):
+            # In-memory databases use a singleton/static pool without sizing
+            return options
+    
+    options.update(
+        poolclass=TimedAsyncQueuePool if is_async else TimedQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+    )
+    return options
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """Apply performance pragmas to each new SQLite connection."""
+    cursor = dbapi_connection.cursor()
+    if settings.SQLITE_WAL:
+        cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute(f"PRAGMA synchronous={settings.SQLITE_SYNCHRONOUS}")
+    cursor.execute(f"PRAGMA mmap_size={int(settings.SQLITE_MMAP_SIZE)}")
+    cursor.execute(f"PRAGMA busy_timeout={int(settings.SQLITE_BUSY_TIMEOUT_MS)}")
+    cursor.close()
+
 
-# Create SQLAlchemy engine
-engine = create_engine(
-    settings.SQLALCHEMY_DATABASE_URI,
-    pool_pre_ping=True,
+def _start_query_timer(conn, cursor, statement, parameters, context, executemany) -> None:
+    """Remember when a statement was sent, on its own execution context."""
+    if context is not None:
+        context._query_start = time.perf_counter()
+
+
+def _make_query_timer(name: str):
+    """Build an ``after_cursor_execute`` hook recording statement latency."""
+    def _stop_query_timer(conn, cursor, statement, parameters, context, executemany) -> None:
+        # Failed statements never get here; their start time goes away with
+        # the context instead of piling up on the pooled connection
+        start = getattr(context, "_query_start", None)
+        if start is not None:
+            metrics.observe(f"db.{name}.query", time.perf_counter() - start)
+    return _stop_query_timer
+
+
+def configure_engine(sync_engine: Engine, name: str = "primary") -> Engine:
+    """
+    Attach SQLite pragmas, pool metrics and query latency timing to an engine.
+    
+    Args:
+        sync_engine: Engine to configure (``AsyncEngine.sync_engine`` for async)
+        name: Name used for the engine's metrics
+        
+    Returns:
+        The configured engine
+    """
+    if sync_engine.dialect.name == "sqlite" and not _is_sqlite_memory(sync_engine.url):
+        event.listen(sync_engine, "connect", _set_sqlite_pragmas)
+    
+    event.listen(sync_engine, "before_cursor_execute", _start_query_timer)
+    event.listen(sync_engine, "after_cursor_execute", _make_query_timer(name))
+    
+    pool = sync_engine.pool
+    if isinstance(pool, _TimedCheckoutMixin):
+        pool.metrics_name = f"db.{name}"
+        metrics.gauge(f"db.{name}.pool.size", pool.size)
+        metrics.gauge(f"db.{name}.pool.checked_out", pool.checkedout)
+        metrics.gauge(f"db.{name}.pool.overflow", pool.overflow)
+    return sync_engine
+
+
+class RoutingSession(Session):
+    """
+    Session sending replica-safe reads to a read replica.
+    
+    SELECT statements marked with ``execution_options(use_replica=True)``
+    run on one of ``replicas`` (chosen once per session). Everything else
+    runs on the primary bind, and once the session has written anything
+    (a flush or a DML statement) it stays on the primary so later reads
+    in the same request see its own writes.
+    """
+    
+    def __init__(self, *args: Any, replicas: Sequence[Engine] = (), **kwargs: Any) -> None:
+        """
+        Initialize the session.
+        
+        Args:
+            replicas: Sync engines of the read replicas (may be empty)
+        """
+        super().__init__(*args, **kwargs)
+        self.replicas = list(replicas)
+        self.pinned_to_primary = False
+        self._replica: Optional[Engine] = None
+    
+    def get_bind(self, mapper=None, clause=None, **kwargs: Any):
+        """Choose the engine for a statement (see class docstring)."""
+        if clause is None or not clause.is_select:
+            # Flushes and DML: the primary, for the rest of the session
+            self.pinned_to_primary = True
+        elif (
+            self.replicas
+            and not self.pinned_to_primary
+            and clause.get_execution_options().get("use_replica")
+        ):
+            if self._replica is None:
+                self._replica = random.choice(self.replicas)
+            return self._replica
+        return super().get_bind(mapper=mapper, clause=clause, **kwargs)
+
+
+def get_replica_urls() -> List[str]:
+    """Return the configured read replica URLs."""
+    return [
+        url.strip()
+        for url in (settings.READ_REPLICA_URIS or "").split(",")
+        if url.strip()
+    ]
+
+
+# Create SQLAlchemy engine (used by migrations and scripts)
+engine = configure_engine(
+    create_engine(
+        settings.SQLALCHEMY_DATABASE_URI,
+        **get_engine_options(settings.SQLALCHEMY_DATABASE_URI),
+    ),
+    name="sync",
 )
 
-# Create SessionLocal class for database session dependency
+# Create SessionLocal class for synchronous sessions
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Create async engine and session factory used by the API
+_async_database_url = (
+    settings.ASYNC_SQLALCHEMY_DATABASE_URI
+    or get_async_database_url(settings.SQLALCHEMY_DATABASE_URI)
+)
+async_engine = create_async_engine(
+    _async_database_url,
+    **get_engine_options(_async_database_url, is_async=True),
+)
+configure_engine(async_engine.sync_engine, name="primary")
+
+# Optional read replicas for replica-safe reads
+replica_engines = []
+for _index, _replica_url in enumerate(get_replica_urls()):
+    _replica_url = get_async_database_url(_replica_url)
+    _replica = create_async_engine(_replica_url, **get_engine_options(_replica_url, is_async=True))
+    configure_engine(_replica.sync_engine, name=f"replica{_index}")
+    replica_engines.append(_replica)
+
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    sync_session_class=RoutingSession,
+    replicas=[replica.sync_engine for replica in replica_engines],
+    autoflush=False,
+    expire_on_commit=False,
+)
+
 # Create Base class for SQLAlchemy models
 Base = declarative_base()
 
 
-def get_db():
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
-    Database session dependency to use in FastAPI endpoints.
+    Async database session dependency to use in FastAPI endpoints.
     
     Yields:
-        Session: SQLAlchemy database session
+        AsyncSession: SQLAlchemy async database session
     
     Example:
         ```python
         @app.get("/users/")
-        def get_users(db: Session = Depends(get_db)):
-            return db.query(User).all()
+        async def get_users(db: AsyncSession = Depends(get_db)):
+            result = await db.execute(select(User))
+            return result.scalars().all()
         ```
     """
-    db = SessionLocal()
-    try:
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
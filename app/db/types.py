@@ -0,0 +1,41 @@
+"""Custom SQLAlchemy column types."""
+
+from sqlalchemy import LargeBinary
+from sqlalchemy.types import TypeDecorator
+
+from app.core.compression import compress_text, decompress_text
+
+
+class CompressedText(TypeDecorator):
+    """
+    Binary column holding text encoded by :func:`compress_text`.
+    
+    Strings are compressed on write; encoded bytes are passed through
+    untouched. Loaded values stay encoded so decompression can happen
+    lazily when the text is actually used (see ``decompress_text``).
+    """
+    
+    impl = LargeBinary
+    cache_ok = True
+    
+    def process_bind_param(self, value, dialect):
+        """Compress plain strings; pass encoded bytes through."""
+        if isinstance(value, str):
+            return compress_text(value)
+        return value
+
+
+class DecodedText(TypeDecorator):
+    """
+    Read-side view of a :class:`CompressedText` column that decodes eagerly.
+    
+    Used with ``type_coerce`` in column projections that always need the
+    text, e.g. listing pages serialized straight from rows.
+    """
+    
+    impl = LargeBinary
+    cache_ok = True
+    
+    def process_result_value(self, value, dialect):
+        """Decompress the stored value into text."""
+        return decompress_text(value)
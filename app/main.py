@@ -1,16 +1,27 @@
 """Main FastAPI application module."""
 
-from fastapi import FastAPI, APIRouter, Depends, HTTPException, status
+from fastapi import FastAPI, APIRouter, Depends, HTTPException, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import timedelta
 
 from app.core.config import settings
+from app.core.loop_monitor import loop_monitor
+from app.core.metrics import metrics
+from app.core.rate_limit import RateLimitHeadersMiddleware
+from app.core.response_compression import CompressionMiddleware
+from app.core.responses import default_response_class
 from app.db.session import get_db
-from app.api.endpoints import prd, users
+from app.api.deps import get_current_active_superuser
+from app.api.endpoints import api_keys, prd, users
+from app.services.api_key_service import api_key_usage
+from app.services.prd_writer import prd_writer
+from app.services.principal_cache import principal_cache
+from app.services.purge_worker import purge_worker
 from app.services.user_service import UserService
-from app.core.security import create_access_token
+from app.core.security import PasswordHasherBusy, create_access_token, password_pool
 from app.schemas.user import Token, User as UserSchema, UserCreate
 
 # Create the FastAPI app
@@ -20,6 +31,7 @@ app = FastAPI(
     version="0.1.0",
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
     docs_url=f"{settings.API_V1_STR}/docs",
+    default_response_class=default_response_class(),
 )
 
 # Set up CORS
@@ -29,8 +41,50 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[
+        "X-Next-Cursor", "X-Total-Count", "ETag", "Last-Modified",
+        "RateLimit-Limit", "RateLimit-Remaining", "RateLimit-Reset", "RateLimit-Policy", "Retry-After",
+    ],
 )
 
+# Copy rate-limit headers onto responses that endpoints return directly
+app.add_middleware(RateLimitHeadersMiddleware)
+
+# Compress large JSON/markdown responses (streaming routes pass through)
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(CompressionMiddleware)
+
+@app.on_event("startup")
+async def start_background_tasks():
+    """Start background workers enabled in settings."""
+    if settings.PRD_WRITE_BEHIND:
+        prd_writer.start()
+    if settings.PRD_PURGE_ENABLED:
+        purge_worker.start()
+    if settings.EVENT_LOOP_LAG_MONITOR:
+        loop_monitor.start()
+    principal_cache.channel.start()
+    api_key_usage.start()
+
+@app.on_event("shutdown")
+async def stop_background_tasks():
+    """Stop background workers, committing any queued PRDs and key usage."""
+    await loop_monitor.stop()
+    await api_key_usage.stop()
+    await principal_cache.channel.stop()
+    await purge_worker.stop()
+    await prd_writer.stop()
+    password_pool.shutdown()
+
+@app.exception_handler(PasswordHasherBusy)
+async def password_hasher_busy(request: Request, exc: PasswordHasherBusy):
+    """Shed logins and registrations while the password pool is saturated."""
+    return JSONResponse(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        content={"detail": str(exc)},
+        headers={"Retry-After": "1"},
+    )
+
 # PUBLIC ENDPOINTS - NO AUTHENTICATION REQUIRED
 
 @app.get("/")
@@ -48,15 +102,20 @@ async def health_check():
         "version": "0.1.0"
     }
 
+@app.get(f"{settings.API_V1_STR}/metrics", dependencies=[Depends(get_current_active_superuser)])
+async def read_metrics():
+    """Runtime metrics (connection pools, timings) - superusers only."""
+    return metrics.snapshot()
+
 @app.post(f"{settings.API_V1_STR}/auth/login", response_model=Token)
 async def login(
     form_data: OAuth2PasswordRequestForm = Depends(),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Login endpoint - no authentication required."""
     print(f"Login attempt for user: {form_data.username}")
     
-    user = UserService.authenticate(
+    user = await UserService.authenticate(
         db, email=form_data.username, password=form_data.password
     )
     if not user:
@@ -83,19 +142,19 @@ async def login(
 @app.post(f"{settings.API_V1_STR}/auth/register", response_model=UserSchema)
 async def register(
     user_in: UserCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Register endpoint - no authentication required."""
     print(f"Registration attempt for email: {user_in.email}")
     
-    user = UserService.get_by_email(db, email=user_in.email)
+    user = await UserService.get_by_email(db, email=user_in.email)
     if user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="User with this email already exists",
         )
     
-    user = UserService.create(db, user_in=user_in)
+    user = await UserService.create(db, user_in=user_in)
     
     print(f"User registered successfully: {user_in.email}")
     return user
@@ -104,6 +163,7 @@ async def register(
 # These routers have dependencies that enforce authentication
 app.include_router(prd.router, prefix=f"{settings.API_V1_STR}/prd", tags=["prd"])
 app.include_router(users.router, prefix=f"{settings.API_V1_STR}/users", tags=["users"])
+app.include_router(api_keys.router, prefix=f"{settings.API_V1_STR}/api-keys", tags=["api-keys"])
 
 if __name__ == "__main__":
     import uvicorn
@@ -0,0 +1,148 @@
+"""Maintenance commands for PRD Generator.
+
+Usage::
+
+    python -m app.manage gc-blobs [--batch-size N] [--recount]
+    python -m app.manage purge [--retention-days N] [--batch-size N]
+    python -m app.manage partitions [--ahead N] [--detach-before YYYY-MM]
+                                    [--archive-schema NAME | --drop]
+    python -m app.manage calibrate-hash [--target-ms MS] [--scheme bcrypt|argon2]
+"""
+
+import argparse
+import asyncio
+from typing import List, Optional
+
+from app.db.session import AsyncSessionLocal, async_engine
+
+
+async def _gc_blobs(args: argparse.Namespace) -> None:
+    """Delete unreferenced PRD blobs."""
+    from app.services.blob_service import BlobService
+    
+    async with AsyncSessionLocal() as db:
+        if args.recount:
+            updated = await BlobService.recount_references(db)
+            print(f"Recounted references for {updated} blobs")
+        deleted = await BlobService.collect_garbage(db, batch_size=args.batch_size)
+    print(f"Deleted {deleted} unreferenced blobs")
+
+
+async def _purge(args: argparse.Namespace) -> None:
+    """Hard-delete soft-deleted PRDs past the retention period."""
+    from datetime import timedelta
+    
+    from app.services.purge_worker import PRDPurgeWorker
+    
+    worker = PRDPurgeWorker(
+        retention=timedelta(days=args.retention_days) if args.retention_days is not None else None,
+        batch_size=args.batch_size,
+    )
+    purged = await worker.run_once(respect_window=False)
+    print(f"Purged {purged} soft-deleted PRDs")
+
+
+async def _partitions(args: argparse.Namespace) -> None:
+    """Create future PRD partitions and retire old ones."""
+    from app.services.partition_service import PartitionService
+    
+    async with AsyncSessionLocal() as db:
+        if not await PartitionService.is_partitioned(db):
+            print("The PRD table is not partitioned; nothing to do")
+            return
+        created = await PartitionService.ensure_future(db, months_ahead=args.ahead)
+        print(f"Created {len(created)} partitions" + (f": {', '.join(created)}" if created else ""))
+        if args.detach_before is None:
+            return
+        if args.archive_schema is None and not args.drop:
+            raise SystemExit("--detach-before needs --archive-schema or --drop")
+        detached = await PartitionService.detach_before(
+            db, args.detach_before, archive_schema=args.archive_schema
+        )
+    action = f"Archived to {args.archive_schema}" if args.archive_schema else "Dropped"
+    print(f"{action} {len(detached)} partitions" + (f": {', '.join(detached)}" if detached else ""))
+
+
+async def _calibrate_hash(args: argparse.Namespace) -> None:
+    """Time password hashing at increasing cost and recommend a setting."""
+    from app.core.config import settings
+    from app.core.security import calibrate_hash_cost
+    
+    scheme = args.scheme or settings.PASSWORD_HASH_SCHEME
+    recommended, timings = calibrate_hash_cost(args.target_ms / 1000, scheme, args.samples)
+    print(f"{'cost':>4}  {'ms/hash':>9}")
+    for cost, seconds in timings:
+        marker = "  <- recommended" if cost == recommended else ""
+        print(f"{cost:>4}  {seconds * 1000:>9.1f}{marker}")
+    name = "PASSWORD_BCRYPT_ROUNDS" if scheme == "bcrypt" else "PASSWORD_ARGON2_TIME_COST"
+    print(f"PASSWORD_HASH_SCHEME={scheme}\n{name}={recommended}")
+    if scheme == "bcrypt" and recommended < 10:
+        print("Warning: fewer than 10 bcrypt rounds is weak; consider a higher target or more workers")
+
+
+def _month(value: str):
+    """Parse a ``YYYY-MM`` argument into the first day of that month."""
+    from datetime import datetime
+    
+    try:
+        return datetime.strptime(value, "%Y-%m").date()
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected YYYY-MM, got {value!r}")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser."""
+    parser = argparse.ArgumentParser(prog="python -m app.manage", description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    
+    gc_blobs = commands.add_parser("gc-blobs", help="Delete PRD blobs no longer referenced")
+    gc_blobs.add_argument("--batch-size", type=int, default=500)
+    gc_blobs.add_argument(
+        "--recount", action="store_true", help="Recompute reference counts before collecting"
+    )
+    gc_blobs.set_defaults(handler=_gc_blobs)
+    
+    purge = commands.add_parser("purge", help="Hard-delete soft-deleted PRDs past retention")
+    purge.add_argument("--retention-days", type=int, default=None)
+    purge.add_argument("--batch-size", type=int, default=None)
+    purge.set_defaults(handler=_purge)
+    
+    partitions = commands.add_parser(
+        "partitions", help="Pre-create future PRD partitions and detach old ones (Postgres)"
+    )
+    partitions.add_argument("--ahead", type=int, default=None, help="Months to create ahead")
+    partitions.add_argument(
+        "--detach-before", type=_month, default=None, help="Detach partitions older than YYYY-MM"
+    )
+    retire = partitions.add_mutually_exclusive_group()
+    retire.add_argument("--archive-schema", default=None, help="Move detached partitions here")
+    retire.add_argument("--drop", action="store_true", help="Drop detached partitions")
+    partitions.set_defaults(handler=_partitions)
+    
+    calibrate = commands.add_parser(
+        "calibrate-hash", help="Measure password hashing cost on this host and recommend a setting"
+    )
+    calibrate.add_argument("--target-ms", type=float, default=250, help="Acceptable ms per hash")
+    calibrate.add_argument("--scheme", choices=["bcrypt", "argon2"], default=None)
+    calibrate.add_argument("--samples", type=int, default=3, help="Hashes timed per cost")
+    calibrate.set_defaults(handler=_calibrate_hash)
+    
+    return parser
+
+
+async def _run(args: argparse.Namespace) -> None:
+    """Run a command handler and release pooled connections."""
+    try:
+        await args.handler(args)
+    finally:
+        await async_engine.dispose()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Entry point for ``python -m app.manage``."""
+    args = build_parser().parse_args(argv)
+    asyncio.run(_run(args))
+
+
+if __name__ == "__main__":
+    main()
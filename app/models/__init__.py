@@ -2,7 +2,12 @@
 
 from app.models.base import BaseModel
 from app.models.user import User
+from app.models.prd_blob import PRDBlob
 from app.models.prd import PRD
+from app.models.user_stats import UserPRDStats
+from app.models.prd_revision import PRDRevision
+from app.models.api_key import APIKey
+from app.models import prd_search  # registers full-text index DDL
 
 # Export all models
-__all__ = ["BaseModel", "User", "PRD"]
+__all__ = ["BaseModel", "User", "PRD", "PRDBlob", "UserPRDStats", "PRDRevision", "APIKey"]
@@ -0,0 +1,42 @@
+"""API keys for machine clients."""
+
+from sqlalchemy import Column, DateTime, ForeignKey, String, Uuid
+
+from app.models.base import BaseModel
+
+
+class APIKey(BaseModel):
+    """
+    A user's API key, stored as its public prefix and a keyed hash.
+    
+    Keys look like ``pk_<prefix>_<secret>``. The unique ``prefix`` finds
+    the row with one index lookup; ``secret_hash`` is the HMAC-SHA256 of
+    the secret under API_KEY_HMAC_KEY, compared in constant time. The
+    secret itself is shown once at creation and never stored.
+    """
+    
+    __tablename__ = "api_key"
+    
+    user_id = Column(
+        Uuid(as_uuid=True),
+        ForeignKey("user.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True
+    )
+    name = Column(String(100), nullable=False)
+    prefix = Column(String(16), nullable=False, unique=True, index=True)
+    secret_hash = Column(String(64), nullable=False)
+    # Space-separated scopes, e.g. "prd:read prd:write"
+    scopes = Column(String(255), nullable=False)
+    # Written in batches by APIKeyUsageRecorder, so it may lag by a flush interval
+    last_used_at = Column(DateTime, nullable=True)
+    revoked_at = Column(DateTime, nullable=True)
+    
+    @property
+    def scope_set(self) -> frozenset:
+        """Granted scopes."""
+        return frozenset(self.scopes.split())
+    
+    def __repr__(self) -> str:
+        """String representation of the API key."""
+        return f"<APIKey {self.prefix} user={self.user_id}>"
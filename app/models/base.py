@@ -4,8 +4,7 @@ import uuid
 from datetime import datetime
 from typing import Any, Dict
 
-from sqlalchemy import Column, DateTime
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Boolean, Column, DateTime, Uuid
 from sqlalchemy.ext.declarative import declared_attr
 
 from app.db.session import Base
@@ -15,9 +14,12 @@ class BaseModel(Base):
     """Base model with common attributes for all models."""
     
     __abstract__ = True
+    # Any server-generated values are fetched with RETURNING as part of the
+    # INSERT/UPDATE instead of a follow-up SELECT (callers never refresh)
+    __mapper_args__ = {"eager_defaults": True}
     
     id = Column(
-        UUID(as_uuid=True), 
+        Uuid(as_uuid=True), 
         primary_key=True, 
         index=True, 
         default=uuid.uuid4
@@ -42,3 +44,15 @@ class BaseModel(Base):
     def dict(self) -> Dict[str, Any]:
         """Convert model instance to dictionary."""
         return {c.name: getattr(self, c.name) for c in self.__table__.columns}
+
+
+class SoftDeleteMixin:
+    """
+    Soft-delete columns for models whose deletes are deferred.
+    
+    Deleted rows are hidden from reads at once and hard-deleted later by
+    the purge worker once ``deleted_at`` is past the retention period.
+    """
+    
+    is_deleted = Column(Boolean, default=False, nullable=False)
+    deleted_at = Column(DateTime, nullable=True)
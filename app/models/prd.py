@@ -1,19 +1,55 @@
 """PRD model for storing generated Product Requirement Documents."""
 
-from sqlalchemy import Column, String, Text, ForeignKey, Enum
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+import re
+
+from sqlalchemy import Column, String, Text, ForeignKey, Enum, Index, Integer, Uuid, false, true
+from sqlalchemy.orm import column_property, relationship
 
 from app.schemas.prd import Format, TemplateType
-from app.models.base import BaseModel
+from app.models.base import BaseModel, SoftDeleteMixin
+from app.models.prd_blob import content_hash
+
+# Maximum length of the precomputed listing snippet
+SNIPPET_LENGTH = 200
+
+_MARKUP_RE = re.compile(r"[#*_`>{}\[\]\"]+")
+_WHITESPACE_RE = re.compile(r"\s+")
+
 
+def build_snippet(content: str, length: int = SNIPPET_LENGTH) -> str:
+    """
+    Build a short plain-text preview of PRD content.
+    
+    Markdown/JSON punctuation is stripped and whitespace collapsed so the
+    snippet can be shown directly in history listings.
+    
+    Args:
+        content: Full PRD content
+        length: Maximum snippet length
+        
+    Returns:
+        Snippet of at most ``length`` characters
+    """
+    text = _WHITESPACE_RE.sub(" ", _MARKUP_RE.sub(" ", content or "")).strip()
+    if len(text) <= length:
+        return text
+    return text[: length - 1].rstrip() + "\u2026"
 
-class PRD(BaseModel):
+
+class PRD(SoftDeleteMixin, BaseModel):
     """PRD model for storing generated Product Requirement Documents."""
     
     title = Column(String(255), nullable=False, index=True)
     input_prompt = Column(Text, nullable=False)
-    content = Column(Text, nullable=False)
+    # Body lives in the content-addressed prd_blob table; use ``content``.
+    # Active history keeps the previous hash so its blob can be released.
+    content_hash = column_property(
+        Column(String(64), ForeignKey("prd_blob.hash"), nullable=False, index=True),
+        active_history=True
+    )
+    # Listing fields derived from content at write time
+    content_length = Column(Integer, nullable=False, default=0)
+    snippet = Column(String(SNIPPET_LENGTH), nullable=False, default="")
     format = Column(
         Enum(Format),
         nullable=False,
@@ -27,7 +63,7 @@ class PRD(BaseModel):
     
     # Foreign keys
     user_id = Column(
-        UUID(as_uuid=True),
+        Uuid(as_uuid=True),
         ForeignKey("user.id", ondelete="CASCADE"),
         nullable=False,
         index=True
@@ -35,7 +71,56 @@ class PRD(BaseModel):
     
     # Relationships
     user = relationship("User", back_populates="prds")
+    # Read-only: blob rows and reference counts are managed on flush
+    blob = relationship("PRDBlob", viewonly=True, innerjoin=True)
+    
+    # Not persisted: tokens spent generating a new PRD, for usage stats
+    generated_tokens = 0
+    
+    @property
+    def content(self) -> str:
+        """PRD content, read from the blob unless assigned in this session."""
+        cached = self.__dict__.get("_content_cache")
+        if cached is not None and cached[0] == self.content_hash:
+            return cached[1]
+        return self.blob.text
+    
+    @content.setter
+    def content(self, text: str) -> None:
+        """Point at the blob for ``text`` and keep length and snippet in sync."""
+        digest = content_hash(text)
+        self.content_hash = digest
+        self.__dict__["_content_cache"] = (digest, text)
+        self.content_length = len(text)
+        self.snippet = build_snippet(text)
+    
+    def pending_content(self) -> str:
+        """Return content assigned in this session (used when writing blobs)."""
+        cached = self.__dict__.get("_content_cache")
+        if cached is None or cached[0] != self.content_hash:
+            raise ValueError("PRD content was not assigned in this session")
+        return cached[1]
     
     def __repr__(self) -> str:
         """String representation of the PRD."""
         return f"<PRD {self.title}>"
+
+
+# Composite index backing keyset pagination of a user's PRD history; partial
+# so soft-deleted rows awaiting purge never bloat it
+Index(
+    "ix_prd_user_id_created_at_id",
+    PRD.user_id,
+    PRD.created_at.desc(),
+    PRD.id,
+    postgresql_where=PRD.is_deleted == false(),
+    sqlite_where=PRD.is_deleted == false(),
+)
+
+# Lets the purge worker find expired soft-deleted rows without a scan
+Index(
+    "ix_prd_deleted_at",
+    PRD.deleted_at,
+    postgresql_where=PRD.is_deleted == true(),
+    sqlite_where=PRD.is_deleted == true(),
+)
@@ -0,0 +1,149 @@
+"""Content-addressed storage for PRD bodies."""
+
+import hashlib
+from collections import Counter
+from datetime import datetime
+from typing import Dict, Mapping
+
+from sqlalchemy import Column, DateTime, Index, Integer, String, bindparam, event, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session, attributes
+
+from app.core.compression import compress_text, decompress_text
+from app.db.session import Base
+from app.db.types import CompressedText
+
+
+def content_hash(text: str) -> str:
+    """Return the SHA-256 hex digest addressing ``text``."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class PRDBlob(Base):
+    """
+    Deduplicated PRD body, keyed by the SHA-256 of its text.
+    
+    ``ref_count`` tracks how many PRD rows point at the blob; blobs whose
+    count drops to zero are removed in batches by the blob garbage
+    collector (``BlobService.collect_garbage``).
+    """
+    
+    __tablename__ = "prd_blob"
+    
+    hash = Column(String(64), primary_key=True)
+    # Encoded content (see app.core.compression); use the ``text`` property
+    _content = Column("content", CompressedText, nullable=False)
+    size = Column(Integer, nullable=False)
+    ref_count = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    
+    @property
+    def text(self) -> str:
+        """Blob text, decompressed on first access."""
+        cached = self.__dict__.get("_text_cache")
+        if cached is None:
+            cached = self.__dict__["_text_cache"] = decompress_text(self._content)
+        return cached
+    
+    def __repr__(self) -> str:
+        """String representation of the blob."""
+        return f"<PRDBlob {self.hash[:12]} refs={self.ref_count}>"
+
+
+# Partial index so garbage collection only visits orphaned blobs
+Index(
+    "ix_prd_blob_orphans",
+    PRDBlob.hash,
+    postgresql_where=PRDBlob.ref_count <= 0,
+    sqlite_where=PRDBlob.ref_count <= 0,
+)
+
+
+def add_blob_references(connection: Connection, contents: Mapping[str, str], counts: Mapping[str, int]) -> None:
+    """
+    Insert blobs or bump their reference counts in one statement per batch.
+    
+    Args:
+        connection: Connection in the caller's transaction
+        contents: Text for each content hash
+        counts: Number of new references per content hash
+    """
+    if not counts:
+        return
+    table = PRDBlob.__table__
+    insert = (postgresql if connection.dialect.name == "postgresql" else sqlite).insert
+    statement = insert(table)
+    statement = statement.on_conflict_do_update(
+        index_elements=[table.c.hash],
+        set_={"ref_count": table.c.ref_count + statement.excluded.ref_count},
+    )
+    now = datetime.utcnow()
+    connection.execute(
+        statement,
+        [
+            {
+                "hash": digest,
+                "content": compress_text(contents[digest]),
+                "size": len(contents[digest].encode("utf-8")),
+                "ref_count": count,
+                "created_at": now,
+            }
+            for digest, count in counts.items()
+        ],
+    )
+
+
+def release_blob_references(connection: Connection, counts: Mapping[str, int]) -> None:
+    """
+    Decrement blob reference counts.
+    
+    Args:
+        connection: Connection in the caller's transaction
+        counts: Number of dropped references per content hash
+    """
+    if not counts:
+        return
+    table = PRDBlob.__table__
+    connection.execute(
+        update(table)
+        .where(table.c.hash == bindparam("b_hash"))
+        .values(ref_count=table.c.ref_count - bindparam("b_count")),
+        [{"b_hash": digest, "b_count": count} for digest, count in counts.items()],
+    )
+
+
+@event.listens_for(Session, "before_flush")
+def _sync_blob_references(session: Session, flush_context, instances) -> None:
+    """Keep blob rows and reference counts in step with PRD writes."""
+    from app.models.prd import PRD
+    
+    contents: Dict[str, str] = {}
+    added: Counter = Counter()
+    released: Counter = Counter()
+    
+    for obj in session.new:
+        if isinstance(obj, PRD) and obj.content_hash:
+            contents[obj.content_hash] = obj.pending_content()
+            added[obj.content_hash] += 1
+    
+    for obj in session.dirty:
+        if not isinstance(obj, PRD):
+            continue
+        history = attributes.get_history(obj, "content_hash")
+        if history.added and history.deleted and history.added[0] != history.deleted[0]:
+            contents[history.added[0]] = obj.pending_content()
+            added[history.added[0]] += 1
+            released[history.deleted[0]] += 1
+    
+    for obj in session.deleted:
+        if isinstance(obj, PRD):
+            history = attributes.get_history(obj, "content_hash")
+            digest = history.deleted[0] if history.deleted else obj.content_hash
+            if digest:
+                released[digest] += 1
+    
+    if added or released:
+        connection = session.connection()
+        add_blob_references(connection, contents, added)
+        release_blob_references(connection, released)
@@ -0,0 +1,38 @@
+"""Stored content revisions of PRDs."""
+
+from datetime import datetime
+
+from sqlalchemy import Boolean, Column, DateTime, Integer, String, Uuid
+
+from app.db.session import Base
+from app.db.types import CompressedText
+
+
+class PRDRevision(Base):
+    """
+    One content revision of a PRD.
+    
+    The newest revision and every checkpoint (each
+    PRD_REVISION_CHECKPOINT_INTERVAL-th revision) hold the full text; all
+    others hold a delta against their successor (see ``app.core.delta``).
+    Rows are created on the first content update, so a PRD that was never
+    edited has none. ``prd_id`` has no foreign key because a partitioned
+    ``prd`` table has no unique key on ``id`` alone; rows are removed by
+    the purge.
+    """
+    
+    __tablename__ = "prd_revision"
+    
+    prd_id = Column(Uuid(as_uuid=True), primary_key=True)
+    number = Column(Integer, primary_key=True)
+    is_full = Column(Boolean, nullable=False)
+    # Full text, or the delta against revision ``number + 1``
+    data = Column(CompressedText, nullable=False)
+    content_hash = Column(String(64), nullable=False)
+    size = Column(Integer, nullable=False)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    
+    def __repr__(self) -> str:
+        """String representation of the revision."""
+        kind = "full" if self.is_full else "delta"
+        return f"<PRDRevision {self.prd_id} #{self.number} {kind}>"
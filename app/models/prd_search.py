@@ -0,0 +1,47 @@
+"""Full-text search index tables for PRDs.
+
+The index lives outside the ORM because its shape depends on the backend:
+SQLite uses an FTS5 virtual table and Postgres a table with a generated
+``tsvector`` column and a GIN index. Both are created and dropped together
+with the ``prd`` table and kept up to date by ``PRDService``.
+"""
+
+from sqlalchemy import DDL, event
+
+from app.models.prd import PRD
+
+# SQLite: FTS5 table. ``owner`` holds the user id as a single token so the
+# per-user filter is resolved by the full-text index itself. Rowids are
+# derived from the PRD UUID (see PRDSearchService.fts_rowid).
+SQLITE_CREATE_DDL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS prd_fts USING fts5("
+    "title, content, owner, prd_id UNINDEXED, tokenize='porter unicode61')",
+    # Title matches weigh more than body matches; owner never affects rank
+    "INSERT INTO prd_fts(prd_fts, rank) VALUES ('rank', 'bm25(10.0, 1.0, 0.0)')",
+]
+SQLITE_DROP_DDL = ["DROP TABLE IF EXISTS prd_fts"]
+
+# Postgres: tsvector generated from weighted title and body
+POSTGRES_CREATE_DDL = [
+    "CREATE TABLE IF NOT EXISTS prd_search ("
+    "prd_id UUID PRIMARY KEY, "
+    "user_id UUID NOT NULL, "
+    "title TEXT NOT NULL, "
+    "body TEXT NOT NULL, "
+    "document TSVECTOR GENERATED ALWAYS AS ("
+    "setweight(to_tsvector('english', title), 'A') || "
+    "setweight(to_tsvector('english', body), 'B')) STORED)",
+    "CREATE INDEX IF NOT EXISTS ix_prd_search_document ON prd_search USING GIN (document)",
+    "CREATE INDEX IF NOT EXISTS ix_prd_search_user_id ON prd_search (user_id)",
+]
+POSTGRES_DROP_DDL = ["DROP TABLE IF EXISTS prd_search"]
+
+
+for _statement in SQLITE_CREATE_DDL:
+    event.listen(PRD.__table__, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
+for _statement in SQLITE_DROP_DDL:
+    event.listen(PRD.__table__, "before_drop", DDL(_statement).execute_if(dialect="sqlite"))
+for _statement in POSTGRES_CREATE_DDL:
+    event.listen(PRD.__table__, "after_create", DDL(_statement).execute_if(dialect="postgresql"))
+for _statement in POSTGRES_DROP_DDL:
+    event.listen(PRD.__table__, "before_drop", DDL(_statement).execute_if(dialect="postgresql"))
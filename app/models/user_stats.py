@@ -0,0 +1,33 @@
+"""Incrementally maintained per-user PRD statistics."""
+
+from sqlalchemy import BigInteger, Column, Enum, ForeignKey, Integer, Uuid
+
+from app.db.session import Base
+from app.schemas.prd import TemplateType
+
+
+class UserPRDStats(Base):
+    """
+    Running PRD totals for one user and template type.
+    
+    Rows are adjusted by ``StatsService`` in the same transaction as each
+    PRD create, update and delete, so a user's totals are a sum over at
+    most one row per template type instead of a scan of their history.
+    ``tokens_generated`` is cumulative usage and is not reduced by deletes.
+    """
+    
+    __tablename__ = "user_prd_stats"
+    
+    user_id = Column(
+        Uuid(as_uuid=True),
+        ForeignKey("user.id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    template_type = Column(Enum(TemplateType), primary_key=True)
+    prd_count = Column(Integer, nullable=False, default=0)
+    content_bytes = Column(BigInteger, nullable=False, default=0)
+    tokens_generated = Column(BigInteger, nullable=False, default=0)
+    
+    def __repr__(self) -> str:
+        """String representation of the statistics row."""
+        return f"<UserPRDStats {self.user_id} {self.template_type} count={self.prd_count}>"
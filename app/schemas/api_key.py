@@ -0,0 +1,50 @@
+"""API key schemas for request/response validation."""
+
+import uuid
+from datetime import datetime
+from enum import Enum
+from typing import List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+
+class APIKeyScope(str, Enum):
+    """Permissions an API key can carry."""
+    
+    PRD_READ = "prd:read"
+    PRD_WRITE = "prd:write"
+
+
+class APIKeyCreate(BaseModel):
+    """API key creation schema."""
+    
+    name: str = Field(..., min_length=1, max_length=100, description="Label, e.g. the CI job using it")
+    scopes: List[APIKeyScope] = Field(
+        default_factory=lambda: [APIKeyScope.PRD_READ], min_length=1, description="Granted scopes"
+    )
+
+
+class APIKeyInfo(BaseModel):
+    """An API key without its secret."""
+    
+    id: uuid.UUID
+    name: str
+    prefix: str = Field(..., description="Public part identifying the key")
+    scopes: List[APIKeyScope]
+    created_at: datetime
+    last_used_at: Optional[datetime] = Field(None, description="Approximate; updated in batches")
+    revoked_at: Optional[datetime] = None
+    
+    model_config = ConfigDict(from_attributes=True)
+    
+    @field_validator("scopes", mode="before")
+    @classmethod
+    def split_scopes(cls, value):
+        """Accept the space-separated form stored in the database."""
+        return value.split() if isinstance(value, str) else value
+
+
+class APIKeyCreated(APIKeyInfo):
+    """A newly created API key, including the full key shown only once."""
+    
+    key: str = Field(..., description="Full key; store it now, it cannot be retrieved later")
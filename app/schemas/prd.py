@@ -2,7 +2,7 @@
 
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, Field
@@ -24,6 +24,13 @@ class TemplateType(str, Enum):
     CUSTOM = "custom"
 
 
+class ExportFormat(str, Enum):
+    """Supported bulk export formats."""
+    
+    NDJSON = "ndjson"
+    ZIP = "zip"
+
+
 class PRDBase(BaseModel):
     """Base PRD model with common attributes."""
     
@@ -90,3 +97,75 @@ class PRDResponse(BaseModel):
         """Pydantic configuration."""
         
         from_attributes = True
+
+
+class PRDSummary(BaseModel):
+    """Model for a PRD history listing entry (without content)."""
+    
+    id: UUID = Field(..., description="Unique identifier of the PRD")
+    title: str = Field(..., description="Title of the PRD")
+    template_type: TemplateType = Field(..., description="Template type used for the PRD")
+    format: Format = Field(..., description="Format of the PRD content")
+    created_at: datetime = Field(..., description="Timestamp when the PRD was created")
+    content_length: int = Field(..., description="Length of the PRD content in characters")
+    snippet: str = Field(..., description="Short plain-text preview of the content")
+
+    class Config:
+        """Pydantic configuration."""
+        
+        from_attributes = True
+
+
+class PRDSearchResult(BaseModel):
+    """Model for a ranked full-text search hit."""
+    
+    id: UUID = Field(..., description="Unique identifier of the PRD")
+    title: str = Field(..., description="Title of the PRD")
+    template_type: TemplateType = Field(..., description="Template type used for the PRD")
+    format: Format = Field(..., description="Format of the PRD content")
+    created_at: datetime = Field(..., description="Timestamp when the PRD was created")
+    rank: float = Field(..., description="Relevance score (higher is better)")
+    title_highlight: str = Field(..., description="Title with matches wrapped in <mark>")
+    snippet_highlight: str = Field(..., description="Content excerpt with matches wrapped in <mark>")
+
+    class Config:
+        """Pydantic configuration."""
+        
+        from_attributes = True
+
+
+class PRDImportIssue(BaseModel):
+    """An upload item that could not be imported."""
+    
+    location: str = Field(..., description="Where the item is in the upload, e.g. 'line 12'")
+    detail: str = Field(..., description="Why the item was rejected")
+
+
+class PRDImportReport(BaseModel):
+    """Outcome of a bulk PRD import."""
+    
+    imported: int = Field(0, description="Number of PRDs created")
+    failed: int = Field(0, description="Number of items rejected")
+    errors: List[PRDImportIssue] = Field(
+        default_factory=list, description="Rejected items, up to PRD_IMPORT_MAX_ERRORS of them"
+    )
+
+
+class PRDRevisionInfo(BaseModel):
+    """Metadata of one stored content revision."""
+    
+    number: int = Field(..., description="Revision number, starting at 1")
+    content_hash: str = Field(..., description="SHA-256 of the revision content")
+    size: int = Field(..., description="Size of the revision content in bytes")
+    created_at: datetime = Field(..., description="Timestamp when the revision was made")
+    
+    class Config:
+        """Pydantic configuration."""
+        
+        from_attributes = True
+
+
+class PRDRevisionResponse(PRDRevisionInfo):
+    """A reconstructed content revision."""
+    
+    content: str = Field(..., description="PRD content as of this revision")
@@ -1,10 +1,12 @@
 """User schemas for request/response validation."""
 
-from typing import Optional
+from typing import Dict, Optional
 import uuid
 from datetime import datetime
 from pydantic import BaseModel, EmailStr, ConfigDict, Field
 
+from app.schemas.prd import TemplateType
+
 
 class UserBase(BaseModel):
     """Base user schema with shared attributes."""
@@ -49,6 +51,20 @@ class UserInDB(UserInDBBase):
     hashed_password: str
 
 
+class PRDUsage(BaseModel):
+    """PRD totals for a user or one of their template types."""
+    
+    prd_count: int = 0
+    content_bytes: int = 0
+    tokens_generated: int = 0
+
+
+class UserStats(PRDUsage):
+    """Per-user PRD statistics with a per-template breakdown."""
+    
+    by_template: Dict[TemplateType, PRDUsage] = Field(default_factory=dict)
+
+
 class Token(BaseModel):
     """Token schema."""
     
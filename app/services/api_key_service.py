@@ -0,0 +1,259 @@
+"""Service for API keys and their batched usage tracking."""
+
+import asyncio
+import hashlib
+import hmac
+import logging
+import secrets
+import uuid
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import bindparam, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.models.api_key import APIKey
+from app.schemas.api_key import APIKeyCreate
+
+logger = logging.getLogger(__name__)
+
+# Keys look like "pk_<12 hex chars>_<secret>"
+KEY_MARKER = "pk"
+PREFIX_BYTES = 6
+
+
+def hash_secret(secret: str) -> str:
+    """Return the keyed HMAC-SHA256 stored for an API key secret."""
+    key = (settings.API_KEY_HMAC_KEY or settings.SECRET_KEY).encode()
+    return hmac.new(key, secret.encode(), hashlib.sha256).hexdigest()
+
+
+def split_key(raw_key: str) -> Optional[Tuple[str, str]]:
+    """Split a full key into ``(prefix, secret)``, or None if malformed."""
+    marker, _, rest = raw_key.partition("_")
+    prefix, _, secret = rest.partition("_")
+    if marker != KEY_MARKER or len(prefix) != PREFIX_BYTES * 2 or not secret:
+        return None
+    return prefix, secret
+
+
+def is_api_key(credential: str) -> bool:
+    """Whether a bearer credential is an API key rather than a JWT."""
+    return credential.startswith(KEY_MARKER + "_")
+
+
+class APIKeyService:
+    """Service for creating, listing, revoking and checking API keys."""
+    
+    @staticmethod
+    async def create(db: AsyncSession, user_id: uuid.UUID, key_in: APIKeyCreate) -> Tuple[APIKey, str]:
+        """
+        Create an API key.
+        
+        Args:
+            db: Database session
+            user_id: Owner
+            key_in: Name and scopes
+            
+        Returns:
+            The stored key and the full key string (not retrievable later)
+        """
+        scopes = " ".join(sorted({scope.value for scope in key_in.scopes}))
+        for attempt in range(3):
+            prefix = secrets.token_hex(PREFIX_BYTES)
+            secret = secrets.token_urlsafe(32)
+            db_key = APIKey(
+                user_id=user_id,
+                name=key_in.name,
+                prefix=prefix,
+                secret_hash=hash_secret(secret),
+                scopes=scopes,
+            )
+            db.add(db_key)
+            try:
+                await db.commit()
+            except IntegrityError:
+                # Prefix collision (48 random bits); try a fresh one
+                await db.rollback()
+                if attempt == 2:
+                    raise
+                continue
+            return db_key, f"{KEY_MARKER}_{prefix}_{secret}"
+    
+    @staticmethod
+    async def list_for_user(db: AsyncSession, user_id: uuid.UUID) -> List[APIKey]:
+        """
+        List a user's API keys, newest first.
+        
+        Args:
+            db: Database session
+            user_id: Owner
+            
+        Returns:
+            API keys, including revoked ones
+        """
+        result = await db.scalars(
+            select(APIKey).where(APIKey.user_id == user_id).order_by(APIKey.created_at.desc())
+        )
+        return list(result)
+    
+    @staticmethod
+    async def get(db: AsyncSession, key_id: uuid.UUID) -> Optional[APIKey]:
+        """
+        Get an API key by ID.
+        
+        Args:
+            db: Database session
+            key_id: API key ID
+            
+        Returns:
+            API key if found, None otherwise
+        """
+        return await db.get(APIKey, key_id)
+    
+    @staticmethod
+    async def revoke(db: AsyncSession, db_key: APIKey) -> APIKey:
+        """
+        Revoke an API key; it stops working on the next request.
+        
+        Args:
+            db: Database session
+            db_key: API key to revoke
+            
+        Returns:
+            Revoked key
+        """
+        if db_key.revoked_at is None:
+            db_key.revoked_at = datetime.utcnow()
+            await db.commit()
+        return db_key
+    
+    @staticmethod
+    async def authenticate(db: AsyncSession, raw_key: str) -> Optional[APIKey]:
+        """
+        Check a presented API key.
+        
+        One lookup on the unique prefix index, then a constant-time
+        comparison of the secret's HMAC. Successful uses are recorded in
+        memory and written to ``last_used_at`` in batches.
+        
+        Args:
+            db: Database session
+            raw_key: Full key as sent by the client
+            
+        Returns:
+            The key if valid and not revoked, None otherwise
+        """
+        parts = split_key(raw_key)
+        if parts is None:
+            return None
+        prefix, secret = parts
+        db_key = await db.scalar(
+            select(APIKey).where(APIKey.prefix == prefix, APIKey.revoked_at.is_(None))
+        )
+        if db_key is None or not hmac.compare_digest(db_key.secret_hash, hash_secret(secret)):
+            metrics.increment("auth.api_key.rejected")
+            return None
+        api_key_usage.touch(db_key.id)
+        return db_key
+
+
+class APIKeyUsageRecorder:
+    """
+    Collects API key uses and writes ``last_used_at`` in batches.
+    
+    ``touch`` only updates an in-memory map; every ``flush_interval``
+    seconds the latest use of each key is written with one executemany
+    UPDATE, so busy keys cost one write per interval instead of one per
+    request. ``stop`` flushes what is left.
+    """
+    
+    def __init__(self, flush_interval: Optional[float] = None) -> None:
+        """
+        Initialize an idle recorder.
+        
+        Args:
+            flush_interval: Seconds between writes
+        """
+        self.flush_interval = flush_interval or settings.API_KEY_USAGE_FLUSH_SECONDS
+        self._pending: Dict[uuid.UUID, datetime] = {}
+        self._session_factory: Optional[Callable[[], AsyncSession]] = None
+        self._task: Optional[asyncio.Task] = None
+    
+    def touch(self, key_id: uuid.UUID, when: Optional[datetime] = None) -> None:
+        """Record a use of a key."""
+        self._pending[key_id] = when or datetime.utcnow()
+    
+    async def flush(self, session_factory: Optional[Callable[[], AsyncSession]] = None) -> int:
+        """
+        Write pending uses in one statement.
+        
+        Args:
+            session_factory: Session factory (defaults to the recorder's own)
+            
+        Returns:
+            Number of keys updated
+        """
+        if not self._pending:
+            return 0
+        session_factory = session_factory or self._session_factory
+        if session_factory is None:
+            from app.db.session import AsyncSessionLocal
+            session_factory = AsyncSessionLocal
+        
+        pending, self._pending = self._pending, {}
+        table = APIKey.__table__
+        statement = (
+            update(table)
+            .where(table.c.id == bindparam("key_id"))
+            .values(last_used_at=bindparam("used_at"))
+        )
+        try:
+            async with session_factory() as db:
+                await db.execute(
+                    statement, [{"key_id": key_id, "used_at": used_at} for key_id, used_at in pending.items()]
+                )
+                await db.commit()
+        except Exception:
+            # Keep the uses for the next attempt unless newer ones arrived
+            for key_id, used_at in pending.items():
+                self._pending.setdefault(key_id, used_at)
+            raise
+        metrics.increment("auth.api_key.usage_flushed", len(pending))
+        return len(pending)
+    
+    def start(self, session_factory: Optional[Callable[[], AsyncSession]] = None) -> None:
+        """Start periodic flushing on the running event loop."""
+        if self._task is None:
+            self._session_factory = session_factory
+            self._task = asyncio.get_running_loop().create_task(self._run())
+    
+    async def stop(self) -> None:
+        """Stop the flush task and write what is still pending."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        try:
+            await self.flush()
+        except Exception:
+            logger.exception("Final API key usage flush failed")
+    
+    async def _run(self) -> None:
+        """Flush on every interval tick."""
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("API key usage flush failed")
+
+
+# Process-wide recorder, started by the application
+api_key_usage = APIKeyUsageRecorder()
@@ -0,0 +1,67 @@
+"""Service for maintaining content-addressed PRD blobs."""
+
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.prd import PRD
+from app.models.prd_blob import PRDBlob
+
+
+class BlobService:
+    """Service for garbage collecting and auditing PRD blobs."""
+    
+    @staticmethod
+    async def collect_garbage(db: AsyncSession, batch_size: int = 500) -> int:
+        """
+        Delete unreferenced blobs in small batches.
+        
+        Each batch is its own transaction so locks are held briefly. The
+        ``ref_count`` condition is re-checked by the DELETE itself, so a
+        blob re-referenced concurrently is never removed.
+        
+        Args:
+            db: Database session
+            batch_size: Maximum number of blobs deleted per transaction
+            
+        Returns:
+            Number of blobs deleted
+        """
+        total = 0
+        while True:
+            orphans = select(PRDBlob.hash).where(PRDBlob.ref_count <= 0).limit(batch_size)
+            result = await db.execute(
+                delete(PRDBlob)
+                .where(PRDBlob.hash.in_(orphans), PRDBlob.ref_count <= 0)
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+            total += result.rowcount
+            if result.rowcount < batch_size:
+                return total
+    
+    @staticmethod
+    async def recount_references(db: AsyncSession) -> int:
+        """
+        Recompute every blob's reference count from the PRD table.
+        
+        Repairs counts after writes that bypassed the ORM (for example
+        database-level cascades).
+        
+        Args:
+            db: Database session
+            
+        Returns:
+            Number of blobs updated
+        """
+        references = (
+            select(func.count(PRD.id))
+            .where(PRD.content_hash == PRDBlob.hash)
+            .scalar_subquery()
+        )
+        result = await db.execute(
+            update(PRDBlob)
+            .values(ref_count=references)
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+        return result.rowcount
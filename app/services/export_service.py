@@ -0,0 +1,151 @@
+"""Service streaming a user's PRDs as NDJSON or ZIP exports."""
+
+import json
+import re
+import uuid
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, Optional
+
+from sqlalchemy import false, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.compression import decompress_text
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.core.zipstream import ZipStream
+from app.models.prd import PRD
+from app.models.prd_blob import PRDBlob
+from app.schemas.prd import Format
+
+# Columns of an export record, in output order
+EXPORT_FIELDS = (
+    "id", "title", "input_prompt", "template_type", "format", "created_at", "updated_at", "content"
+)
+
+# Suffix of the metadata file written next to each document in ZIP exports
+META_SUFFIX = ".meta.json"
+
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
+
+def document_name(record: Dict[str, Any]) -> str:
+    """
+    Build the ZIP entry name for an exported PRD.
+    
+    Args:
+        record: Export record
+        
+    Returns:
+        Unique, filesystem-safe file name with the format's extension
+    """
+    slug = _SLUG_RE.sub("-", record["title"].lower()).strip("-")[:50] or "prd"
+    extension = "json" if record["format"] == Format.JSON.value else "md"
+    return f"{record['created_at'][:10]}-{slug}-{record['id'][:8]}.{extension}"
+
+
+class PRDExportService:
+    """Service for streaming PRD exports with constant memory."""
+    
+    @staticmethod
+    async def stream_records(
+        db: AsyncSession, user_id: uuid.UUID, batch_size: Optional[int] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield a user's live PRDs, oldest first, as JSON-ready records.
+        
+        Rows come from a server-side cursor ``batch_size`` at a time, and
+        each body is decompressed only while its record is being written.
+        
+        Args:
+            db: Database session
+            user_id: Owner of the PRDs
+            batch_size: Rows fetched per round trip (defaults to PRD_EXPORT_BATCH_SIZE)
+            
+        Yields:
+            Export records with the keys in ``EXPORT_FIELDS``
+        """
+        statement = (
+            select(
+                PRD.id,
+                PRD.title,
+                PRD.input_prompt,
+                PRD.template_type,
+                PRD.format,
+                PRD.created_at,
+                PRD.updated_at,
+                PRDBlob._content,
+            )
+            .join(PRDBlob, PRDBlob.hash == PRD.content_hash)
+            .where(PRD.user_id == user_id, PRD.is_deleted == false())
+            .order_by(PRD.created_at, PRD.id)
+            .execution_options(
+                yield_per=batch_size or settings.PRD_EXPORT_BATCH_SIZE, use_replica=True
+            )
+        )
+        result = await db.stream(statement)
+        try:
+            async for row in result:
+                yield {
+                    "id": str(row.id),
+                    "title": row.title,
+                    "input_prompt": row.input_prompt,
+                    "template_type": row.template_type.value,
+                    "format": row.format.value,
+                    "created_at": row.created_at.isoformat(),
+                    "updated_at": row.updated_at.isoformat(),
+                    "content": decompress_text(row[-1]),
+                }
+        finally:
+            await result.close()
+    
+    @staticmethod
+    async def ndjson_lines(records: AsyncIterator[Dict[str, Any]]) -> AsyncIterator[bytes]:
+        """
+        Encode records as newline-delimited JSON, one line per chunk.
+        
+        Args:
+            records: Export records
+            
+        Yields:
+            UTF-8 encoded lines
+        """
+        count = 0
+        async for record in records:
+            count += 1
+            yield json.dumps(record, ensure_ascii=False).encode("utf-8") + b"\n"
+        metrics.increment("prd.export.rows", count)
+    
+    @staticmethod
+    async def zip_archive(records: AsyncIterator[Dict[str, Any]]) -> AsyncIterator[bytes]:
+        """
+        Encode records as a ZIP archive written entry by entry.
+        
+        Each PRD becomes a ``.md`` or ``.json`` document holding its
+        content, followed by a ``.meta.json`` file with the remaining
+        fields. Entries are yielded as soon as they are compressed and the
+        archive index is spooled to a temporary file (see ``ZipStream``).
+        
+        Args:
+            records: Export records
+            
+        Yields:
+            Consecutive pieces of the archive
+        """
+        archive = ZipStream()
+        count = 0
+        async for record in records:
+            count += 1
+            name = document_name(record)
+            modified = datetime.fromisoformat(record["updated_at"])
+            meta = {key: value for key, value in record.items() if key != "content"}
+            yield (
+                archive.add(name, record["content"].encode("utf-8"), modified)
+                + archive.add(
+                    name + META_SUFFIX,
+                    json.dumps(meta, ensure_ascii=False, indent=2).encode("utf-8"),
+                    modified,
+                )
+            )
+        for chunk in archive.close():
+            yield chunk
+        metrics.increment("prd.export.rows", count)
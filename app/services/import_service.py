@@ -0,0 +1,252 @@
+"""Service importing PRDs from NDJSON or ZIP uploads in batches."""
+
+import asyncio
+import json
+import logging
+import uuid
+import zipfile
+from itertools import islice
+from typing import IO, Any, Iterator, List, Optional, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.models.prd import PRD
+from app.schemas.prd import PRDImportIssue, PRDImportReport, PRDCreate
+from app.services.export_service import META_SUFFIX
+from app.services.prd_service import PRDService
+
+logger = logging.getLogger(__name__)
+
+# Suffixes of ZIP members read as NDJSON
+NDJSON_SUFFIXES = (".ndjson", ".jsonl")
+
+# (location, raw item or parse error)
+ParsedItem = Tuple[str, Any]
+
+
+def _read_lines(stream: IO[bytes], limit: int, chunk_size: int = 64 * 1024) -> Iterator[Optional[bytes]]:
+    """
+    Yield lines from a binary stream without buffering more than ``limit`` bytes.
+    
+    Lines longer than ``limit`` are dropped while reading and yielded as None.
+    Only each new chunk is searched for newlines, and the pieces of a line
+    are joined once, when it ends, so long lines cost linear time.
+    """
+    parts: List[bytes] = []
+    size = 0
+    oversized = False
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        start = 0
+        end = chunk.find(b"\n")
+        while end != -1:
+            if oversized or size + end - start > limit:
+                yield None
+            else:
+                parts.append(chunk[start:end])
+                yield b"".join(parts)
+            parts, size, oversized = [], 0, False
+            start = end + 1
+            end = chunk.find(b"\n", start)
+        if oversized or start == len(chunk):
+            continue
+        size += len(chunk) - start
+        if size > limit:
+            parts, size, oversized = [], 0, True
+        else:
+            parts.append(chunk[start:] if start else chunk)
+    if parts or oversized:
+        yield None if oversized else b"".join(parts)
+
+
+def _error_detail(error: Exception) -> str:
+    """Summarize a parse or validation error on one line."""
+    if isinstance(error, ValidationError):
+        return "; ".join(
+            f"{'.'.join(str(part) for part in item['loc']) or 'item'}: {item['msg']}"
+            for item in error.errors()
+        )
+    return str(error)
+
+
+class PRDImportService:
+    """Service for bulk-importing PRDs with bounded memory."""
+    
+    @staticmethod
+    def iter_ndjson(stream: IO[bytes], limit: Optional[int] = None) -> Iterator[ParsedItem]:
+        """
+        Parse an NDJSON stream line by line.
+        
+        Blank lines are skipped. Lines over ``limit`` bytes are discarded
+        while reading and reported as errors.
+        
+        Args:
+            stream: Binary file object
+            limit: Maximum bytes per line (defaults to PRD_IMPORT_MAX_ITEM_BYTES)
+            
+        Yields:
+            ``("line N", item)`` pairs; ``item`` is the exception when the
+            line is not valid JSON
+        """
+        limit = limit or settings.PRD_IMPORT_MAX_ITEM_BYTES
+        for number, raw in enumerate(_read_lines(stream, limit), start=1):
+            if raw is None:
+                yield f"line {number}", ValueError(f"line exceeds {limit} bytes")
+            elif raw.strip():
+                try:
+                    yield f"line {number}", json.loads(raw)
+                except ValueError as e:
+                    yield f"line {number}", ValueError(f"invalid JSON: {e}")
+    
+    @staticmethod
+    def iter_zip(stream: IO[bytes], limit: Optional[int] = None) -> Iterator[ParsedItem]:
+        """
+        Parse a ZIP upload member by member.
+        
+        ``.ndjson``/``.jsonl`` members are read line by line. Each
+        ``<name>.meta.json`` member (as written by the ZIP export) is an
+        item whose content is the sibling member ``<name>``. Other members
+        are ignored.
+        
+        Args:
+            stream: Seekable binary file object
+            limit: Maximum bytes per item (defaults to PRD_IMPORT_MAX_ITEM_BYTES)
+            
+        Yields:
+            ``(location, item)`` pairs; ``item`` is the exception when the
+            member cannot be read
+        """
+        limit = limit or settings.PRD_IMPORT_MAX_ITEM_BYTES
+        try:
+            archive = zipfile.ZipFile(stream)
+        except zipfile.BadZipFile as e:
+            yield "archive", ValueError(f"not a valid ZIP file: {e}")
+            return
+        
+        with archive:
+            names = set(archive.namelist())
+            for info in archive.infolist():
+                name = info.filename
+                if name.lower().endswith(NDJSON_SUFFIXES):
+                    with archive.open(info) as member:
+                        for location, item in PRDImportService.iter_ndjson(member, limit):
+                            yield f"{name} {location}", item
+                elif name.endswith(META_SUFFIX):
+                    document = name[: -len(META_SUFFIX)]
+                    try:
+                        if document not in names:
+                            raise ValueError(f"missing document {document!r}")
+                        if info.file_size + archive.getinfo(document).file_size > limit:
+                            raise ValueError(f"item exceeds {limit} bytes")
+                        item = json.loads(archive.read(info))
+                        if isinstance(item, dict):
+                            item["content"] = archive.read(document).decode("utf-8")
+                    except (ValueError, zipfile.BadZipFile) as e:
+                        item = e
+                    yield name, item
+    
+    @staticmethod
+    def build(item: Any, user_id: uuid.UUID) -> PRD:
+        """
+        Validate one parsed item and build its PRD.
+        
+        Args:
+            item: Parsed JSON object with the ``PRDCreate`` fields and ``content``
+            user_id: Owner of the imported PRD
+            
+        Returns:
+            Unsaved PRD
+            
+        Raises:
+            ValueError: If the item is not a valid PRD
+        """
+        if not isinstance(item, dict):
+            raise ValueError("item must be a JSON object")
+        content = item.get("content")
+        if not isinstance(content, str) or not content:
+            raise ValueError("content: must be a non-empty string")
+        prd_in = PRDCreate.model_validate(
+            {key: item[key] for key in PRDCreate.model_fields if key in item}
+        )
+        return PRD(
+            title=prd_in.title,
+            input_prompt=prd_in.input_prompt,
+            content=content,
+            format=prd_in.format,
+            template_type=prd_in.template_type,
+            user_id=user_id,
+        )
+    
+    @staticmethod
+    async def run(
+        db: AsyncSession,
+        items: Iterator[ParsedItem],
+        user_id: uuid.UUID,
+        batch_size: Optional[int] = None,
+    ) -> PRDImportReport:
+        """
+        Validate items and insert the valid ones in batches.
+        
+        Items are pulled from ``items`` a batch at a time in a worker
+        thread, so reading and parsing the upload never blocks the event
+        loop and at most one batch is held in memory.
+        Each batch is one transaction with multi-row inserts (see
+        ``PRDService.persist_batch``). When a batch fails, all of its items
+        are reported as failed and the import continues with the next one.
+        At most PRD_IMPORT_MAX_ERRORS errors are listed; ``failed`` counts
+        them all.
+        
+        Args:
+            db: Database session
+            items: Parsed items with their locations
+            user_id: Owner of the imported PRDs
+            batch_size: PRDs per transaction (defaults to PRD_IMPORT_BATCH_SIZE)
+            
+        Returns:
+            Import report
+        """
+        batch_size = batch_size or settings.PRD_IMPORT_BATCH_SIZE
+        report = PRDImportReport()
+        batch: List[Tuple[str, PRD]] = []
+        
+        def fail(location: str, detail: str) -> None:
+            report.failed += 1
+            if len(report.errors) < settings.PRD_IMPORT_MAX_ERRORS:
+                report.errors.append(PRDImportIssue(location=location, detail=detail))
+        
+        async def write() -> None:
+            try:
+                with metrics.timer("prd.import.batch"):
+                    await PRDService.persist_batch(db, [prd for _, prd in batch])
+                report.imported += len(batch)
+            except Exception as e:
+                logger.exception("Import batch of %d PRDs failed", len(batch))
+                await db.rollback()
+                for location, _ in batch:
+                    fail(location, f"batch insert failed: {e.__class__.__name__}")
+            batch.clear()
+        
+        while True:
+            chunk = await asyncio.to_thread(lambda: list(islice(items, batch_size)))
+            for location, item in chunk:
+                try:
+                    if isinstance(item, Exception):
+                        raise item
+                    batch.append((location, PRDImportService.build(item, user_id)))
+                except ValueError as e:
+                    fail(location, _error_detail(e))
+                if len(batch) >= batch_size:
+                    await write()
+            if len(chunk) < batch_size:
+                break
+        if batch:
+            await write()
+        
+        metrics.increment("prd.import.rows", report.imported)
+        metrics.increment("prd.import.failed", report.failed)
+        return report
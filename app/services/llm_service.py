@@ -131,13 +131,28 @@ async def generate_prd_content(
     
     try:
         if provider == ModelProvider.OLLAMA:
-        	return _generate_with_ollama(prompt)
-    	else:
-        	raise ValueError(f"Unsupported provider: {provider}")
+            return _generate_with_ollama(prompt)
+        else:
+            raise ValueError(f"Unsupported provider: {provider}")
     except Exception as e:
         logger.error(f"Error generating PRD content: {str(e)}")
         raise
 
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the number of tokens in generated text.
+    
+    Providers used here do not report usage, so this uses the common
+    approximation of four characters per token.
+    
+    Args:
+        text: Generated text
+        
+    Returns:
+        Estimated token count
+    """
+    return (len(text) + 3) // 4
+
 def _generate_test_content(
     title: str,
     input_prompt: str,
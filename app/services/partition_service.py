@@ -0,0 +1,177 @@
+"""Service maintaining monthly PRD partitions on Postgres."""
+
+import re
+from collections import Counter
+from datetime import date
+from typing import List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.partitions import (
+    DEFAULT_PARTITION,
+    IS_PARTITIONED_SQL,
+    LIST_PARTITIONS_SQL,
+    PARENT_TABLE,
+    add_months,
+    create_partition_sql,
+    default_has_rows_sql,
+    iter_months,
+    month_start,
+    partition_month,
+    partition_name,
+    split_default_partition_sql,
+)
+from app.models.prd_blob import release_blob_references
+from app.schemas.prd import TemplateType
+from app.services.stats_service import StatsService
+
+_SCHEMA_RE = re.compile(r"^[a-z_][a-z0-9_]*$")
+
+
+class PartitionService:
+    """Service for creating and retiring monthly PRD partitions."""
+    
+    @staticmethod
+    async def is_partitioned(db: AsyncSession) -> bool:
+        """
+        Whether the PRD table is partitioned.
+        
+        Always False outside Postgres.
+        
+        Args:
+            db: Database session
+            
+        Returns:
+            True when the partitioning migration has been applied
+        """
+        connection = await db.connection()
+        if connection.dialect.name != "postgresql":
+            return False
+        return bool(await db.scalar(text(IS_PARTITIONED_SQL)))
+    
+    @staticmethod
+    async def list_partitions(db: AsyncSession) -> List[str]:
+        """
+        Return the names of the partitions attached to the PRD table.
+        
+        Args:
+            db: Database session
+            
+        Returns:
+            Partition names, sorted
+        """
+        return list(await db.scalars(text(LIST_PARTITIONS_SQL)))
+    
+    @staticmethod
+    async def ensure_future(
+        db: AsyncSession, months_ahead: Optional[int] = None, today: Optional[date] = None
+    ) -> List[str]:
+        """
+        Create missing partitions from this month up to ``months_ahead``.
+        
+        Rows that already landed in the default partition for a missing
+        month (e.g. after a skipped run) are moved into the new partition.
+        Each month is created in its own transaction.
+        
+        Args:
+            db: Database session
+            months_ahead: Months to cover past the current one
+                (defaults to PRD_PARTITION_MONTHS_AHEAD)
+            today: Reference date (defaults to today)
+            
+        Returns:
+            Names of the partitions created
+        """
+        if months_ahead is None:
+            months_ahead = settings.PRD_PARTITION_MONTHS_AHEAD
+        first = month_start(today or date.today())
+        names = await PartitionService.list_partitions(db)
+        existing = {partition_month(name) for name in names}
+        created = []
+        for month in iter_months(first, add_months(first, months_ahead)):
+            if month in existing:
+                continue
+            if DEFAULT_PARTITION in names and await db.scalar(text(default_has_rows_sql(month))):
+                for statement in split_default_partition_sql(month):
+                    await db.execute(text(statement))
+            else:
+                await db.execute(text(create_partition_sql(month)))
+            await db.commit()
+            created.append(partition_name(month))
+        return created
+    
+    @staticmethod
+    async def detach_before(
+        db: AsyncSession, before: date, archive_schema: Optional[str] = None
+    ) -> List[str]:
+        """
+        Detach every monthly partition that ends on or before ``before``.
+        
+        Detached rows leave the per-user stats and the search index. With
+        ``archive_schema`` the partition is moved into that schema as a
+        plain table and keeps its blob references; otherwise it is dropped
+        and its blob references are released. Each partition is handled in
+        its own transaction.
+        
+        Args:
+            db: Database session
+            before: First month to keep
+            archive_schema: Schema receiving detached partitions, or None to drop them
+            
+        Returns:
+            Names of the partitions detached
+        """
+        if archive_schema is not None and not _SCHEMA_RE.match(archive_schema):
+            raise ValueError(f"Invalid archive schema name: {archive_schema!r}")
+        
+        before = month_start(before)
+        names = [
+            name for name in await PartitionService.list_partitions(db)
+            if (partition_month(name) or before) < before
+        ]
+        if archive_schema is not None and names:
+            await db.execute(text(f"CREATE SCHEMA IF NOT EXISTS {archive_schema}"))
+        
+        for name in names:
+            await PartitionService._retire(db, name, archive_schema)
+            await db.commit()
+        return names
+    
+    @staticmethod
+    async def _retire(db: AsyncSession, name: str, archive_schema: Optional[str]) -> None:
+        """Detach one partition and archive or drop it."""
+        totals = await db.execute(
+            text(
+                f"SELECT p.user_id, p.template_type, count(*) AS prd_count, "
+                f"coalesce(sum(b.size), 0) AS content_bytes FROM {name} p "
+                f"JOIN prd_blob b ON b.hash = p.content_hash "
+                f"WHERE NOT p.is_deleted GROUP BY p.user_id, p.template_type"
+            )
+        )
+        await StatsService.apply(
+            db,
+            {
+                (row.user_id, TemplateType[row.template_type]): [-row.prd_count, -row.content_bytes, 0]
+                for row in totals
+            },
+        )
+        await db.execute(text(f"DELETE FROM prd_search WHERE prd_id IN (SELECT id FROM {name})"))
+        await db.execute(text(f"DELETE FROM prd_revision WHERE prd_id IN (SELECT id FROM {name})"))
+        await db.execute(text(f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {name}"))
+        
+        if archive_schema is not None:
+            await db.execute(text(f"ALTER TABLE {name} SET SCHEMA {archive_schema}"))
+            return
+        
+        released = Counter(
+            {
+                row.content_hash: row.refs
+                for row in await db.execute(
+                    text(f"SELECT content_hash, count(*) AS refs FROM {name} GROUP BY content_hash")
+                )
+            }
+        )
+        await db.run_sync(lambda session: release_blob_references(session.connection(), released))
+        await db.execute(text(f"DROP TABLE {name}"))
@@ -1,31 +1,77 @@
 """Service for managing PRD documents in the database."""
 
-from typing import List, Optional
+from collections import Counter
+from datetime import datetime
+from typing import List, Optional, Sequence, Tuple
 import uuid
-from sqlalchemy.orm import Session
+from sqlalchemy import Row, Select, and_, delete, false, or_, select, true, type_coerce
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 
+from app.db.types import DecodedText
 from app.models.prd import PRD
+from app.models.prd_blob import PRDBlob, release_blob_references
 from app.schemas.prd import PRDCreate, PRDUpdate, Format, TemplateType
+from app.services.llm_service import estimate_tokens
+from app.services.prd_writer import prd_writer
+from app.services.revision_service import RevisionService
+from app.services.search_service import PRDSearchService
+from app.services.stats_service import StatsService
+
+# Columns returned by summary listings (everything except the content body)
+SUMMARY_COLUMNS = (
+    PRD.id,
+    PRD.title,
+    PRD.template_type,
+    PRD.format,
+    PRD.created_at,
+    PRD.content_length,
+    PRD.snippet,
+    # Cache validators (see app.core.http_cache)
+    PRD.content_hash,
+    PRD.updated_at,
+)
+
+# Columns of a full listing row (the PRDResponse fields plus validators)
+RESPONSE_COLUMNS = (
+    PRD.id,
+    PRD.title,
+    type_coerce(PRDBlob._content, DecodedText).label("content"),
+    PRD.format,
+    PRD.created_at,
+    PRD.template_type,
+    PRD.user_id,
+    PRD.content_hash,
+    PRD.updated_at,
+)
+
+# Columns identifying the current version of a PRD, without its content
+VERSION_COLUMNS = (PRD.id, PRD.user_id, PRD.created_at, PRD.content_hash, PRD.updated_at)
 
 
 class PRDService:
     """Service for managing PRD documents."""
     
     @staticmethod
-    def create(
-        db: Session, 
+    async def create(
+        db: AsyncSession, 
         prd_in: PRDCreate, 
         content: str, 
-        user_id: uuid.UUID
+        user_id: uuid.UUID,
+        tokens: Optional[int] = None
     ) -> PRD:
         """
         Create a new PRD document.
         
+        With write-behind enabled the PRD is queued for the next group
+        commit and returned immediately with its pre-assigned ID.
+        
         Args:
             db: Database session
             prd_in: PRD input data
             content: Generated PRD content
             user_id: ID of the user creating the PRD
+            tokens: Tokens spent generating the content (estimated if None)
             
         Returns:
             Created PRD
@@ -39,16 +85,37 @@ class PRDService:
             template_type=prd_in.template_type,
             user_id=user_id
         )
+        db_prd.generated_tokens = tokens if tokens is not None else estimate_tokens(content)
         
-        # Add to database
-        db.add(db_prd)
-        db.commit()
-        db.refresh(db_prd)
+        if prd_writer.running:
+            # Assign what the INSERT would so the response needn't wait for it
+            db_prd.id = uuid.uuid4()
+            db_prd.created_at = db_prd.updated_at = datetime.utcnow()
+            await prd_writer.submit(db_prd)
+            return db_prd
+        
+        # Defaults are client-side, so the committed object needs no refresh
+        await PRDService.persist_batch(db, [db_prd])
         
         return db_prd
     
     @staticmethod
-    def get_by_id(db: Session, prd_id: uuid.UUID) -> Optional[PRD]:
+    async def persist_batch(db: AsyncSession, prds: Sequence[PRD]) -> None:
+        """
+        Insert PRDs, their search index entries and stats in one transaction.
+        
+        Args:
+            db: Database session
+            prds: New PRDs with content assigned
+        """
+        db.add_all(prds)
+        await db.flush()
+        await PRDSearchService.index_new(db, prds)
+        await StatsService.apply(db, StatsService.deltas_for_created(prds))
+        await db.commit()
+    
+    @staticmethod
+    async def get_by_id(db: AsyncSession, prd_id: uuid.UUID) -> Optional[PRD]:
         """
         Get a PRD by ID.
         
@@ -59,28 +126,229 @@ class PRDService:
         Returns:
             PRD if found, None otherwise
         """
-        return db.query(PRD).filter(PRD.id == prd_id).first()
+        # Read-your-writes for rows still queued for write-behind
+        pending = prd_writer.get_pending(prd_id)
+        if pending is not None:
+            return pending
+        
+        # Body comes from the blob table in the same indexed join
+        return await db.scalar(
+            select(PRD)
+            .options(joinedload(PRD.blob))
+            .where(PRD.id == prd_id, PRD.is_deleted == false())
+            .execution_options(use_replica=True)
+        )
+    
+    @staticmethod
+    async def get_version(db: AsyncSession, prd_id: uuid.UUID) -> Optional[Row]:
+        """
+        Get a PRD's owner and cache validators without loading its content.
+        
+        Args:
+            db: Database session
+            prd_id: PRD ID
+            
+        Returns:
+            Row with the ``VERSION_COLUMNS`` fields (or the queued PRD
+            itself), None if not found
+        """
+        pending = prd_writer.get_pending(prd_id)
+        if pending is not None:
+            return pending
+        
+        result = await db.execute(
+            select(*VERSION_COLUMNS)
+            .where(PRD.id == prd_id, PRD.is_deleted == false())
+            .execution_options(use_replica=True)
+        )
+        return result.first()
+    
+    @staticmethod
+    def _user_page_query(
+        query: Select,
+        user_id: uuid.UUID,
+        skip: int,
+        limit: int,
+        cursor: Optional[Tuple[datetime, uuid.UUID]],
+    ) -> Select:
+        """Restrict ``query`` to one page of a user's PRDs, newest first."""
+        # Filter and ordering match the partial ix_prd_user_id_created_at_id;
+        # listings are replica-safe reads
+        query = (
+            query.where(PRD.user_id == user_id, PRD.is_deleted == false())
+            .order_by(PRD.created_at.desc(), PRD.id)
+            .limit(limit)
+            .execution_options(use_replica=True)
+        )
+        if cursor is None:
+            return query.offset(skip)
+        
+        created_at, prd_id = cursor
+        return query.where(
+            or_(
+                PRD.created_at < created_at,
+                and_(PRD.created_at == created_at, PRD.id > prd_id),
+            )
+        )
     
     @staticmethod
-    def get_by_user(db: Session, user_id: uuid.UUID, skip: int = 0, limit: int = 100) -> List[PRD]:
+    def _with_pending(
+        items: List,
+        user_id: uuid.UUID,
+        skip: int,
+        limit: int,
+        cursor: Optional[Tuple[datetime, uuid.UUID]],
+    ) -> List:
+        """Prepend a user's queued PRDs to the first page of a listing."""
+        if skip or cursor is not None:
+            return items
+        pending = prd_writer.pending_for_user(user_id)
+        if not pending:
+            return items
+        seen = {item.id for item in items}
+        return ([prd for prd in pending if prd.id not in seen] + items)[:limit]
+    
+    @staticmethod
+    async def get_by_user(
+        db: AsyncSession,
+        user_id: uuid.UUID,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[Tuple[datetime, uuid.UUID]] = None,
+    ) -> List[PRD]:
         """
-        Get all PRDs for a user.
+        Get all PRDs for a user, newest first.
+        
+        When ``cursor`` is given, keyset pagination is used and ``skip`` is
+        ignored: only rows positioned after the ``(created_at, id)`` cursor
+        are returned, so deep pages cost the same as the first one.
         
         Args:
             db: Database session
             user_id: User ID
-            skip: Number of records to skip
+            skip: Number of records to skip (offset mode)
             limit: Maximum number of records to return
+            cursor: ``(created_at, id)`` of the last row of the previous page
             
         Returns:
             List of PRDs
         """
-        return db.query(PRD).filter(
-            PRD.user_id == user_id
-        ).order_by(PRD.created_at.desc()).offset(skip).limit(limit).all()
+        result = await db.scalars(
+            PRDService._user_page_query(
+                select(PRD).options(joinedload(PRD.blob)), user_id, skip, limit, cursor
+            )
+        )
+        return PRDService._with_pending(list(result), user_id, skip, limit, cursor)
+    
+    @staticmethod
+    async def get_rows_by_user(
+        db: AsyncSession,
+        user_id: uuid.UUID,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[Tuple[datetime, uuid.UUID]] = None,
+    ) -> List[Row]:
+        """
+        Get a page of a user's PRDs as plain rows, newest first.
+        
+        Same page as :meth:`get_by_user`, but selects only the response
+        columns (content decoded in the result processor) without building
+        ORM instances, for responses serialized straight from rows.
+        
+        Args:
+            db: Database session
+            user_id: User ID
+            skip: Number of records to skip (offset mode)
+            limit: Maximum number of records to return
+            cursor: ``(created_at, id)`` of the last row of the previous page
+            
+        Returns:
+            Rows with the ``RESPONSE_COLUMNS`` fields (queued PRDs appear on
+            the first page as model instances)
+        """
+        result = await db.execute(
+            PRDService._user_page_query(
+                select(*RESPONSE_COLUMNS).join(PRDBlob, PRDBlob.hash == PRD.content_hash),
+                user_id,
+                skip,
+                limit,
+                cursor,
+            )
+        )
+        return PRDService._with_pending(list(result.all()), user_id, skip, limit, cursor)
+    
+    @staticmethod
+    async def get_summaries_by_user(
+        db: AsyncSession,
+        user_id: uuid.UUID,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[Tuple[datetime, uuid.UUID]] = None,
+    ) -> List[Row]:
+        """
+        Get lightweight summaries of a user's PRDs, newest first.
+        
+        Only the listing columns are selected, so ``content`` is never read
+        from the database. Pagination works as in :meth:`get_by_user`.
+        
+        Args:
+            db: Database session
+            user_id: User ID
+            skip: Number of records to skip (offset mode)
+            limit: Maximum number of records to return
+            cursor: ``(created_at, id)`` of the last row of the previous page
+            
+        Returns:
+            List of row tuples with the ``SUMMARY_COLUMNS`` fields (queued
+            PRDs appear on the first page as model instances)
+        """
+        result = await db.execute(
+            PRDService._user_page_query(
+                select(*SUMMARY_COLUMNS), user_id, skip, limit, cursor
+            )
+        )
+        return PRDService._with_pending(list(result.all()), user_id, skip, limit, cursor)
+    
+    @staticmethod
+    async def get_versions_by_user(
+        db: AsyncSession,
+        user_id: uuid.UUID,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[Tuple[datetime, uuid.UUID]] = None,
+    ) -> List[Row]:
+        """
+        Get the cache validators of one page of a user's PRDs.
+        
+        Selects the same page as :meth:`get_by_user` from the listing index
+        without touching content, so a conditional request can be answered
+        before the page itself is loaded.
+        
+        Args:
+            db: Database session
+            user_id: User ID
+            skip: Number of records to skip (offset mode)
+            limit: Maximum number of records to return
+            cursor: ``(created_at, id)`` of the last row of the previous page
+            
+        Returns:
+            Rows with the ``VERSION_COLUMNS`` fields
+        """
+        result = await db.execute(
+            PRDService._user_page_query(select(*VERSION_COLUMNS), user_id, skip, limit, cursor)
+        )
+        return PRDService._with_pending(list(result.all()), user_id, skip, limit, cursor)
     
     @staticmethod
-    def update(db: Session, db_prd: PRD, prd_in: PRDUpdate) -> PRD:
+    async def _attach(db: AsyncSession, db_prd: PRD) -> Optional[PRD]:
+        """Return ``db_prd`` loaded in ``db``, committing it first if queued."""
+        if db_prd in db:
+            return db_prd
+        await prd_writer.flush()
+        return await db.get(PRD, db_prd.id, options=[joinedload(PRD.blob)])
+    
+    @staticmethod
+    async def update(db: AsyncSession, db_prd: PRD, prd_in: PRDUpdate) -> PRD:
         """
         Update a PRD.
         
@@ -92,25 +360,96 @@ class PRDService:
         Returns:
             Updated PRD
         """
+        db_prd = await PRDService._attach(db, db_prd)
+        if db_prd is None:
+            raise ValueError("PRD could not be saved")
+        
+        changes = prd_in.dict(exclude_unset=True)
+        if "content" in changes and changes["content"] == db_prd.content:
+            del changes["content"]
+        old_key = (db_prd.user_id, db_prd.template_type)
+        old_bytes = await StatsService.content_bytes(db, db_prd) if "content" in changes else 0
+        old_content = db_prd.content if "content" in changes else None
+        
         # Update attributes
-        for field, value in prd_in.dict(exclude_unset=True).items():
+        for field, value in changes.items():
             setattr(db_prd, field, value)
         
-        # Commit changes
+        # Commit changes, re-indexing if searchable text changed
         db.add(db_prd)
-        db.commit()
-        db.refresh(db_prd)
+        if old_content is not None:
+            await RevisionService.record(db, db_prd, old_content)
+        if "title" in changes or "content" in changes:
+            await PRDSearchService.index(db, db_prd, db_prd.content)
+        if "template_type" in changes or "content" in changes:
+            new_key = (db_prd.user_id, db_prd.template_type)
+            new_bytes = await StatsService.content_bytes(db, db_prd) if "content" in changes else 0
+            deltas = {old_key: [-1, -old_bytes, 0]}
+            delta = deltas.setdefault(new_key, [0, 0, 0])
+            delta[0] += 1
+            delta[1] += new_bytes
+            await StatsService.apply(db, deltas)
+        await db.commit()
         
         return db_prd
     
     @staticmethod
-    def delete(db: Session, db_prd: PRD) -> None:
+    async def delete(db: AsyncSession, db_prd: PRD) -> None:
         """
-        Delete a PRD.
+        Soft-delete a PRD.
+        
+        The row is hidden from reads and search immediately; the purge
+        worker hard-deletes it after the retention period.
         
         Args:
             db: Database session
             db_prd: PRD model to delete
         """
-        db.delete(db_prd)
-        db.commit()
+        db_prd = await PRDService._attach(db, db_prd)
+        if db_prd is None or db_prd.is_deleted:
+            return
+        size = await StatsService.content_bytes(db, db_prd)
+        await StatsService.apply(db, {(db_prd.user_id, db_prd.template_type): [-1, -size, 0]})
+        db_prd.is_deleted = True
+        db_prd.deleted_at = datetime.utcnow()
+        await PRDSearchService.remove(db, db_prd.id)
+        await db.commit()
+    
+    @staticmethod
+    async def purge_deleted(db: AsyncSession, deleted_before: datetime, batch_size: int = 200) -> int:
+        """
+        Hard-delete one batch of PRDs soft-deleted before a cutoff.
+        
+        Blob references and revision history held by the purged rows are
+        released in the same transaction.
+        
+        Args:
+            db: Database session
+            deleted_before: Only rows with ``deleted_at`` before this are purged
+            batch_size: Maximum number of rows deleted
+            
+        Returns:
+            Number of PRDs deleted (0 when nothing is left to purge)
+        """
+        expired = and_(PRD.is_deleted == true(), PRD.deleted_at < deleted_before)
+        rows = (
+            await db.execute(
+                select(PRD.id, PRD.content_hash)
+                .where(expired)
+                .order_by(PRD.deleted_at)
+                .limit(batch_size)
+            )
+        ).all()
+        if not rows:
+            return 0
+        
+        await db.execute(
+            delete(PRD)
+            .where(PRD.id.in_([row.id for row in rows]), expired)
+            .execution_options(synchronize_session=False)
+        )
+        await RevisionService.delete_for(db, [row.id for row in rows])
+        released = Counter(row.content_hash for row in rows)
+        await db.run_sync(lambda session: release_blob_references(session.connection(), released))
+        await db.commit()
+        return len(rows)
@@ -0,0 +1,298 @@
+"""Write-behind persistence for generated PRDs with group commit."""
+
+import asyncio
+import json
+import logging
+import os
+import uuid
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy.exc import DBAPIError, InterfaceError, OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.models.prd import PRD
+
+logger = logging.getLogger(__name__)
+
+# Queue sentinel asking the writer task to drain and exit
+_STOP = object()
+
+
+class PRDWriteBehind:
+    """
+    Queue of PRDs persisted by a single writer task in group commits.
+    
+    ``submit`` returns as soon as the PRD is queued. The writer commits
+    queued rows in one transaction once ``max_batch`` rows are waiting or
+    ``flush_interval`` seconds have passed since the first of them, so
+    concurrent generations share a single write lock acquisition.
+    
+    Queued rows stay visible to this process through ``get_pending`` and
+    ``pending_for_user`` until they are committed. Writes failing with
+    transient errors are retried with backoff; rows that cannot be written
+    go to an NDJSON dead-letter file that ``/prd/import`` accepts. ``stop``
+    drains the queue, so a graceful shutdown loses nothing; rows still
+    queued when the process crashes are lost, which is why the mode is
+    opt-in.
+    """
+    
+    def __init__(
+        self,
+        max_batch: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+        max_queue: Optional[int] = None,
+        retry_base: Optional[float] = None,
+        retry_max: Optional[float] = None,
+        dead_letter_path: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize an idle writer.
+        
+        Args:
+            max_batch: Maximum rows per group commit
+            flush_interval: Maximum seconds a queued row waits for its batch
+            max_queue: Queue bound; ``submit`` waits when it is reached
+            retry_base: Seconds before the first retry of a failed write
+            retry_max: Longest wait between retries
+            dead_letter_path: File receiving rows that cannot be written
+        """
+        self.max_batch = max_batch or settings.PRD_WRITE_BATCH_SIZE
+        self.flush_interval = (
+            flush_interval if flush_interval is not None
+            else settings.PRD_WRITE_FLUSH_INTERVAL_MS / 1000
+        )
+        self.max_queue = max_queue or settings.PRD_WRITE_QUEUE_SIZE
+        self.retry_base = (
+            retry_base if retry_base is not None else settings.PRD_WRITE_RETRY_BASE_MS / 1000
+        )
+        self.retry_max = retry_max if retry_max is not None else settings.PRD_WRITE_RETRY_MAX_MS / 1000
+        self.dead_letter_path = dead_letter_path or settings.PRD_WRITE_DEAD_LETTER_PATH
+        self._session_factory: Optional[Callable[[], AsyncSession]] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._closing = False
+        self._wake: Optional[asyncio.Event] = None
+        self._pending: Dict[uuid.UUID, PRD] = {}
+    
+    @property
+    def running(self) -> bool:
+        """Whether the writer accepts new rows."""
+        return self._task is not None and not self._closing
+    
+    def start(self, session_factory: Optional[Callable[[], AsyncSession]] = None) -> None:
+        """
+        Start the writer task on the running event loop.
+        
+        Args:
+            session_factory: Session factory for writes (defaults to the primary)
+        """
+        if self._task is not None:
+            return
+        if session_factory is None:
+            from app.db.session import AsyncSessionLocal
+            session_factory = AsyncSessionLocal
+        self._session_factory = session_factory
+        self._queue = asyncio.Queue(maxsize=self.max_queue)
+        self._closing = False
+        self._wake = asyncio.Event()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+        metrics.gauge("prd.write_behind.pending", lambda: len(self._pending))
+    
+    async def stop(self) -> None:
+        """
+        Commit everything queued, then stop the writer task.
+        
+        A pending retry is attempted once more at once; rows that still
+        fail are dead-lettered.
+        """
+        if self._task is None:
+            return
+        self._closing = True
+        self._wake.set()
+        await self._queue.put(_STOP)
+        await self._task
+        self._task = None
+        self._queue = None
+    
+    async def submit(self, prd: PRD) -> None:
+        """
+        Queue a PRD for insertion.
+        
+        The PRD must already carry its id, timestamps and content. Waits
+        only when the queue is full.
+        
+        Args:
+            prd: Transient PRD to persist
+        """
+        if not self.running:
+            raise RuntimeError("PRD write-behind is not running")
+        self._pending[prd.id] = prd
+        await self._queue.put(prd)
+        metrics.increment("prd.write_behind.enqueued")
+    
+    async def flush(self) -> None:
+        """Wait until every row queued so far has been written."""
+        if self._queue is not None:
+            await self._queue.join()
+    
+    def get_pending(self, prd_id: uuid.UUID) -> Optional[PRD]:
+        """Return a queued, not yet committed PRD by ID."""
+        return self._pending.get(prd_id)
+    
+    def pending_for_user(self, user_id: uuid.UUID) -> List[PRD]:
+        """Return a user's queued PRDs, newest first."""
+        prds = [prd for prd in self._pending.values() if prd.user_id == user_id]
+        return sorted(prds, key=lambda prd: (prd.created_at, prd.id), reverse=True)
+    
+    async def _run(self) -> None:
+        """Collect queued rows into batches and write them until stopped."""
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not (stopping and self._queue.empty()):
+            batch: List[PRD] = []
+            taken = 0
+            item = self._queue.get_nowait() if stopping else await self._queue.get()
+            deadline = loop.time() + self.flush_interval
+            while True:
+                taken += 1
+                if item is _STOP:
+                    stopping = True
+                else:
+                    batch.append(item)
+                if len(batch) >= self.max_batch:
+                    break
+                if stopping:
+                    # Drain whatever was queued ahead of shutdown
+                    if self._queue.empty():
+                        break
+                    item = self._queue.get_nowait()
+                    continue
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+            
+            if batch:
+                await self._write(batch)
+            for _ in range(taken):
+                self._queue.task_done()
+    
+    async def _write(self, batch: List[PRD]) -> None:
+        """
+        Commit a batch, retrying rows that fail transiently.
+        
+        Transient failures (lost connections, timeouts, locks) are retried
+        with exponential backoff for as long as the writer runs; the rows
+        stay readable through ``get_pending`` meanwhile. Rows failing with
+        any other error, and rows still failing when the writer stops, are
+        appended to the dead-letter file instead of being discarded.
+        """
+        with metrics.timer("prd.write_behind.commit"):
+            failures = await self._persist(batch)
+        delay = self.retry_base
+        lost = 0
+        while failures:
+            if self._closing:
+                lost += await self._dead_letter(failures)
+                break
+            lost += await self._dead_letter(
+                [failure for failure in failures if not _is_transient(failure[1])]
+            )
+            retry = [prd for prd, error in failures if _is_transient(error)]
+            if not retry:
+                break
+            logger.warning(
+                "Writing %d queued PRDs failed (%s); retrying in %.1fs", len(retry), failures[0][1], delay
+            )
+            metrics.increment("prd.write_behind.retries", len(retry))
+            try:
+                await asyncio.wait_for(self._wake.wait(), delay)
+            except asyncio.TimeoutError:
+                pass
+            delay = min(delay * 2, self.retry_max)
+            failures = await self._persist(retry)
+        
+        for prd in batch:
+            self._pending.pop(prd.id, None)
+        metrics.increment("prd.write_behind.batches")
+        metrics.increment("prd.write_behind.written", len(batch) - lost)
+    
+    async def _persist(self, batch: List[PRD]) -> List[Tuple[PRD, Exception]]:
+        """Commit a batch, falling back to row-at-a-time; return the failed rows."""
+        from app.services.prd_service import PRDService
+        
+        try:
+            async with self._session_factory() as db:
+                await PRDService.persist_batch(db, batch)
+            return []
+        except Exception as e:
+            if len(batch) == 1:
+                return [(batch[0], e)]
+            logger.exception("Group commit of %d PRDs failed; retrying individually", len(batch))
+        
+        failures = []
+        for prd in batch:
+            try:
+                async with self._session_factory() as db:
+                    await PRDService.persist_batch(db, [prd])
+            except Exception as e:
+                failures.append((prd, e))
+        return failures
+    
+    async def _dead_letter(self, failures: List[Tuple[PRD, Exception]]) -> int:
+        """Append rows that cannot be written to the dead-letter file; return their count."""
+        if not failures:
+            return 0
+        records = [_dead_letter_record(prd, error) for prd, error in failures]
+        try:
+            await asyncio.to_thread(_append_lines, self.dead_letter_path, records)
+        except Exception:
+            # Last resort: the log is the only copy left
+            logger.exception("Could not write the dead-letter file; lost PRDs follow")
+            for record in records:
+                logger.error("Lost queued PRD: %s", record)
+        else:
+            for prd, error in failures:
+                logger.error("Dead-lettered queued PRD %s to %s: %s", prd.id, self.dead_letter_path, error)
+        metrics.increment("prd.write_behind.dead_lettered", len(failures))
+        return len(failures)
+
+
+def _is_transient(error: Exception) -> bool:
+    """Whether a write error may go away on its own (connection, timeout, lock)."""
+    if isinstance(error, DBAPIError) and error.connection_invalidated:
+        return True
+    return isinstance(error, (OperationalError, InterfaceError, OSError, asyncio.TimeoutError))
+
+
+def _dead_letter_record(prd: PRD, error: Exception) -> Dict[str, Any]:
+    """Serialize a queued PRD as an importable NDJSON record."""
+    return {
+        "id": str(prd.id),
+        "user_id": str(prd.user_id),
+        "created_at": prd.created_at.isoformat(),
+        "title": prd.title,
+        "input_prompt": prd.input_prompt,
+        "format": prd.format.value,
+        "template_type": prd.template_type.value,
+        "content": prd.pending_content(),
+        "error": f"{type(error).__name__}: {error}",
+    }
+
+
+def _append_lines(path: str, records: List[Dict[str, Any]]) -> None:
+    """Append records to an NDJSON file and flush them to disk."""
+    with open(path, "a", encoding="utf-8") as file:
+        for record in records:
+            file.write(json.dumps(record) + "\n")
+        file.flush()
+        os.fsync(file.fileno())
+
+
+# Process-wide writer, started by the application when PRD_WRITE_BEHIND is set
+prd_writer = PRDWriteBehind()
@@ -0,0 +1,81 @@
+"""Cache of authenticated users, keyed by user id."""
+
+import uuid
+from typing import Any, Dict, Optional
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import make_transient_to_detached
+
+from app.core.cache import InvalidationChannel, TTLCache
+from app.core.config import settings
+from app.models.user import User
+
+# Column attributes copied into cache entries
+_FIELDS = tuple(attr.key for attr in inspect(User).column_attrs)
+
+
+class PrincipalCache:
+    """
+    TTL/LRU cache of the users behind access tokens.
+    
+    Entries hold plain column values; every ``get`` builds a fresh detached
+    ``User``, so requests never share an instance and an endpoint can still
+    ``db.add`` the current user to update it. ``UserService`` invalidates
+    entries on every change; with ``REDIS_URL`` set the invalidation is
+    also broadcast to other workers, otherwise they catch up within the TTL.
+    """
+    
+    def __init__(
+        self,
+        max_size: Optional[int] = None,
+        ttl: Optional[float] = None,
+        channel: Optional[InvalidationChannel] = None,
+    ) -> None:
+        """
+        Initialize an empty cache from settings, with optional overrides.
+        
+        Args:
+            max_size: Maximum cached users (0 disables caching)
+            ttl: Seconds a cached user is trusted
+            channel: Cross-worker invalidation channel
+        """
+        self._cache: TTLCache[uuid.UUID, Dict[str, Any]] = TTLCache(
+            "principal",
+            max_size if max_size is not None else settings.PRINCIPAL_CACHE_MAX_SIZE,
+            ttl if ttl is not None else settings.PRINCIPAL_CACHE_TTL_SECONDS,
+        )
+        self.channel = channel or InvalidationChannel(settings.PRINCIPAL_CACHE_CHANNEL, settings.REDIS_URL)
+        self.channel.subscribe(self._on_invalidation)
+    
+    def get(self, user_id: uuid.UUID) -> Optional[User]:
+        """Return a detached copy of a cached user, or None."""
+        values = self._cache.get(user_id)
+        if values is None:
+            return None
+        user = User(**values)
+        make_transient_to_detached(user)
+        return user
+    
+    def put(self, user: User) -> None:
+        """Cache a freshly loaded user."""
+        self._cache.set(user.id, {key: getattr(user, key) for key in _FIELDS})
+    
+    async def invalidate(self, user_id: uuid.UUID) -> None:
+        """Drop a user here and, when configured, in every other worker."""
+        self._cache.invalidate(user_id)
+        await self.channel.publish(str(user_id))
+    
+    def clear(self) -> None:
+        """Drop every cached user in this process."""
+        self._cache.clear()
+    
+    def _on_invalidation(self, key: str) -> None:
+        """Apply an invalidation received from another worker."""
+        if key == "*":
+            self._cache.clear()
+        else:
+            self._cache.invalidate(uuid.UUID(key))
+
+
+# Process-wide cache used by ``UserService.get_principal``
+principal_cache = PrincipalCache()
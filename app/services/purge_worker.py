@@ -0,0 +1,149 @@
+"""Background worker hard-deleting soft-deleted PRDs."""
+
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Callable, Optional, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+
+def parse_window(window: str) -> Optional[Tuple[int, int]]:
+    """
+    Parse an off-peak window of UTC hours.
+    
+    Args:
+        window: ``"start-end"`` hours, e.g. ``"1-5"`` or ``"22-4"``; empty
+            means no restriction
+            
+    Returns:
+        ``(start, end)`` hours, or None when unrestricted
+    """
+    if not window.strip():
+        return None
+    start, _, end = window.partition("-")
+    hours = int(start), int(end)
+    if not all(0 <= hour <= 24 for hour in hours):
+        raise ValueError(f"Invalid purge window: {window!r}")
+    return hours
+
+
+class PRDPurgeWorker:
+    """
+    Periodically purges soft-deleted PRDs in small, throttled batches.
+    
+    Each batch is its own short transaction, followed by a pause so the
+    purge never monopolizes the database. Runs only inside the configured
+    off-peak window.
+    """
+    
+    def __init__(
+        self,
+        retention: Optional[timedelta] = None,
+        batch_size: Optional[int] = None,
+        batch_pause: Optional[float] = None,
+        interval: Optional[float] = None,
+        window: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize the worker from settings, with optional overrides.
+        
+        Args:
+            retention: How long soft-deleted rows are kept
+            batch_size: Rows hard-deleted per transaction
+            batch_pause: Seconds to sleep between batches
+            interval: Seconds between purge runs
+            window: Off-peak window of UTC hours (see ``parse_window``)
+        """
+        self.retention = retention or timedelta(days=settings.PRD_PURGE_RETENTION_DAYS)
+        self.batch_size = batch_size or settings.PRD_PURGE_BATCH_SIZE
+        self.batch_pause = (
+            batch_pause if batch_pause is not None else settings.PRD_PURGE_BATCH_PAUSE_MS / 1000
+        )
+        self.interval = interval or settings.PRD_PURGE_INTERVAL_SECONDS
+        self.window = parse_window(settings.PRD_PURGE_WINDOW if window is None else window)
+        self._session_factory: Optional[Callable[[], AsyncSession]] = None
+        self._task: Optional[asyncio.Task] = None
+    
+    def in_window(self, now: Optional[datetime] = None) -> bool:
+        """Whether purging is allowed at ``now`` (UTC)."""
+        if self.window is None:
+            return True
+        hour = (now or datetime.utcnow()).hour
+        start, end = self.window
+        if start <= end:
+            return start <= hour < end
+        return hour >= start or hour < end
+    
+    async def run_once(
+        self,
+        session_factory: Optional[Callable[[], AsyncSession]] = None,
+        respect_window: bool = True,
+    ) -> int:
+        """
+        Purge expired rows batch by batch until none are left.
+        
+        Args:
+            session_factory: Session factory (defaults to the worker's own)
+            respect_window: Stop once the off-peak window closes
+            
+        Returns:
+            Number of PRDs hard-deleted
+        """
+        from app.services.prd_service import PRDService
+        
+        session_factory = session_factory or self._session_factory
+        if session_factory is None:
+            from app.db.session import AsyncSessionLocal
+            session_factory = AsyncSessionLocal
+        
+        cutoff = datetime.utcnow() - self.retention
+        total = 0
+        while not respect_window or self.in_window():
+            with metrics.timer("prd.purge.batch"):
+                async with session_factory() as db:
+                    purged = await PRDService.purge_deleted(db, cutoff, self.batch_size)
+            total += purged
+            metrics.increment("prd.purge.deleted", purged)
+            if purged < self.batch_size:
+                break
+            await asyncio.sleep(self.batch_pause)
+        return total
+    
+    def start(self, session_factory: Optional[Callable[[], AsyncSession]] = None) -> None:
+        """Start the periodic purge task on the running event loop."""
+        if self._task is None:
+            self._session_factory = session_factory
+            self._task = asyncio.get_running_loop().create_task(self._run())
+    
+    async def stop(self) -> None:
+        """Cancel the purge task; an interrupted batch is rolled back."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+    
+    async def _run(self) -> None:
+        """Purge on every interval tick inside the window."""
+        while True:
+            try:
+                if self.in_window():
+                    purged = await self.run_once()
+                    if purged:
+                        logger.info("Purged %d soft-deleted PRDs", purged)
+            except Exception:
+                logger.exception("PRD purge run failed")
+            await asyncio.sleep(self.interval)
+
+
+# Process-wide worker, started by the application when PRD_PURGE_ENABLED is set
+purge_worker = PRDPurgeWorker()
@@ -0,0 +1,221 @@
+"""Service storing and reconstructing PRD content revisions."""
+
+import uuid
+from datetime import datetime
+from typing import Iterable, List, Optional
+
+from sqlalchemy import Row, delete, func, select, true, type_coerce
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.compression import decompress_text
+from app.core.config import settings
+from app.core.delta import apply_delta, make_delta
+from app.db.types import DecodedText
+from app.models.prd import PRD
+from app.models.prd_blob import PRDBlob, content_hash
+from app.models.prd_revision import PRDRevision
+from app.schemas.prd import PRDRevisionInfo, PRDRevisionResponse
+
+# Columns listed for a PRD's history (everything except the stored data)
+INFO_COLUMNS = (
+    PRDRevision.number,
+    PRDRevision.content_hash,
+    PRDRevision.size,
+    PRDRevision.created_at,
+)
+
+
+class RevisionService:
+    """
+    Service for PRD revision history.
+    
+    The newest revision is stored in full; each older one is stored as a
+    delta against its successor, except every ``interval``-th revision,
+    which stays a full checkpoint. Reconstructing revision ``n`` therefore
+    reads at most ``interval`` rows and applies at most ``interval - 1``
+    deltas, however long the history is.
+    """
+    
+    @staticmethod
+    async def record(
+        db: AsyncSession,
+        prd: PRD,
+        previous: str,
+        interval: Optional[int] = None,
+    ) -> int:
+        """
+        Append a PRD's newly assigned content as its latest revision.
+        
+        The first recorded change also stores ``previous`` as revision 1,
+        so PRDs that are never edited carry no history rows. Runs in the
+        caller's transaction.
+        
+        Args:
+            db: Database session
+            prd: PRD whose content was just assigned
+            previous: Content before the change
+            interval: Checkpoint interval (defaults to the setting)
+            
+        Returns:
+            Number of the new revision
+        """
+        interval = interval or settings.PRD_REVISION_CHECKPOINT_INTERVAL
+        current = prd.pending_content()
+        
+        latest = await db.scalar(
+            select(PRDRevision)
+            .where(PRDRevision.prd_id == prd.id)
+            .order_by(PRDRevision.number.desc())
+            .limit(1)
+        )
+        if latest is None:
+            latest = RevisionService._full(prd.id, 1, previous, prd.created_at)
+            db.add(latest)
+        else:
+            previous = decompress_text(latest.data)
+        
+        # The previous head becomes a delta unless it is a checkpoint
+        if latest.number % interval:
+            latest.data = make_delta(current, previous)
+            latest.is_full = False
+        
+        number = latest.number + 1
+        db.add(RevisionService._full(prd.id, number, current, datetime.utcnow()))
+        return number
+    
+    @staticmethod
+    def _full(prd_id: uuid.UUID, number: int, text: str, created_at: datetime) -> PRDRevision:
+        """Build a revision row holding ``text`` in full."""
+        return PRDRevision(
+            prd_id=prd_id,
+            number=number,
+            is_full=True,
+            data=text,
+            content_hash=content_hash(text),
+            size=len(text.encode("utf-8")),
+            created_at=created_at,
+        )
+    
+    @staticmethod
+    async def list_revisions(db: AsyncSession, prd: Row) -> List[PRDRevisionInfo]:
+        """
+        List a PRD's revisions, oldest first.
+        
+        A PRD without history has a single revision: its current content.
+        
+        Args:
+            db: Database session
+            prd: PRD or version row (``PRDService.get_version``)
+            
+        Returns:
+            Revision metadata
+        """
+        rows = (
+            await db.execute(
+                select(*INFO_COLUMNS)
+                .where(PRDRevision.prd_id == prd.id)
+                .order_by(PRDRevision.number)
+            )
+        ).all()
+        if rows:
+            return [PRDRevisionInfo.model_validate(row) for row in rows]
+        
+        if isinstance(prd, PRD):
+            size = len(prd.content.encode("utf-8"))
+        else:
+            size = await db.scalar(select(PRDBlob.size).where(PRDBlob.hash == prd.content_hash))
+        return [
+            PRDRevisionInfo(
+                number=1,
+                content_hash=prd.content_hash,
+                size=size or 0,
+                created_at=prd.created_at,
+            )
+        ]
+    
+    @staticmethod
+    async def get_revision(db: AsyncSession, prd: Row, number: int) -> Optional[PRDRevisionResponse]:
+        """
+        Reconstruct one revision of a PRD.
+        
+        Reads the rows from ``number`` up to the nearest full revision in
+        one query and applies their deltas newest to oldest.
+        
+        Args:
+            db: Database session
+            prd: PRD or version row (``PRDService.get_version``)
+            number: Revision number
+            
+        Returns:
+            The revision with its content, or None if it does not exist
+        """
+        if number < 1:
+            return None
+        
+        checkpoint = (
+            select(func.min(PRDRevision.number))
+            .where(
+                PRDRevision.prd_id == prd.id,
+                PRDRevision.is_full == true(),
+                PRDRevision.number >= number,
+            )
+            .scalar_subquery()
+        )
+        rows = (
+            await db.execute(
+                select(*INFO_COLUMNS, type_coerce(PRDRevision.data, DecodedText).label("data"))
+                .where(
+                    PRDRevision.prd_id == prd.id,
+                    PRDRevision.number >= number,
+                    PRDRevision.number <= checkpoint,
+                )
+                .order_by(PRDRevision.number.desc())
+            )
+        ).all()
+        
+        if not rows:
+            if number != 1 or await db.scalar(
+                select(PRDRevision.number).where(PRDRevision.prd_id == prd.id).limit(1)
+            ):
+                return None
+            if isinstance(prd, PRD):
+                content = prd.content
+            else:
+                blob = await db.scalar(select(PRDBlob).where(PRDBlob.hash == prd.content_hash))
+                if blob is None:
+                    return None
+                content = blob.text
+            return PRDRevisionResponse(
+                number=1,
+                content_hash=prd.content_hash,
+                size=len(content.encode("utf-8")),
+                created_at=prd.created_at,
+                content=content,
+            )
+        
+        text = rows[0].data
+        for row in rows[1:]:
+            text = apply_delta(text, row.data)
+        target = rows[-1]
+        return PRDRevisionResponse(
+            number=target.number,
+            content_hash=target.content_hash,
+            size=target.size,
+            created_at=target.created_at,
+            content=text,
+        )
+    
+    @staticmethod
+    async def delete_for(db: AsyncSession, prd_ids: Iterable[uuid.UUID]) -> None:
+        """
+        Delete the history of the given PRDs in the caller's transaction.
+        
+        Args:
+            db: Database session
+            prd_ids: IDs of PRDs being hard-deleted
+        """
+        await db.execute(
+            delete(PRDRevision)
+            .where(PRDRevision.prd_id.in_(list(prd_ids)))
+            .execution_options(synchronize_session=False)
+        )
@@ -0,0 +1,264 @@
+"""Full-text search over PRD history."""
+
+import re
+import uuid
+from typing import List, Sequence
+
+from sqlalchemy import Row, column, delete, desc, func, insert, literal_column, select, table
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.prd import PRD
+
+# Highlight markers wrapped around matched terms
+HIGHLIGHT_START = "<mark>"
+HIGHLIGHT_END = "</mark>"
+
+# Number of tokens shown in a content snippet
+SNIPPET_TOKENS = 24
+
+# Upper bound on query terms passed to the index
+MAX_QUERY_TERMS = 16
+
+_TERM_RE = re.compile(r"\w+", re.UNICODE)
+
+# Text search configuration; inlined so drivers never send it as varchar
+_TS_CONFIG = literal_column("'english'::regconfig")
+
+prd_fts = table(
+    "prd_fts",
+    column("rowid"),
+    column("title"),
+    column("content"),
+    column("owner"),
+    column("prd_id"),
+    column("rank"),
+)
+
+prd_search = table(
+    "prd_search",
+    column("prd_id"),
+    column("user_id"),
+    column("title"),
+    column("body"),
+    column("document"),
+)
+
+
+class PRDSearchService:
+    """Service maintaining and querying the PRD full-text index."""
+    
+    @staticmethod
+    def _dialect(db: AsyncSession) -> str:
+        """Return the database dialect name for a session."""
+        return db.get_bind().dialect.name
+    
+    @staticmethod
+    def fts_rowid(prd_id: uuid.UUID) -> int:
+        """Derive a stable positive 63-bit FTS5 rowid from a PRD UUID."""
+        return prd_id.int >> 65
+    
+    @staticmethod
+    def build_match_expression(query: str) -> str:
+        """
+        Turn free text into a safe FTS5 MATCH expression.
+        
+        Every word becomes a quoted term (implicitly AND-ed) and the last one
+        is prefix-matched so results update while the user is typing.
+        
+        Args:
+            query: Raw user search text
+            
+        Returns:
+            FTS5 expression, or an empty string if the query has no words
+        """
+        terms = _TERM_RE.findall(query)[:MAX_QUERY_TERMS]
+        if not terms:
+            return ""
+        quoted = [f'"{term}"' for term in terms]
+        quoted[-1] += "*"
+        return " ".join(quoted)
+    
+    @staticmethod
+    async def index(db: AsyncSession, prd: PRD, content: str) -> None:
+        """
+        Add or replace a PRD in the search index.
+        
+        Runs in the caller's transaction; the caller commits.
+        
+        Args:
+            db: Database session
+            prd: PRD to index (must have an id)
+            content: Plain-text PRD content
+        """
+        await PRDSearchService.remove(db, prd.id)
+        if PRDSearchService._dialect(db) == "postgresql":
+            await db.execute(
+                insert(prd_search).values(
+                    prd_id=prd.id, user_id=prd.user_id, title=prd.title, body=content
+                )
+            )
+        else:
+            await db.execute(
+                insert(prd_fts).values(
+                    rowid=PRDSearchService.fts_rowid(prd.id),
+                    title=prd.title,
+                    content=content,
+                    owner=prd.user_id.hex,
+                    prd_id=prd.id.hex,
+                )
+            )
+    
+    @staticmethod
+    async def index_new(db: AsyncSession, prds: Sequence[PRD]) -> None:
+        """
+        Add newly created PRDs to the search index in one executemany.
+        
+        Unlike ``index`` nothing is removed first, so the PRDs must not be
+        indexed yet. Runs in the caller's transaction; the caller commits.
+        
+        Args:
+            db: Database session
+            prds: New PRDs with content assigned in this session
+        """
+        if not prds:
+            return
+        if PRDSearchService._dialect(db) == "postgresql":
+            rows = [
+                {"prd_id": prd.id, "user_id": prd.user_id, "title": prd.title, "body": prd.content}
+                for prd in prds
+            ]
+            await db.execute(insert(prd_search), rows)
+        else:
+            rows = [
+                {
+                    "rowid": PRDSearchService.fts_rowid(prd.id),
+                    "title": prd.title,
+                    "content": prd.content,
+                    "owner": prd.user_id.hex,
+                    "prd_id": prd.id.hex,
+                }
+                for prd in prds
+            ]
+            await db.execute(insert(prd_fts), rows)
+    
+    @staticmethod
+    async def remove(db: AsyncSession, prd_id: uuid.UUID) -> None:
+        """
+        Remove a PRD from the search index.
+        
+        Args:
+            db: Database session
+            prd_id: ID of the PRD to remove
+        """
+        if PRDSearchService._dialect(db) == "postgresql":
+            await db.execute(delete(prd_search).where(prd_search.c.prd_id == prd_id))
+        else:
+            await db.execute(
+                delete(prd_fts).where(prd_fts.c.rowid == PRDSearchService.fts_rowid(prd_id))
+            )
+    
+    @staticmethod
+    async def search(
+        db: AsyncSession,
+        user_id: uuid.UUID,
+        query: str,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> List[Row]:
+        """
+        Search a user's PRDs, best matches first.
+        
+        Args:
+            db: Database session
+            user_id: Owner whose PRDs are searched
+            query: Free-text search query
+            limit: Maximum number of results
+            offset: Number of results to skip
+            
+        Returns:
+            Rows with PRD listing fields plus ``rank``, ``title_highlight``
+            and ``snippet_highlight``
+        """
+        if PRDSearchService._dialect(db) == "postgresql":
+            statement = PRDSearchService._postgres_query(user_id, query, limit, offset)
+        else:
+            expression = PRDSearchService.build_match_expression(query)
+            if not expression:
+                return []
+            statement = PRDSearchService._sqlite_query(user_id, expression, limit, offset)
+        
+        # Search is the heaviest read; it is safe to serve from a replica
+        result = await db.execute(statement.execution_options(use_replica=True))
+        return list(result.all())
+    
+    @staticmethod
+    def _sqlite_query(user_id: uuid.UUID, expression: str, limit: int, offset: int):
+        """Build the FTS5 search statement."""
+        fts = literal_column("prd_fts")
+        # The user's terms are scoped to the text columns; unscoped they
+        # would also match (prefixes of) the owner token
+        match = f'owner:"{user_id.hex}" AND {{title content}}: ({expression})'
+        return (
+            select(
+                PRD.id,
+                PRD.title,
+                PRD.template_type,
+                PRD.format,
+                PRD.created_at,
+                (-prd_fts.c.rank).label("rank"),
+                func.highlight(fts, 0, HIGHLIGHT_START, HIGHLIGHT_END).label("title_highlight"),
+                func.snippet(
+                    fts, 1, HIGHLIGHT_START, HIGHLIGHT_END, "…", SNIPPET_TOKENS
+                ).label("snippet_highlight"),
+            )
+            .select_from(prd_fts.join(PRD, PRD.id == prd_fts.c.prd_id))
+            .where(fts.op("MATCH")(match))
+            .order_by(prd_fts.c.rank)
+            .limit(limit)
+            .offset(offset)
+        )
+    
+    @staticmethod
+    def _postgres_query(user_id: uuid.UUID, query: str, limit: int, offset: int):
+        """Build the tsvector search statement."""
+        tsquery = func.websearch_to_tsquery(_TS_CONFIG, query)
+        # Rank and paginate first so headlines are only built for one page
+        ranked = (
+            select(
+                prd_search.c.prd_id,
+                prd_search.c.title,
+                prd_search.c.body,
+                func.ts_rank_cd(prd_search.c.document, tsquery).label("rank"),
+            )
+            .where(
+                prd_search.c.user_id == user_id,
+                prd_search.c.document.op("@@")(tsquery),
+            )
+            .order_by(desc("rank"))
+            .limit(limit)
+            .offset(offset)
+            .subquery()
+        )
+        marks = f"StartSel={HIGHLIGHT_START}, StopSel={HIGHLIGHT_END}"
+        return (
+            select(
+                PRD.id,
+                PRD.title,
+                PRD.template_type,
+                PRD.format,
+                PRD.created_at,
+                ranked.c.rank,
+                func.ts_headline(
+                    _TS_CONFIG, ranked.c.title, tsquery, f"{marks}, HighlightAll=true"
+                ).label("title_highlight"),
+                func.ts_headline(
+                    _TS_CONFIG,
+                    ranked.c.body,
+                    tsquery,
+                    f"{marks}, MaxWords={SNIPPET_TOKENS}, MinWords={SNIPPET_TOKENS // 2}",
+                ).label("snippet_highlight"),
+            )
+            .select_from(ranked)
+            .join(PRD, PRD.id == ranked.c.prd_id)
+            .order_by(ranked.c.rank.desc())
+        )
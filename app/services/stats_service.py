@@ -0,0 +1,142 @@
+"""Service maintaining per-user PRD statistics."""
+
+import uuid
+from collections import defaultdict
+from typing import Dict, Iterable, List, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.prd import PRD
+from app.models.prd_blob import PRDBlob
+from app.models.user_stats import UserPRDStats
+from app.schemas.prd import TemplateType
+from app.schemas.user import PRDUsage, UserStats
+
+# (user_id, template_type) -> [prd_count, content_bytes, tokens_generated]
+StatsDeltas = Dict[Tuple[uuid.UUID, TemplateType], List[int]]
+
+_COUNTERS = ("prd_count", "content_bytes", "tokens_generated")
+
+
+class StatsService:
+    """Service for incrementally maintained PRD totals."""
+    
+    @staticmethod
+    async def content_bytes(db: AsyncSession, prd: PRD) -> int:
+        """
+        Return the UTF-8 size of a PRD's current content.
+        
+        Uses the content or blob already in memory when possible.
+        
+        Args:
+            db: Database session
+            prd: PRD model
+            
+        Returns:
+            Content size in bytes
+        """
+        cached = prd.__dict__.get("_content_cache")
+        if cached is not None and cached[0] == prd.content_hash:
+            return len(cached[1].encode("utf-8"))
+        blob = prd.__dict__.get("blob")
+        if blob is not None and blob.hash == prd.content_hash:
+            return blob.size
+        return await db.scalar(select(PRDBlob.size).where(PRDBlob.hash == prd.content_hash)) or 0
+    
+    @staticmethod
+    def deltas_for_created(prds: Iterable[PRD]) -> StatsDeltas:
+        """Aggregate the stats increments for newly created PRDs."""
+        deltas: StatsDeltas = defaultdict(lambda: [0, 0, 0])
+        for prd in prds:
+            delta = deltas[(prd.user_id, prd.template_type)]
+            delta[0] += 1
+            delta[1] += len(prd.pending_content().encode("utf-8"))
+            delta[2] += prd.generated_tokens
+        return deltas
+    
+    @staticmethod
+    async def apply(db: AsyncSession, deltas: StatsDeltas) -> None:
+        """
+        Add deltas to the stats rows in the caller's transaction.
+        
+        Missing rows are created; existing rows are incremented in place
+        with a single upsert, so concurrent writers never lose updates.
+        
+        Args:
+            db: Database session
+            deltas: Increments keyed by ``(user_id, template_type)``
+        """
+        rows = [
+            {
+                "user_id": user_id,
+                "template_type": template_type,
+                **dict(zip(_COUNTERS, delta)),
+            }
+            for (user_id, template_type), delta in sorted(
+                deltas.items(), key=lambda item: (str(item[0][0]), item[0][1].value)
+            )
+            if any(delta)
+        ]
+        if not rows:
+            return
+        
+        table = UserPRDStats.__table__
+        connection = await db.connection()
+        insert = (postgresql if connection.dialect.name == "postgresql" else sqlite).insert
+        statement = insert(table)
+        statement = statement.on_conflict_do_update(
+            index_elements=[table.c.user_id, table.c.template_type],
+            set_={name: table.c[name] + statement.excluded[name] for name in _COUNTERS},
+        )
+        await db.execute(statement, rows)
+    
+    @staticmethod
+    async def count_for_user(db: AsyncSession, user_id: uuid.UUID) -> int:
+        """
+        Return the number of live PRDs a user has.
+        
+        Args:
+            db: Database session
+            user_id: User ID
+            
+        Returns:
+            PRD count
+        """
+        total = await db.scalar(
+            select(func.sum(UserPRDStats.prd_count))
+            .where(UserPRDStats.user_id == user_id)
+            .execution_options(use_replica=True)
+        )
+        return int(total or 0)
+    
+    @staticmethod
+    async def get_for_user(db: AsyncSession, user_id: uuid.UUID) -> UserStats:
+        """
+        Return a user's totals and per-template breakdown.
+        
+        Args:
+            db: Database session
+            user_id: User ID
+            
+        Returns:
+            User statistics
+        """
+        rows = await db.scalars(
+            select(UserPRDStats)
+            .where(UserPRDStats.user_id == user_id)
+            .execution_options(use_replica=True)
+        )
+        stats = UserStats()
+        for row in rows:
+            usage = PRDUsage(
+                prd_count=row.prd_count,
+                content_bytes=row.content_bytes,
+                tokens_generated=row.tokens_generated,
+            )
+            stats.by_template[row.template_type] = usage
+            stats.prd_count += usage.prd_count
+            stats.content_bytes += usage.content_bytes
+            stats.tokens_generated += usage.tokens_generated
+        return stats
@@ -3,19 +3,22 @@
 from typing import Optional
 import uuid
 from datetime import datetime, timedelta
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
-from app.core.security import get_password_hash, verify_password, create_access_token
+from app.core.metrics import metrics
+from app.core.security import get_password_hash_async, verify_and_update_password_async, create_access_token
 from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate
+from app.services.principal_cache import principal_cache
 
 
 class UserService:
     """Service for managing user authentication and data."""
     
     @staticmethod
-    def get_by_email(db: Session, email: str) -> Optional[User]:
+    async def get_by_email(db: AsyncSession, email: str) -> Optional[User]:
         """
         Get a user by email address.
         
@@ -26,10 +29,12 @@ class UserService:
         Returns:
             User if found, None otherwise
         """
-        return db.query(User).filter(User.email == email).first()
+        return await db.scalar(
+            select(User).where(User.email == email).execution_options(use_replica=True)
+        )
     
     @staticmethod
-    def get_by_id(db: Session, user_id: uuid.UUID) -> Optional[User]:
+    async def get_by_id(db: AsyncSession, user_id: uuid.UUID) -> Optional[User]:
         """
         Get a user by ID.
         
@@ -40,10 +45,31 @@ class UserService:
         Returns:
             User if found, None otherwise
         """
-        return db.query(User).filter(User.id == user_id).first()
+        return await db.scalar(
+            select(User).where(User.id == user_id).execution_options(use_replica=True)
+        )
+    
+    @staticmethod
+    async def get_principal(db: AsyncSession, user_id: uuid.UUID) -> Optional[User]:
+        """
+        Get the user behind an access token, from the principal cache if possible.
+        
+        Args:
+            db: Database session (queried only on a cache miss)
+            user_id: User ID
+            
+        Returns:
+            User if found, None otherwise
+        """
+        user = principal_cache.get(user_id)
+        if user is None:
+            user = await UserService.get_by_id(db, user_id)
+            if user is not None:
+                principal_cache.put(user)
+        return user
     
     @staticmethod
-    def create(db: Session, user_in: UserCreate) -> User:
+    async def create(db: AsyncSession, user_in: UserCreate) -> User:
         """
         Create a new user.
         
@@ -57,21 +83,20 @@ class UserService:
         # Create user model
         db_user = User(
             email=user_in.email,
-            hashed_password=get_password_hash(user_in.password),
+            hashed_password=await get_password_hash_async(user_in.password),
             full_name=user_in.full_name,
             is_active=True,
             is_superuser=False
         )
         
-        # Add to database
+        # Add to database; defaults are client-side, so no refresh is needed
         db.add(db_user)
-        db.commit()
-        db.refresh(db_user)
+        await db.commit()
         
         return db_user
     
     @staticmethod
-    def update(db: Session, db_user: User, user_in: UserUpdate) -> User:
+    async def update(db: AsyncSession, db_user: User, user_in: UserUpdate) -> User:
         """
         Update a user.
         
@@ -89,20 +114,42 @@ class UserService:
         if user_in.full_name is not None:
             db_user.full_name = user_in.full_name
         if user_in.password is not None:
-            db_user.hashed_password = get_password_hash(user_in.password)
+            db_user.hashed_password = await get_password_hash_async(user_in.password)
         
         # Commit changes
         db.add(db_user)
-        db.commit()
-        db.refresh(db_user)
+        await db.commit()
+        await principal_cache.invalidate(db_user.id)
         
         return db_user
     
     @staticmethod
-    def authenticate(db: Session, email: str, password: str) -> Optional[User]:
+    async def deactivate(db: AsyncSession, db_user: User) -> User:
+        """
+        Deactivate a user; their tokens stop working immediately.
+        
+        Args:
+            db: Database session
+            db_user: Existing user model
+            
+        Returns:
+            Deactivated user
+        """
+        db_user.is_active = False
+        db.add(db_user)
+        await db.commit()
+        await principal_cache.invalidate(db_user.id)
+        
+        return db_user
+    
+    @staticmethod
+    async def authenticate(db: AsyncSession, email: str, password: str) -> Optional[User]:
         """
         Authenticate a user by email and password.
         
+        A valid password stored under outdated hash settings is rehashed
+        with the current ones.
+        
         Args:
             db: Database session
             email: User email address
@@ -112,13 +159,19 @@ class UserService:
             User if authentication succeeds, None otherwise
         """
         # Get user by email
-        user = UserService.get_by_email(db, email)
+        user = await UserService.get_by_email(db, email)
         if not user:
             return None
         
-        # Check password
-        if not verify_password(password, user.hashed_password):
+        # Check password, upgrading hashes made with an older scheme or cost
+        valid, new_hash = await verify_and_update_password_async(password, user.hashed_password)
+        if not valid:
             return None
+        if new_hash is not None:
+            user.hashed_password = new_hash
+            await db.commit()
+            await principal_cache.invalidate(user.id)
+            metrics.increment("auth.password.rehashed")
         
         return user
     
@@ -0,0 +1,5 @@
+"""Micro-benchmarks for PRD Generator hot paths.
+
+Run individual benchmarks as modules, e.g.
+``python -m benchmarks.bench_compression``.
+"""
@@ -0,0 +1,78 @@
+"""Benchmark PRD content compression: stored size and encode/decode timings."""
+
+import argparse
+import random
+import statistics
+import time
+from typing import Callable, List
+
+from app.core.compression import compress_text, decompress_text, zstandard
+from app.schemas.prd import Format, TemplateType
+from app.services.llm_service import _generate_test_content
+
+WORDS = (
+    "user account dashboard report export import workflow approval notification "
+    "latency availability requirement integration audit payment subscription "
+    "tenant role permission search filter analytics onboarding billing invoice"
+).split()
+
+
+def _sample_documents(count: int, seed: int = 7) -> List[str]:
+    """Build a mix of markdown/JSON PRDs of realistic, varying length."""
+    rng = random.Random(seed)
+    docs = []
+    for i in range(count):
+        output_format = Format.JSON if i % 3 == 0 else Format.MARKDOWN
+        prompt = " ".join(rng.choice(WORDS) for _ in range(rng.randint(8, 40)))
+        doc = _generate_test_content(f"Product {i}", prompt, TemplateType.CRUD, output_format)
+        # Pad with generated requirement sections to reach LLM-sized output
+        sections = "\n".join(
+            f"- FR-{n}: The system shall support "
+            + " ".join(rng.choice(WORDS) for _ in range(rng.randint(6, 20)))
+            for n in range(rng.randint(20, 200))
+        )
+        docs.append(doc + "\n## Functional Requirements\n\n" + sections)
+    return docs
+
+
+def _time_per_call(func: Callable, values: List, repeat: int) -> float:
+    """Return the median time per call in microseconds."""
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for value in values:
+            func(value)
+        runs.append((time.perf_counter() - start) / len(values))
+    return statistics.median(runs) * 1e6
+
+
+def main() -> None:
+    """Run the benchmark and print a results table."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--documents", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    
+    docs = _sample_documents(args.documents)
+    raw_size = sum(len(doc.encode("utf-8")) for doc in docs)
+    print(f"{len(docs)} documents, {raw_size / len(docs) / 1024:.1f} KiB average\n")
+    print(f"{'codec':<8}{'level':>6}{'stored KiB':>12}{'ratio':>8}{'encode us':>12}{'decode us':>12}")
+    
+    configs = [("none", 0), ("zlib", 1), ("zlib", 6), ("zlib", 9)]
+    if zstandard is not None:
+        configs += [("zstd", 1), ("zstd", 3), ("zstd", 9), ("zstd", 19)]
+    
+    for codec, level in configs:
+        encode = lambda doc: compress_text(doc, codec=codec, level=level, min_size=0)
+        encoded = [encode(doc) for doc in docs]
+        stored = sum(len(value) for value in encoded)
+        assert [decompress_text(value) for value in encoded] == docs
+        print(
+            f"{codec:<8}{level:>6}{stored / len(docs) / 1024:>12.1f}{raw_size / stored:>8.2f}"
+            f"{_time_per_call(encode, docs, args.repeat):>12.1f}"
+            f"{_time_per_call(decompress_text, encoded, args.repeat):>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
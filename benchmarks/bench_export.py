@@ -0,0 +1,95 @@
+"""Benchmark streaming PRD exports: throughput and peak memory.
+
+Seeds a temporary SQLite database with PRDs for one user, then drains
+the NDJSON and ZIP export streams, reporting rows per second and the
+peak Python heap allocated while streaming (via ``tracemalloc``). Peak
+memory should stay flat as the row count grows.
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+import tracemalloc
+from typing import AsyncIterator, Callable, Dict, List
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.db.session import Base
+from app.models.prd import PRD
+from app.schemas.prd import Format, TemplateType
+from app.schemas.user import UserCreate
+from app.services.export_service import PRDExportService
+from app.services.prd_service import PRDService
+from app.services.user_service import UserService
+
+Encoder = Callable[[AsyncIterator[dict]], AsyncIterator[bytes]]
+
+
+async def _seed(factory: async_sessionmaker, rows: int) -> object:
+    """Create a user owning ``rows`` distinct PRDs; return the user."""
+    async with factory() as db:
+        owner = await UserService.create(db, UserCreate(email="owner@example.com", password="benchmark"))
+    for start in range(0, rows, 500):
+        batch: List[PRD] = []
+        for i in range(start, min(start + 500, rows)):
+            prd = PRD(
+                title=f"Exported PRD {i}",
+                input_prompt="benchmark",
+                format=Format.MARKDOWN,
+                template_type=TemplateType.CRUD,
+                user_id=owner.id,
+            )
+            prd.content = f"# PRD {i}\n\n" + f"requirement {i} " * 300
+            batch.append(prd)
+        async with factory() as db:
+            await PRDService.persist_batch(db, batch)
+    return owner
+
+
+async def _drain(factory: async_sessionmaker, owner, encoder: Encoder) -> Dict[str, float]:
+    """Consume one export stream; return rows/s, output size and peak memory."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    size = 0
+    async with factory() as db:
+        async for chunk in encoder(PRDExportService.stream_records(db, owner.id)):
+            size += len(chunk)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {"seconds": elapsed, "bytes": size, "peak": peak}
+
+
+async def _run(sizes: List[int]) -> None:
+    """Seed a scratch database per size and print the results table."""
+    encoders = {"ndjson": PRDExportService.ndjson_lines, "zip": PRDExportService.zip_archive}
+    print(f"{'rows':>7}{'format':>8}{'rows/s':>10}{'MB out':>9}{'peak KiB':>10}")
+    for rows in sizes:
+        path = os.path.join(tempfile.mkdtemp(), "export.db")
+        engine = create_async_engine(f"sqlite+aiosqlite:///{path}", poolclass=NullPool)
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+        owner = await _seed(factory, rows)
+        for name, encoder in encoders.items():
+            result = await _drain(factory, owner, encoder)
+            print(
+                f"{rows:>7}{name:>8}{rows / result['seconds']:>10.0f}"
+                f"{result['bytes'] / 1e6:>9.1f}{result['peak'] / 1024:>10.0f}"
+            )
+        await engine.dispose()
+
+
+def main() -> None:
+    """Run the benchmark and print a results table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 5000])
+    args = parser.parse_args()
+    asyncio.run(_run(args.rows))
+
+
+if __name__ == "__main__":
+    main()
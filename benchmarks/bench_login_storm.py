@@ -0,0 +1,69 @@
+"""Benchmark event-loop lag during a login storm: inline bcrypt versus the pool.
+
+Fires a burst of concurrent password verifications while a lag monitor
+samples the loop, first calling bcrypt directly on the event loop (the
+old behaviour) and then through the bounded ``password_pool``. Reports
+loop lag, wall time, and how many attempts the pool shed.
+"""
+
+import argparse
+import asyncio
+import time
+
+from passlib.hash import bcrypt
+
+from app.core.loop_monitor import EventLoopLagMonitor
+from app.core.metrics import metrics
+from app.core.security import PasswordHasherBusy, PasswordHashPool, verify_password
+
+
+async def _storm(logins: int, hashed: str, verify) -> tuple:
+    """Run ``logins`` concurrent verifications; return (lag stats, seconds, shed)."""
+    metrics.reset()
+    monitor = EventLoopLagMonitor(interval=0.01)
+    monitor.start()
+    shed = 0
+    
+    async def attempt() -> None:
+        nonlocal shed
+        try:
+            await verify("benchmark", hashed)
+        except PasswordHasherBusy:
+            shed += 1
+    
+    start = time.perf_counter()
+    await asyncio.gather(*(attempt() for _ in range(logins)))
+    elapsed = time.perf_counter() - start
+    await asyncio.sleep(0.05)
+    await monitor.stop()
+    return metrics.snapshot()["timings"].get("event_loop.lag", {}), elapsed, shed
+
+
+def main() -> None:
+    """Run the benchmark and print a results table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--logins", type=int, default=40)
+    parser.add_argument("--rounds", type=int, default=10, help="bcrypt cost factor")
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--queue-limit", type=int, default=16)
+    args = parser.parse_args()
+    hashed = bcrypt.using(rounds=args.rounds).hash("benchmark")
+    
+    async def inline(plain: str, hashed: str) -> bool:
+        return verify_password(plain, hashed)
+    
+    pool = PasswordHashPool(workers=args.workers, queue_limit=args.queue_limit)
+    
+    async def pooled(plain: str, hashed: str) -> bool:
+        return await pool.run("verify", verify_password, plain, hashed)
+    
+    print(f"{args.logins} concurrent logins, bcrypt cost {args.rounds}")
+    print(f"{'mode':<10}{'max lag ms':>12}{'avg lag ms':>12}{'wall s':>9}{'shed':>6}")
+    for name, verify in (("inline", inline), ("pool", pooled)):
+        lag, elapsed, shed = asyncio.run(_storm(args.logins, hashed, verify))
+        print(f"{name:<10}{lag.get('max_ms', 0):>12.1f}{lag.get('avg_ms', 0):>12.1f}{elapsed:>9.2f}{shed:>6}")
+    pool.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""Benchmark PRD revision reconstruction latency against revision depth.
+
+Builds one PRD with a long edit history per checkpoint interval, then
+times ``RevisionService.get_revision`` for revisions at increasing
+distance from the newest one, and reports the space the history takes
+compared with storing every revision in full. Runs against a temporary
+SQLite database.
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import tempfile
+import time
+from typing import List
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.core.compression import compress_text
+from app.core.config import settings
+from app.db.session import Base
+from app.models.prd_revision import PRDRevision
+from app.schemas.prd import Format, PRDCreate, PRDUpdate, TemplateType
+from app.schemas.user import UserCreate
+from app.services.prd_service import PRDService
+from app.services.revision_service import RevisionService
+from app.services.user_service import UserService
+
+
+def _edit(lines: List[str], rng: random.Random) -> List[str]:
+    """Apply a small random edit: rewrite, insert or drop a few lines."""
+    lines = list(lines)
+    for _ in range(rng.randint(1, 4)):
+        index = rng.randrange(len(lines))
+        action = rng.random()
+        if action < 0.6:
+            lines[index] = f"- Requirement {rng.randrange(10**6)} revised\n"
+        elif action < 0.85:
+            lines.insert(index, f"- New requirement {rng.randrange(10**6)}\n")
+        elif len(lines) > 10:
+            del lines[index]
+    return lines
+
+
+async def _run(revisions: int, lines: int, intervals: List[int], repeats: int) -> None:
+    """Create scratch histories and print the results tables."""
+    path = os.path.join(tempfile.mkdtemp(), "revisions.db")
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}", poolclass=NullPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    
+    async with factory() as db:
+        owner = await UserService.create(
+            db, UserCreate(email="owner@example.com", password="benchmark")
+        )
+    
+    depths = [d for d in (0, 1, 2, 5, 10, 25, 50, 100, 250, 500) if d < revisions]
+    print(f"{revisions} revisions of a {lines}-line PRD; median ms per reconstruction")
+    print(f"{'interval':>8}" + "".join(f"{f'depth {d}':>11}" for d in depths) + f"{'stored KB':>11}{'full KB':>9}")
+    
+    for interval in intervals:
+        settings.PRD_REVISION_CHECKPOINT_INTERVAL = interval
+        rng = random.Random(interval)
+        text = [f"- Requirement {i}\n" for i in range(lines)]
+        full_bytes = 0
+        async with factory() as db:
+            prd = await PRDService.create(
+                db,
+                PRDCreate(
+                    title=f"Interval {interval}",
+                    input_prompt="benchmark",
+                    format=Format.MARKDOWN,
+                    template_type=TemplateType.CRUD,
+                ),
+                "".join(text),
+                owner.id,
+            )
+            full_bytes += len(compress_text(prd.content))
+            for _ in range(revisions - 1):
+                text = _edit(text, rng)
+                prd = await PRDService.update(db, prd, PRDUpdate(content="".join(text)))
+                full_bytes += len(compress_text(prd.content))
+            stored = await db.scalar(
+                select(func.sum(func.length(PRDRevision.data))).where(PRDRevision.prd_id == prd.id)
+            )
+        
+        cells = []
+        for depth in depths:
+            timings = []
+            for _ in range(repeats):
+                async with factory() as db:
+                    start = time.perf_counter()
+                    await RevisionService.get_revision(db, prd, revisions - depth)
+                    timings.append(time.perf_counter() - start)
+            cells.append(statistics.median(timings) * 1000)
+        print(
+            f"{interval:>8}" + "".join(f"{cell:>11.2f}" for cell in cells)
+            + f"{stored / 1024:>11.1f}{full_bytes / 1024:>9.1f}"
+        )
+    
+    await engine.dispose()
+
+
+def main() -> None:
+    """Run the benchmark and print a results table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--revisions", type=int, default=300)
+    parser.add_argument("--lines", type=int, default=400)
+    parser.add_argument("--intervals", default="1,10,50,1000")
+    parser.add_argument("--repeats", type=int, default=20)
+    args = parser.parse_args()
+    intervals = [int(value) for value in args.intervals.split(",")]
+    asyncio.run(_run(args.revisions, args.lines, intervals, args.repeats))
+
+
+if __name__ == "__main__":
+    main()
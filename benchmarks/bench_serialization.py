@@ -0,0 +1,112 @@
+"""Benchmark per-request JSON serialization of PRD listing pages.
+
+Compares FastAPI's default path (``response_model`` validation, dump to
+Python objects, ``json.dumps``) against the fast path used with
+FAST_JSON_RESPONSES (projected rows through a precompiled ``RowSerializer``).
+Rows are loaded once from a temporary SQLite database; only
+serialization is timed.
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from typing import Any, Callable, Dict, List
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.api.endpoints.prd import PRD_ROWS, SUMMARY_ROWS
+from app.db.session import Base
+from app.models.prd import PRD
+from app.schemas.prd import Format, PRDResponse, PRDSummary, TemplateType
+from app.schemas.user import UserCreate
+from app.services.prd_service import PRDService
+from app.services.user_service import UserService
+
+
+async def _load(rows: int) -> Dict[str, List[Any]]:
+    """Seed a scratch database and load one page in each shape."""
+    path = os.path.join(tempfile.mkdtemp(), "serialization.db")
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}", poolclass=NullPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    
+    async with factory() as db:
+        owner = await UserService.create(db, UserCreate(email="owner@example.com", password="benchmark"))
+        prds = []
+        for i in range(rows):
+            prd = PRD(
+                title=f"Serialized PRD {i}",
+                input_prompt="benchmark",
+                format=Format.MARKDOWN,
+                template_type=TemplateType.SAAS,
+                user_id=owner.id,
+            )
+            prd.content = f"# PRD {i}\n\n" + "The system shall respond quickly. " * 60
+            prds.append(prd)
+        await PRDService.persist_batch(db, prds)
+    
+    async with factory() as db:
+        page = {
+            "orm": await PRDService.get_by_user(db, owner.id, limit=rows),
+            "rows": await PRDService.get_rows_by_user(db, owner.id, limit=rows),
+            "summaries": await PRDService.get_summaries_by_user(db, owner.id, limit=rows),
+        }
+        # Touch content so lazy blob decoding is not part of the timing
+        for prd in page["orm"]:
+            prd.content
+    await engine.dispose()
+    return page
+
+
+def _time(func: Callable[[], Any], repeat: int) -> float:
+    """Return the median microseconds per call."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1e6
+
+
+async def _standard(field, content) -> bytes:
+    """Serialize the way FastAPI does for a ``response_model`` endpoint."""
+    return JSONResponse(await serialize_response(field=field, response_content=content)).body
+
+
+def _run(rows: int, repeat: int) -> None:
+    """Print the results table."""
+    page = asyncio.run(_load(rows))
+    loop = asyncio.new_event_loop()
+    cases = [
+        ("PRDResponse", List[PRDResponse], page["orm"], PRD_ROWS, page["rows"]),
+        ("PRDSummary", List[PRDSummary], page["summaries"], SUMMARY_ROWS, page["summaries"]),
+    ]
+    print(f"{rows} items per page, median of {repeat} runs")
+    print(f"{'model':<14}{'default us':>12}{'fast us':>10}{'speedup':>9}")
+    for name, response_type, content, serializer, rows_in in cases:
+        field = create_response_field(name="response", type_=response_type, mode="serialization")
+        default = _time(lambda: loop.run_until_complete(_standard(field, content)), repeat)
+        fast = _time(lambda: serializer.response(rows_in).body, repeat)
+        print(f"{name:<14}{default:>12.0f}{fast:>10.0f}{default / fast:>8.1f}x")
+    loop.close()
+
+
+def main() -> None:
+    """Run the benchmark and print a results table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+    _run(args.rows, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""Benchmark database round trips per write: commit + refresh versus none.
+
+Counts the statements (plus the COMMIT) each service write sends to the
+database, with and without the post-commit ``refresh`` the services used
+to issue. Runs against a temporary SQLite database.
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+import uuid
+from typing import Awaitable, Callable, Dict, List, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.db.session import Base
+from app.schemas.prd import Format, PRDCreate, PRDUpdate, TemplateType
+from app.schemas.user import UserCreate, UserUpdate
+from app.services.prd_service import PRDService
+from app.services.user_service import UserService
+
+Operation = Callable[[AsyncSession, int], Awaitable[object]]
+
+
+class RoundTripCounter:
+    """Count cursor executions and commits on an engine."""
+    
+    def __init__(self, sync_engine) -> None:
+        """Attach listeners to ``sync_engine``."""
+        self.count = 0
+        event.listen(sync_engine, "before_cursor_execute", self._on_execute)
+        event.listen(sync_engine, "commit", self._on_commit)
+    
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        self.count += 1
+    
+    def _on_commit(self, conn) -> None:
+        self.count += 1
+
+
+async def _measure(
+    factory: async_sessionmaker,
+    counter: RoundTripCounter,
+    operation: Operation,
+    iterations: int,
+    refresh: bool,
+) -> Tuple[float, float]:
+    """Run ``operation`` repeatedly; return round trips and ms per call."""
+    trips: List[int] = []
+    timings: List[float] = []
+    for i in range(iterations):
+        async with factory() as db:
+            start_count = counter.count
+            start = time.perf_counter()
+            obj = await operation(db, i)
+            if refresh:
+                await db.refresh(obj)
+            timings.append(time.perf_counter() - start)
+            trips.append(counter.count - start_count)
+    return statistics.mean(trips), statistics.median(timings) * 1000
+
+
+async def _run(iterations: int) -> None:
+    """Create a scratch database and print the results table."""
+    path = os.path.join(tempfile.mkdtemp(), "roundtrips.db")
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}", poolclass=NullPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    counter = RoundTripCounter(engine.sync_engine)
+    
+    async with factory() as db:
+        owner = await UserService.create(
+            db, UserCreate(email="owner@example.com", password="benchmark")
+        )
+        prds = [
+            await PRDService.create(
+                db,
+                PRDCreate(
+                    title=f"Seed {i}",
+                    input_prompt="benchmark",
+                    format=Format.MARKDOWN,
+                    template_type=TemplateType.CRUD,
+                ),
+                f"# Seed {i}\n\nbody",
+                owner.id,
+            )
+            for i in range(iterations)
+        ]
+    
+    async def create_user(db: AsyncSession, i: int):
+        return await UserService.create(
+            db, UserCreate(email=f"{uuid.uuid4().hex}@example.com", password="benchmark")
+        )
+    
+    async def update_user(db: AsyncSession, i: int):
+        user = await UserService.get_by_id(db, owner.id)
+        return await UserService.update(db, user, UserUpdate(full_name=f"Owner {i}"))
+    
+    async def create_prd(db: AsyncSession, i: int):
+        return await PRDService.create(
+            db,
+            PRDCreate(
+                title=f"PRD {i}",
+                input_prompt="benchmark",
+                format=Format.MARKDOWN,
+                template_type=TemplateType.CRUD,
+            ),
+            f"# PRD {i}\n\n" + "requirement " * 200,
+            owner.id,
+        )
+    
+    async def update_prd(db: AsyncSession, i: int):
+        prd = await PRDService.get_by_id(db, prds[i].id)
+        return await PRDService.update(db, prd, PRDUpdate(title=f"Renamed {i}"))
+    
+    operations: Dict[str, Operation] = {
+        "UserService.create": create_user,
+        "UserService.update": update_user,
+        "PRDService.create": create_prd,
+        "PRDService.update": update_prd,
+    }
+    
+    print(f"{'operation':<22}{'trips (refresh)':>17}{'trips (now)':>13}{'ms (refresh)':>14}{'ms (now)':>10}")
+    for name, operation in operations.items():
+        before = await _measure(factory, counter, operation, iterations, refresh=True)
+        after = await _measure(factory, counter, operation, iterations, refresh=False)
+        print(f"{name:<22}{before[0]:>17.1f}{after[0]:>13.1f}{before[1]:>14.2f}{after[1]:>10.2f}")
+    
+    await engine.dispose()
+
+
+def main() -> None:
+    """Run the benchmark and print a results table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(_run(args.iterations))
+
+
+if __name__ == "__main__":
+    main()
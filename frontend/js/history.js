@@ -27,12 +27,17 @@ document.addEventListener('DOMContentLoaded', () => {
     let currentPage = 1;
     const itemsPerPage = 10;
     let totalItems = 0;
+    // Cursor for each visited page (index 0 = first page, no cursor)
+    let pageCursors = [null];
+    let hasNextPage = false;
     let currentPRDs = [];
     let filterSettings = {
         search: '',
         template: '',
         sort: 'newest'
     };
+    // Last response per URL, revalidated with If-None-Match
+    const responseCache = new Map();
     
     // Initialize
     init();
@@ -88,6 +93,38 @@ document.addEventListener('DOMContentLoaded', () => {
         loadPRDs();
     }
     
+    /**
+     * GET a URL, reusing the cached body when the server answers 304
+     *
+     * Returns an object with the parsed body and the response headers of
+     * the latest (or cached) response.
+     */
+    async function fetchWithETag(url, headers) {
+        const cached = responseCache.get(url);
+        const requestHeaders = { ...headers };
+        if (cached) {
+            requestHeaders['If-None-Match'] = cached.etag;
+        }
+        
+        const response = await fetch(url, {
+            method: 'GET',
+            headers: requestHeaders
+        });
+        if (response.status === 304 && cached) {
+            return { data: cached.data, headers: response.headers };
+        }
+        if (!response.ok) {
+            throw new Error(`Request failed with status ${response.status}`);
+        }
+        
+        const data = await response.json();
+        const etag = response.headers.get('ETag');
+        if (etag) {
+            responseCache.set(url, { etag, data });
+        }
+        return { data, headers: response.headers };
+    }
+    
     /**
      * Load PRDs from the API
      */
@@ -98,42 +135,59 @@ document.addEventListener('DOMContentLoaded', () => {
             // Get auth headers
             const headers = window.AuthModule.getAuthHeaders();
             
-            // Build query parameters
+            // Build query parameters. Searches run server-side and are paged
+            // by offset; plain browsing uses keyset pagination via cursors.
+            if (currentPage === 1) {
+                pageCursors = [null];
+            }
             const params = new URLSearchParams();
-            params.append('skip', (currentPage - 1) * itemsPerPage);
             params.append('limit', itemsPerPage);
+            let endpoint = 'summaries';
+            if (filterSettings.search) {
+                endpoint = 'search';
+                params.append('q', filterSettings.search);
+                params.append('offset', (currentPage - 1) * itemsPerPage);
+            } else {
+                const cursor = pageCursors[currentPage - 1];
+                if (cursor) {
+                    params.append('cursor', cursor);
+                }
+            }
             
-            // Send request to API
-            const response = await fetch(`${API_URL}/prd/?${params.toString()}`, {
-                method: 'GET',
-                headers: headers
-            });
+            // Send request to API (unchanged pages come back as 304)
+            const response = await fetchWithETag(
+                `${API_URL}/prd/${endpoint}?${params.toString()}`,
+                headers
+            );
+            const data = response.data;
             
-            // Check response status
-            if (!response.ok) {
-                throw new Error('Failed to load PRDs');
+            // Remember how to reach the next page, if any
+            if (filterSettings.search) {
+                hasNextPage = data.length === itemsPerPage;
+                if (hasNextPage) {
+                    pageCursors[currentPage] = null;
+                }
+            } else {
+                const nextCursor = response.headers.get('X-Next-Cursor');
+                hasNextPage = Boolean(nextCursor);
+                if (nextCursor) {
+                    pageCursors[currentPage] = nextCursor;
+                }
             }
             
-            // Parse response
-            const data = await response.json();
-            
             // Filter PRDs based on search and template filter
             let filteredPRDs = data;
             
-            if (filterSettings.search) {
-                filteredPRDs = filteredPRDs.filter(prd => 
-                    prd.title.toLowerCase().includes(filterSettings.search.toLowerCase())
-                );
-            }
-            
             if (filterSettings.template) {
                 filteredPRDs = filteredPRDs.filter(prd => 
                     prd.template_type === filterSettings.template
                 );
             }
             
-            // Sort PRDs
-            if (filterSettings.sort === 'newest') {
+            // Sort PRDs (search results keep their relevance order by default)
+            if (filterSettings.search && filterSettings.sort === 'newest') {
+                // Leave ranked order untouched
+            } else if (filterSettings.sort === 'newest') {
                 filteredPRDs.sort((a, b) => new Date(b.created_at) - new Date(a.created_at));
             } else if (filterSettings.sort === 'oldest') {
                 filteredPRDs.sort((a, b) => new Date(a.created_at) - new Date(b.created_at));
@@ -141,9 +195,12 @@ document.addEventListener('DOMContentLoaded', () => {
                 filteredPRDs.sort((a, b) => a.title.localeCompare(b.title));
             }
             
-            // Update state
+            // Update state (browsing reports the full history size)
             currentPRDs = filteredPRDs;
-            totalItems = filteredPRDs.length;
+            const totalHeader = response.headers.get('X-Total-Count');
+            totalItems = totalHeader !== null && !filterSettings.search && !filterSettings.template
+                ? parseInt(totalHeader, 10)
+                : filteredPRDs.length;
             
             // Display PRDs
             displayPRDs(filteredPRDs);
@@ -191,7 +248,10 @@ document.addEventListener('DOMContentLoaded', () => {
             const templateDisplay = formatTemplateType(prd.template_type);
             
             row.innerHTML = `
-                <td>${prd.title}</td>
+                <td title="${prd.snippet || ''}">
+                    ${prd.title}
+                    ${prd.snippet_highlight ? `<div class="small text-muted">${highlightToHtml(prd.snippet_highlight)}</div>` : ''}
+                </td>
                 <td><span class="badge bg-info">${templateDisplay}</span></td>
                 <td><span class="badge bg-secondary">${prd.format}</span></td>
                 <td>${formattedDate}</td>
@@ -204,7 +264,7 @@ document.addEventListener('DOMContentLoaded', () => {
             // Add event listeners
             const viewButton = row.querySelector('.view-prd');
             if (viewButton) {
-                viewButton.addEventListener('click', () => viewPRD(prd));
+                viewButton.addEventListener('click', () => viewPRD(prd.id));
             }
             
             const deleteButton = row.querySelector('.delete-prd');
@@ -216,6 +276,17 @@ document.addEventListener('DOMContentLoaded', () => {
         });
     }
     
+    /**
+     * Escape search highlights, keeping only the <mark> tags added by the API
+     */
+    function highlightToHtml(text) {
+        const div = document.createElement('div');
+        div.textContent = text;
+        return div.innerHTML
+            .replace(/&lt;mark&gt;/g, '<mark>')
+            .replace(/&lt;\/mark&gt;/g, '</mark>');
+    }
+    
     /**
      * Format template type for display
      */
@@ -240,8 +311,8 @@ document.addEventListener('DOMContentLoaded', () => {
     function updatePagination() {
         if (!pagination || !paginationContainer) return;
         
-        // Calculate total pages
-        const totalPages = Math.ceil(totalItems / itemsPerPage);
+        // Pages are only known up to the furthest cursor we have seen
+        const totalPages = hasNextPage ? currentPage + 1 : currentPage;
         
         // Show/hide pagination container
         if (totalPages <= 1) {
@@ -267,8 +338,8 @@ document.addEventListener('DOMContentLoaded', () => {
         });
         pagination.appendChild(prevLi);
         
-        // Page numbers
-        for (let i = 1; i <= totalPages; i++) {
+        // Page numbers (only pages with a known cursor are reachable)
+        for (let i = 1; i <= Math.min(totalPages, pageCursors.length); i++) {
             const pageLi = document.createElement('li');
             pageLi.className = `page-item ${i === currentPage ? 'active' : ''}`;
             pageLi.innerHTML = `<a class="page-link" href="#">${i}</a>`;
@@ -296,8 +367,25 @@ document.addEventListener('DOMContentLoaded', () => {
     
     /**
      * View PRD details in modal
+     *
+     * The history list only carries summaries, so the full PRD content is
+     * fetched when a single PRD is opened; reopening an unchanged PRD only
+     * revalidates the cached copy.
      */
-    function viewPRD(prd) {
+    async function viewPRD(prdId) {
+        let prd;
+        try {
+            const response = await fetchWithETag(
+                `${API_URL}/prd/${prdId}`,
+                window.AuthModule.getAuthHeaders()
+            );
+            prd = response.data;
+        } catch (error) {
+            console.error('Error loading PRD:', error);
+            alert('There was an error loading the PRD. Please try again.');
+            return;
+        }
+        
         // Store current PRD
         window.currentPRD = prd;
         
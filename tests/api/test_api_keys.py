@@ -0,0 +1,93 @@
+"""Tests for API key authentication and scopes."""
+
+import asyncio
+
+import pytest
+
+from app.api.deps import get_current_active_user, get_current_user
+from app.core.config import settings
+from app.main import app
+from app.models.api_key import APIKey
+from app.services.api_key_service import api_key_usage, hash_secret
+
+KEYS_URL = f"{settings.API_V1_STR}/api-keys/"
+PRDS_URL = f"{settings.API_V1_STR}/prd/summaries"
+
+
+@pytest.fixture
+def real_auth(client, monkeypatch):
+    """Authenticate requests with the real dependencies instead of the test override."""
+    overrides = dict(app.dependency_overrides)
+    overrides.pop(get_current_user)
+    overrides.pop(get_current_active_user)
+    monkeypatch.setattr(app, "dependency_overrides", overrides)
+    api_key_usage._pending.clear()
+    yield client
+    api_key_usage._pending.clear()
+
+
+def _create(client, headers, scopes):
+    response = client.post(KEYS_URL, json={"name": "ci", "scopes": scopes}, headers=headers)
+    assert response.status_code == 201
+    return response.json()
+
+
+def test_created_key_is_shown_once_and_stored_hashed(client, test_auth_headers, db_session):
+    """The full key is returned at creation only; the row holds its prefix and HMAC."""
+    created = _create(client, test_auth_headers, ["prd:read"])
+    marker, prefix, secret = created["key"].split("_", 2)
+    assert (marker, prefix) == ("pk", created["prefix"])
+    
+    row = db_session.query(APIKey).filter_by(prefix=prefix).one()
+    assert row.secret_hash == hash_secret(secret) and secret not in row.secret_hash
+    
+    listed = client.get(KEYS_URL, headers=test_auth_headers).json()
+    assert created["id"] in [key["id"] for key in listed]
+    assert all("key" not in key for key in listed)
+
+
+def test_key_authenticates_and_scopes_are_enforced(client, test_auth_headers, real_auth):
+    """A read-only key reads PRDs but cannot write or manage keys."""
+    raw_key = _create(client, test_auth_headers, ["prd:read"])["key"]
+    
+    assert client.get(PRDS_URL, headers={"X-API-Key": raw_key}).status_code == 200
+    assert client.get(PRDS_URL, headers={"Authorization": f"Bearer {raw_key}"}).status_code == 200
+    
+    denied = client.delete(
+        f"{settings.API_V1_STR}/prd/00000000-0000-0000-0000-000000000000", headers={"X-API-Key": raw_key}
+    )
+    assert denied.status_code == 403
+    assert client.get(KEYS_URL, headers={"X-API-Key": raw_key}).status_code == 403
+    
+    wrong = raw_key[:-1] + ("A" if raw_key[-1] != "A" else "B")
+    assert client.get(PRDS_URL, headers={"X-API-Key": wrong}).status_code == 401
+    assert client.get(PRDS_URL, headers={"X-API-Key": "pk_nonsense"}).status_code == 401
+
+
+def test_revoked_key_is_rejected(client, test_auth_headers, real_auth):
+    """Revocation takes effect on the next request."""
+    created = _create(client, test_auth_headers, ["prd:read", "prd:write"])
+    headers = {"X-API-Key": created["key"]}
+    assert client.get(PRDS_URL, headers=headers).status_code == 200
+    
+    revoked = client.delete(f"{KEYS_URL}{created['id']}", headers=test_auth_headers)
+    assert revoked.status_code == 200 and revoked.json()["revoked_at"] is not None
+    assert client.get(PRDS_URL, headers=headers).status_code == 401
+
+
+def test_last_used_is_written_in_batches(
+    client, test_auth_headers, test_async_session_factory, db_session, real_auth
+):
+    """Uses are buffered in memory and written by one flush."""
+    first = _create(client, test_auth_headers, ["prd:read"])
+    second = _create(client, test_auth_headers, ["prd:read"])
+    for created in (first, second, first):
+        assert client.get(PRDS_URL, headers={"X-API-Key": created["key"]}).status_code == 200
+    
+    listed = {key["id"]: key for key in client.get(KEYS_URL, headers=test_auth_headers).json()}
+    assert listed[first["id"]]["last_used_at"] is None
+    
+    assert asyncio.run(api_key_usage.flush(test_async_session_factory)) == 2
+    listed = {key["id"]: key for key in client.get(KEYS_URL, headers=test_auth_headers).json()}
+    assert listed[first["id"]]["last_used_at"] is not None
+    assert listed[second["id"]]["last_used_at"] is not None
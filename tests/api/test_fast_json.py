@@ -0,0 +1,41 @@
+"""Tests for the opt-in fast JSON response path."""
+
+from app.core.config import settings
+from app.models.prd import PRD, Format, TemplateType
+
+
+def test_fast_path_matches_standard_responses(client, test_auth_headers, test_user, db_session, monkeypatch):
+    """Listing, summaries and search bodies and headers are unchanged."""
+    for i in range(3):
+        db_session.add(PRD(
+            title=f"Fast JSON {i}",
+            input_prompt="Serialization test",
+            content=f"# Fast JSON {i}\n\nBody ✓",
+            format=Format.JSON if i % 2 else Format.MARKDOWN,
+            template_type=TemplateType.AI_AGENT,
+            user_id=test_user.id,
+        ))
+    db_session.commit()
+    requests = [
+        ("/prd/", {"limit": 2}),
+        ("/prd/summaries", {"limit": 2}),
+        ("/prd/search", {"q": "fast"}),
+    ]
+    
+    def fetch():
+        return [
+            client.get(f"{settings.API_V1_STR}{path}", params=params, headers=test_auth_headers)
+            for path, params in requests
+        ]
+    
+    standard = fetch()
+    monkeypatch.setattr(settings, "FAST_JSON_RESPONSES", True)
+    fast = fetch()
+    
+    for before, after in zip(standard, fast):
+        assert after.status_code == 200
+        assert after.json() == before.json()
+        assert after.headers["content-type"] == "application/json"
+        for header in ("etag", "x-next-cursor", "x-total-count"):
+            assert after.headers.get(header) == before.headers.get(header)
+    assert len(fast[0].json()) == 2 and fast[0].json()[0]["content"].endswith("Body ✓")
@@ -0,0 +1,85 @@
+"""Tests for ETag and conditional GET support on PRD reads."""
+
+import asyncio
+
+from app.core.config import settings
+from app.schemas.prd import PRDUpdate
+from app.services.prd_service import PRDService
+
+
+def _rename(factory, prd_id, title):
+    async def rename():
+        async with factory() as db:
+            prd = await PRDService.get_by_id(db, prd_id)
+            await PRDService.update(db, prd, PRDUpdate(title=title))
+    asyncio.run(rename())
+
+
+def test_prd_read_revalidates_without_loading_content(
+    client, test_auth_headers, test_async_session_factory, make_prd, monkeypatch
+):
+    """Matching validators get a 304; any change yields a new ETag."""
+    prd = make_prd("Cached")
+    url = f"{settings.API_V1_STR}/prd/{prd.id}"
+    
+    first = client.get(url, headers=test_auth_headers)
+    etag = first.headers["etag"]
+    assert first.status_code == 200 and etag.startswith('"')
+    assert first.headers["cache-control"] == "private, no-cache"
+    
+    async def fail(*args, **kwargs):
+        raise AssertionError("content loaded for a 304")
+    
+    with monkeypatch.context() as patch:
+        patch.setattr(PRDService, "get_by_id", fail)
+        cached = client.get(url, headers={**test_auth_headers, "If-None-Match": etag})
+        since = client.get(
+            url, headers={**test_auth_headers, "If-Modified-Since": first.headers["last-modified"]}
+        )
+    assert cached.status_code == 304 and cached.content == b""
+    assert cached.headers["etag"] == etag
+    assert since.status_code == 304
+    
+    _rename(test_async_session_factory, prd.id, "Renamed")
+    
+    changed = client.get(url, headers={**test_auth_headers, "If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.json()["title"] == "Renamed"
+    assert changed.headers["etag"] != etag
+
+
+def test_listing_etag_changes_with_page_membership(client, test_auth_headers, make_prd):
+    """Listing pages revalidate to 304 until a PRD on them is deleted."""
+    prds = [make_prd(f"Listed {i}") for i in range(3)]
+    
+    for endpoint in ("", "summaries"):
+        url = f"{settings.API_V1_STR}/prd/{endpoint}"
+        first = client.get(url, headers=test_auth_headers)
+        etag = first.headers["etag"]
+        
+        cached = client.get(url, headers={**test_auth_headers, "If-None-Match": f'W/{etag}, "other"'})
+        assert cached.status_code == 304
+        assert cached.headers["x-total-count"] == "3"
+    
+    client.delete(f"{settings.API_V1_STR}/prd/{prds[1].id}", headers=test_auth_headers)
+    
+    response = client.get(url, headers={**test_auth_headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert len(response.json()) == 2
+
+
+def test_wildcard_matches_only_existing_prds(client, test_auth_headers, make_prd):
+    """``If-None-Match: *`` gets a 304 for an existing PRD, never for a missing one."""
+    prd = make_prd("Cached")
+    
+    response = client.get(
+        f"{settings.API_V1_STR}/prd/{prd.id}",
+        headers={**test_auth_headers, "If-None-Match": "*"},
+    )
+    assert response.status_code == 304
+    
+    missing = client.get(
+        f"{settings.API_V1_STR}/prd/00000000-0000-0000-0000-000000000000",
+        headers={**test_auth_headers, "If-None-Match": "*"},
+    )
+    assert missing.status_code == 404
@@ -0,0 +1,67 @@
+"""Tests for streaming PRD exports."""
+
+import io
+import json
+import zipfile
+
+from app.core.config import settings
+from app.schemas.prd import Format, TemplateType
+
+
+def _create_prds(make_prd, count):
+    for i in range(count):
+        make_prd(
+            f"Export {i}",
+            f"# Export {i}\n\nBody ✓",
+            template_type=TemplateType.SAAS,
+            format=Format.JSON if i % 2 else Format.MARKDOWN,
+        )
+
+
+def test_ndjson_export_streams_every_prd(client, test_auth_headers, make_prd):
+    """Each live PRD is one JSON line, oldest first; deleted PRDs are skipped."""
+    _create_prds(make_prd, 5)
+    summaries = client.get(f"{settings.API_V1_STR}/prd/summaries", headers=test_auth_headers).json()
+    client.delete(f"{settings.API_V1_STR}/prd/{summaries[0]['id']}", headers=test_auth_headers)
+    
+    response = client.get(
+        f"{settings.API_V1_STR}/prd/export", params={"format": "ndjson"}, headers=test_auth_headers
+    )
+    
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    assert "attachment" in response.headers["content-disposition"]
+    records = [json.loads(line) for line in response.text.splitlines()]
+    assert [record["title"] for record in records] == [f"Export {i}" for i in range(4)]
+    assert records[0]["content"] == "# Export 0\n\nBody ✓"
+    assert records[1]["format"] == Format.JSON.value
+    assert records[0]["template_type"] == TemplateType.SAAS.value
+
+
+def test_zip_export_has_document_and_metadata_per_prd(client, test_auth_headers, make_prd):
+    """ZIP exports hold the content and a metadata file for every PRD."""
+    _create_prds(make_prd, 3)
+    
+    response = client.get(
+        f"{settings.API_V1_STR}/prd/export", params={"format": "zip"}, headers=test_auth_headers
+    )
+    
+    assert response.status_code == 200
+    archive = zipfile.ZipFile(io.BytesIO(response.content))
+    assert archive.testzip() is None
+    names = archive.namelist()
+    assert len(names) == 6
+    documents = [name for name in names if not name.endswith(".meta.json")]
+    assert "-export-0-" in documents[0] and documents[0].endswith(".md")
+    assert documents[1].endswith(".json")
+    assert archive.read(documents[2]).decode() == "# Export 2\n\nBody ✓"
+    meta = json.loads(archive.read(documents[2] + ".meta.json"))
+    assert meta["title"] == "Export 2" and "content" not in meta
+
+
+def test_export_rejects_unknown_format(client, test_auth_headers):
+    """Only NDJSON and ZIP exports are offered."""
+    response = client.get(
+        f"{settings.API_V1_STR}/prd/export", params={"format": "csv"}, headers=test_auth_headers
+    )
+    assert response.status_code == 422
@@ -0,0 +1,84 @@
+"""Tests for bulk PRD imports."""
+
+import io
+import json
+
+from app.core.config import settings
+from app.services.import_service import PRDImportService, _read_lines
+
+
+def _line(**item):
+    defaults = {"title": "Imported", "input_prompt": "Import test", "content": "# Imported"}
+    return json.dumps({**defaults, **item})
+
+
+def _import(client, headers, data, filename="prds.ndjson"):
+    return client.post(
+        f"{settings.API_V1_STR}/prd/import",
+        files={"file": (filename, data, "application/octet-stream")},
+        headers=headers,
+    )
+
+
+def test_ndjson_import_reports_bad_lines(client, test_auth_headers, monkeypatch):
+    """Valid lines are inserted in batches; each bad line is reported."""
+    monkeypatch.setattr(settings, "PRD_IMPORT_BATCH_SIZE", 2)
+    lines = [
+        _line(title="One"),
+        "{not json",
+        _line(title="Two", template_type="saas_platform", format="json", content='{"a": 1}'),
+        "",
+        _line(title="Three", template_type="unknown"),
+        _line(title="Four", content=""),
+        "[1, 2]",
+        _line(title="Five"),
+    ]
+    
+    response = _import(client, test_auth_headers, "\n".join(lines).encode())
+    
+    assert response.status_code == 200
+    report = response.json()
+    assert report["imported"] == 3
+    assert report["failed"] == 4
+    assert [error["location"] for error in report["errors"]] == ["line 2", "line 5", "line 6", "line 7"]
+    assert "template_type" in report["errors"][1]["detail"]
+    listed = client.get(f"{settings.API_V1_STR}/prd/", headers=test_auth_headers).json()
+    assert sorted(prd["title"] for prd in listed) == ["Five", "One", "Two"]
+    searched = client.get(
+        f"{settings.API_V1_STR}/prd/search", params={"q": "Five"}, headers=test_auth_headers
+    ).json()
+    assert [hit["title"] for hit in searched] == ["Five"]
+
+
+def test_zip_export_round_trips_through_import(client, test_auth_headers):
+    """A ZIP export can be imported back unchanged."""
+    _import(client, test_auth_headers, "\n".join(_line(title=f"PRD {i}") for i in range(3)).encode())
+    exported = client.get(
+        f"{settings.API_V1_STR}/prd/export", params={"format": "zip"}, headers=test_auth_headers
+    ).content
+    
+    response = _import(client, test_auth_headers, exported, filename="export.zip")
+    
+    assert response.json() == {"imported": 3, "failed": 0, "errors": []}
+    listed = client.get(f"{settings.API_V1_STR}/prd/", headers=test_auth_headers).json()
+    assert len(listed) == 6
+
+
+def test_oversized_lines_are_skipped_without_buffering():
+    """Lines longer than the limit are reported and parsing continues."""
+    data = "\n".join([_line(title="Small"), _line(title="x" * 500), _line(title="After")]).encode()
+    
+    items = list(PRDImportService.iter_ndjson(io.BytesIO(data), limit=200))
+    
+    assert [location for location, _ in items] == ["line 1", "line 2", "line 3"]
+    assert isinstance(items[1][1], ValueError)
+    assert items[2][1]["title"] == "After"
+
+
+def test_lines_spanning_many_chunks_are_reassembled():
+    """Long lines split over many reads come back whole; the limit still applies."""
+    data = b"a" * 50 + b"\n" + b"b" * 23 + b"\n\n" + b"c" * 40 + b"\nd"
+    
+    lines = list(_read_lines(io.BytesIO(data), limit=45, chunk_size=4))
+    
+    assert lines == [None, b"b" * 23, b"", b"c" * 40, b"d"]
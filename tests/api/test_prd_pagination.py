@@ -0,0 +1,83 @@
+"""Tests for PRD history pagination."""
+
+from datetime import datetime, timedelta
+
+from app.core.config import settings
+from app.models.prd import Format, TemplateType, PRD
+
+
+def _create_prds(db_session, user, count):
+    """Insert ``count`` PRDs for ``user``; the last two share a timestamp."""
+    base = datetime(2026, 1, 1, 12, 0, 0)
+    prds = []
+    for i in range(count):
+        created_at = base + timedelta(minutes=min(i, count - 2))
+        prds.append(PRD(
+            title=f"Paged PRD {i}",
+            input_prompt="Pagination test",
+            content=f"# Paged PRD {i}",
+            format=Format.MARKDOWN,
+            template_type=TemplateType.CRUD,
+            user_id=user.id,
+            created_at=created_at,
+            updated_at=created_at,
+        ))
+    db_session.add_all(prds)
+    db_session.commit()
+    return prds
+
+
+def test_cursor_pagination_walks_all_pages(client, test_auth_headers, test_user, db_session):
+    """Following X-Next-Cursor returns every PRD exactly once, newest first."""
+    prds = _create_prds(db_session, test_user, 5)
+    
+    seen = []
+    cursor = None
+    while True:
+        params = {"limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get(f"{settings.API_V1_STR}/prd/", params=params, headers=test_auth_headers)
+        assert response.status_code == 200
+        seen.extend(item["id"] for item in response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+    
+    expected = sorted(prds, key=lambda p: (-p.created_at.timestamp(), str(p.id)))
+    assert seen == [str(p.id) for p in expected]
+
+
+def test_offset_pagination_still_supported(client, test_auth_headers, test_user, db_session):
+    """The legacy skip/limit parameters keep working."""
+    _create_prds(db_session, test_user, 3)
+    
+    response = client.get(
+        f"{settings.API_V1_STR}/prd/", params={"skip": 1, "limit": 10}, headers=test_auth_headers
+    )
+    
+    assert response.status_code == 200
+    assert len(response.json()) == 2
+
+
+def test_invalid_cursor_rejected(client, test_auth_headers):
+    """Malformed cursors produce a 400 error."""
+    response = client.get(
+        f"{settings.API_V1_STR}/prd/", params={"cursor": "not-a-cursor"}, headers=test_auth_headers
+    )
+    
+    assert response.status_code == 400
+
+
+def test_summary_listing_excludes_content(client, test_auth_headers, test_user, db_session):
+    """Summaries carry precomputed length and snippet but no content."""
+    prds = _create_prds(db_session, test_user, 2)
+    
+    response = client.get(f"{settings.API_V1_STR}/prd/summaries", headers=test_auth_headers)
+    
+    assert response.status_code == 200
+    data = {item["id"]: item for item in response.json()}
+    summary = data[str(prds[0].id)]
+    assert "content" not in summary
+    assert summary["content_length"] == len(prds[0].content)
+    assert summary["snippet"] == "Paged PRD 0"
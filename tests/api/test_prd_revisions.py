@@ -0,0 +1,67 @@
+"""Tests for PRD revision history."""
+
+import asyncio
+
+from sqlalchemy import select
+
+from app.core.config import settings
+from app.models.prd_revision import PRDRevision
+from app.schemas.prd import PRDUpdate
+from app.services.prd_service import PRDService
+
+
+def _version(number):
+    return "".join(f"Requirement {i}: revision {number if i % 7 == 0 else 0}\n" for i in range(40))
+
+
+def test_revisions_reconstruct_every_version(
+    client, test_auth_headers, test_async_session_factory, make_prd, monkeypatch
+):
+    """Older revisions are stored as deltas between checkpoints and rebuild exactly."""
+    monkeypatch.setattr(settings, "PRD_REVISION_CHECKPOINT_INTERVAL", 5)
+    prd = make_prd("Versioned", _version(1))
+    
+    async def edit(prd):
+        for number in range(2, 13):
+            async with test_async_session_factory() as db:
+                prd = await PRDService.get_by_id(db, prd.id)
+                await PRDService.update(db, prd, PRDUpdate(content=_version(number)))
+        async with test_async_session_factory() as db:
+            prd = await PRDService.get_by_id(db, prd.id)
+            # Unchanged content and title-only edits add no revision
+            await PRDService.update(db, prd, PRDUpdate(title="Renamed", content=_version(12)))
+            rows = await db.execute(
+                select(PRDRevision.number, PRDRevision.is_full).where(PRDRevision.prd_id == prd.id)
+            )
+            return prd, dict(rows.all())
+    
+    prd, stored = asyncio.run(edit(prd))
+    assert sorted(stored) == list(range(1, 13))
+    assert [number for number, full in sorted(stored.items()) if full] == [5, 10, 12]
+    
+    url = f"{settings.API_V1_STR}/prd/{prd.id}/revisions"
+    listing = client.get(url, headers=test_auth_headers)
+    assert listing.status_code == 200
+    assert [item["number"] for item in listing.json()] == list(range(1, 13))
+    
+    for number in range(1, 13):
+        response = client.get(f"{url}/{number}", headers=test_auth_headers)
+        assert response.status_code == 200
+        body = response.json()
+        assert body["content"] == _version(number)
+        assert body["size"] == len(_version(number).encode("utf-8"))
+    
+    assert client.get(f"{url}/13", headers=test_auth_headers).status_code == 404
+    assert client.get(f"{url}/0", headers=test_auth_headers).status_code == 422
+
+
+def test_unedited_prd_has_its_content_as_first_revision(client, test_auth_headers, make_prd):
+    """A PRD that was never edited reports one revision without history rows."""
+    prd = make_prd("Original")
+    url = f"{settings.API_V1_STR}/prd/{prd.id}/revisions"
+    
+    listing = client.get(url, headers=test_auth_headers).json()
+    assert [item["number"] for item in listing] == [1]
+    assert listing[0]["content_hash"] == prd.content_hash
+    assert client.get(f"{url}/1", headers=test_auth_headers).json()["content"] == "# Original"
+    assert client.get(f"{url}/2", headers=test_auth_headers).status_code == 404
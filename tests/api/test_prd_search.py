@@ -0,0 +1,68 @@
+"""Tests for full-text PRD search."""
+
+from app.core.config import settings
+from app.services.search_service import PRDSearchService
+
+
+def _generate(client, headers, title, prompt):
+    """Generate a PRD through the API (test provider)."""
+    response = client.post(
+        f"{settings.API_V1_STR}/prd/generate",
+        json={
+            "title": title,
+            "input_prompt": prompt,
+            "format": "markdown",
+            "template_type": "crud_application",
+        },
+        headers=headers,
+    )
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_search_returns_ranked_highlighted_matches(client, test_auth_headers):
+    """Matching PRDs are returned with highlighted title and snippet."""
+    kayak = _generate(client, test_auth_headers, "Kayak Rental Tracker", "Track kayak rentals at lakes")
+    _generate(client, test_auth_headers, "Bakery Orders", "Manage bakery orders")
+    
+    response = client.get(
+        f"{settings.API_V1_STR}/prd/search", params={"q": "kayak"}, headers=test_auth_headers
+    )
+    
+    assert response.status_code == 200
+    results = response.json()
+    assert [r["id"] for r in results] == [kayak["id"]]
+    assert "<mark>Kayak</mark>" in results[0]["title_highlight"]
+    assert "<mark>" in results[0]["snippet_highlight"]
+
+
+def test_search_reflects_deletes(client, test_auth_headers):
+    """Deleted PRDs disappear from search results."""
+    prd = _generate(client, test_auth_headers, "Glacier Survey", "Survey glacier retreat")
+    
+    client.delete(f"{settings.API_V1_STR}/prd/{prd['id']}", headers=test_auth_headers)
+    response = client.get(
+        f"{settings.API_V1_STR}/prd/search", params={"q": "glacier"}, headers=test_auth_headers
+    )
+    
+    assert response.status_code == 200
+    assert response.json() == []
+
+
+def test_search_does_not_match_owner_id(client, test_auth_headers, test_user):
+    """A prefix of the user's own id is not a match for every PRD they own."""
+    _generate(client, test_auth_headers, "Harbor Crane Scheduler", "Schedule harbor cranes")
+    
+    for q in (test_user.id.hex[:8], test_user.id.hex):
+        response = client.get(
+            f"{settings.API_V1_STR}/prd/search", params={"q": q}, headers=test_auth_headers
+        )
+        assert response.status_code == 200
+        assert response.json() == []
+
+
+def test_match_expression_is_sanitized():
+    """Query syntax characters never reach FTS5 unquoted."""
+    assert PRDSearchService.build_match_expression('kayak "rent') == '"kayak" "rent"*'
+    assert PRDSearchService.build_match_expression("-- OR *") == '"OR"*'
+    assert PRDSearchService.build_match_expression("!!!") == ""
@@ -0,0 +1,95 @@
+"""Tests for token-bucket rate limiting."""
+
+import asyncio
+
+import pytest
+
+from app.core.config import settings
+from app.core.rate_limit import Limit, MemoryBackend, RateLimiter, rate_limiter
+
+
+@pytest.fixture
+def fresh_limiter():
+    """Start and end each test with empty buckets."""
+    rate_limiter.reset()
+    yield rate_limiter
+    rate_limiter.reset()
+
+
+def test_limit_parsing():
+    """Specs parse into capacity and period; empty or zero means unlimited."""
+    assert Limit.parse("10/minute") == Limit(10, 60.0)
+    assert Limit.parse("5/second").rate == 5
+    assert Limit.parse("") is None and Limit.parse("0/minute") is None
+    with pytest.raises(ValueError):
+        Limit.parse("3/fortnight")
+
+
+def test_memory_bucket_refills_over_time():
+    """A drained bucket allows one request per refill interval."""
+    backend = MemoryBackend(max_keys=10)
+    limit = Limit(2, 10.0)
+    
+    async def takes(*times):
+        return [(await backend.take("k", limit, now=now)).allowed for now in times]
+    
+    assert asyncio.run(takes(0, 0, 0, 4.9, 5.0, 5.1)) == [True, True, False, False, True, False]
+
+
+def test_denied_requests_do_not_drain_other_buckets(monkeypatch):
+    """A user spinning on 429s leaves the shared IP bucket to others, and vice versa."""
+    monkeypatch.setattr(settings, "RATE_LIMIT_READ_PER_USER", "1/minute")
+    monkeypatch.setattr(settings, "RATE_LIMIT_READ_PER_IP", "3/minute")
+    limiter = RateLimiter(MemoryBackend(max_keys=10))
+    
+    async def allowed(user):
+        return (await limiter.check("read", "/r", user, "10.0.0.1")).allowed
+    
+    async def scenario():
+        noisy = [await allowed("noisy") for _ in range(5)]
+        others = [await allowed("a"), await allowed("b"), await allowed("c")]
+        # The IP bucket is empty now; the denied request must not cost "d" its token
+        late = await allowed("d")
+        monkeypatch.setattr(settings, "RATE_LIMIT_READ_PER_IP", "")
+        return noisy, others, late, await allowed("d")
+    
+    noisy, others, late, retry = asyncio.run(scenario())
+    assert noisy == [True, False, False, False, False]
+    assert others == [True, True, False]
+    assert late is False and retry is True
+
+
+def test_reads_are_limited_per_route_with_headers(
+    client, test_auth_headers, fresh_limiter, monkeypatch
+):
+    """Each route has its own bucket; exhausted buckets answer 429 with Retry-After."""
+    monkeypatch.setattr(settings, "RATE_LIMIT_READ_PER_USER", "3/minute")
+    url = f"{settings.API_V1_STR}/prd/summaries"
+    
+    remaining = []
+    for _ in range(3):
+        response = client.get(url, headers=test_auth_headers)
+        assert response.status_code == 200
+        assert response.headers["ratelimit-limit"] == "3"
+        assert response.headers["ratelimit-policy"] == "3;w=60"
+        remaining.append(response.headers["ratelimit-remaining"])
+    assert remaining == ["2", "1", "0"]
+    
+    limited = client.get(url, headers=test_auth_headers)
+    assert limited.status_code == 429
+    assert int(limited.headers["retry-after"]) >= 1
+    
+    other = client.get(f"{settings.API_V1_STR}/prd/search", params={"q": "x"}, headers=test_auth_headers)
+    assert other.status_code == 200
+    assert other.headers["ratelimit-remaining"] == "2"
+
+
+def test_headers_reach_directly_returned_responses(
+    client, test_auth_headers, fresh_limiter
+):
+    """Revalidation 304s carry the rate-limit headers too."""
+    url = f"{settings.API_V1_STR}/prd/summaries"
+    etag = client.get(url, headers=test_auth_headers).headers["etag"]
+    cached = client.get(url, headers={**test_auth_headers, "If-None-Match": etag})
+    assert cached.status_code == 304
+    assert "ratelimit-remaining" in cached.headers
@@ -0,0 +1,31 @@
+"""Tests for incrementally maintained user PRD statistics."""
+
+from app.core.config import settings
+from app.schemas.prd import TemplateType
+
+
+def test_stats_follow_creates_and_deletes(client, test_auth_headers, make_prd):
+    """Counts, bytes and tokens are updated with each create and delete."""
+    first = make_prd("Stats", "crud body", template_type=TemplateType.CRUD, tokens=100)
+    make_prd("Stats", "second crud", template_type=TemplateType.CRUD, tokens=50)
+    make_prd("Stats", "saas ✓", template_type=TemplateType.SAAS, tokens=25)
+    
+    stats = client.get(f"{settings.API_V1_STR}/users/me/stats", headers=test_auth_headers).json()
+    assert stats["prd_count"] == 3
+    assert stats["content_bytes"] == len("crud body") + len("second crud") + len("saas ✓".encode())
+    assert stats["tokens_generated"] == 175
+    assert stats["by_template"][TemplateType.CRUD.value]["prd_count"] == 2
+    assert stats["by_template"][TemplateType.SAAS.value]["prd_count"] == 1
+    
+    client.delete(f"{settings.API_V1_STR}/prd/{first.id}", headers=test_auth_headers)
+    
+    stats = client.get(f"{settings.API_V1_STR}/users/me/stats", headers=test_auth_headers).json()
+    assert stats["prd_count"] == 2
+    assert stats["by_template"][TemplateType.CRUD.value]["content_bytes"] == len("second crud")
+    # Token usage is cumulative and survives deletes
+    assert stats["tokens_generated"] == 175
+    
+    response = client.get(
+        f"{settings.API_V1_STR}/prd/summaries", params={"limit": 1}, headers=test_auth_headers
+    )
+    assert response.headers["X-Total-Count"] == "2"
@@ -1,17 +1,21 @@
 """Pytest configuration for PRD Generator tests."""
 
+import asyncio
 import os
 import pytest
 import uuid
 from typing import Dict, Optional
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import NullPool, StaticPool
 
 from app.main import app
 from app.db.session import Base, get_db
 from app.models.user import User
+from app.schemas.prd import Format, PRDCreate, TemplateType
+from app.services.prd_service import PRDService
 from app.core.security import get_password_hash
 from app.core.config import settings
 from app.services.user_service import UserService
@@ -20,6 +24,7 @@ from app.api.deps import get_current_active_user, get_current_user
 
 # Test database URL - using in-memory SQLite for tests
 TEST_DATABASE_URL = "sqlite:///./test.db"
+TEST_ASYNC_DATABASE_URL = "sqlite+aiosqlite:///./test.db"
 
 
 @pytest.fixture(scope="session")
@@ -38,6 +43,45 @@ def test_engine():
         os.remove("./test.db")
 
 
+@pytest.fixture(scope="session")
+def test_async_session_factory(test_engine):
+    """Create an async session factory bound to the test database."""
+    # NullPool: each TestClient runs its own event loop, so connections
+    # must not be shared between tests
+    engine = create_async_engine(TEST_ASYNC_DATABASE_URL, poolclass=NullPool)
+    return async_sessionmaker(
+        bind=engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+    )
+
+
+@pytest.fixture
+def make_prd(test_async_session_factory, test_user):
+    """Return a helper creating a PRD for the test user through PRDService."""
+    def _make_prd(
+        title: str = "Test PRD",
+        content: Optional[str] = None,
+        template_type: TemplateType = TemplateType.CRUD,
+        tokens: Optional[int] = None,
+        format: Format = Format.MARKDOWN,
+    ):
+        async def create():
+            async with test_async_session_factory() as db:
+                return await PRDService.create(
+                    db,
+                    PRDCreate(
+                        title=title,
+                        input_prompt="Test prompt",
+                        format=format,
+                        template_type=template_type,
+                    ),
+                    f"# {title}" if content is None else content,
+                    test_user.id,
+                    tokens=tokens,
+                )
+        return asyncio.run(create())
+    return _make_prd
+
+
 @pytest.fixture
 def db_session(test_engine):
     """Create a fresh database session for each test."""
@@ -108,17 +152,15 @@ TEST_SUPERUSER = None
 
 
 @pytest.fixture
-def client(db_session, test_user, test_superuser):
+def client(db_session, test_async_session_factory, test_user, test_superuser):
     """Create test client with proper auth dependency overrides."""
     global TEST_USER, TEST_SUPERUSER
     TEST_USER = test_user
     TEST_SUPERUSER = test_superuser
     
-    def _get_test_db():
-        try:
-            yield db_session
-        finally:
-            pass
+    async def _get_test_db():
+        async with test_async_session_factory() as session:
+            yield session
     
     # Override DB dependency
     app.dependency_overrides[get_db] = _get_test_db
@@ -0,0 +1,65 @@
+"""Tests for PRD content compression."""
+
+import pytest
+from sqlalchemy import text
+
+from app.core.compression import MARKER_RAW, MARKER_ZLIB, compress_text, decompress_text
+from app.models.prd import PRD, Format, TemplateType
+
+DOCUMENT = "# Product\n\n" + "The system shall export reports.\n" * 200
+
+
+@pytest.mark.parametrize("codec", ["none", "zlib", "zstd"])
+def test_round_trip(codec):
+    """Every codec decodes back to the original text."""
+    encoded = compress_text(DOCUMENT, codec=codec, min_size=0)
+    
+    assert decompress_text(encoded) == DOCUMENT
+    if codec != "none":
+        assert len(encoded) < len(DOCUMENT) / 4
+
+
+def test_small_values_stored_raw():
+    """Values under the size threshold skip compression."""
+    encoded = compress_text("tiny", codec="zlib", min_size=256)
+    
+    assert encoded[0] == MARKER_RAW
+    assert decompress_text(encoded) == "tiny"
+
+
+def test_legacy_text_passes_through():
+    """Rows written before compression (plain strings) still decode."""
+    assert decompress_text("plain legacy content") == "plain legacy content"
+
+
+def test_unknown_marker_rejected():
+    """Unknown format markers raise instead of returning garbage."""
+    with pytest.raises(ValueError):
+        decompress_text(b"\x7fpayload")
+
+
+def test_prd_content_stored_compressed(db_session, test_user, monkeypatch):
+    """PRD content is compressed in the database and decoded on access."""
+    from app.core.config import settings
+    
+    monkeypatch.setattr(settings, "PRD_CONTENT_COMPRESSION", "zlib")
+    prd = PRD(
+        title="Compressed",
+        input_prompt="Compression test",
+        content=DOCUMENT,
+        format=Format.MARKDOWN,
+        template_type=TemplateType.CRUD,
+        user_id=test_user.id,
+    )
+    db_session.add(prd)
+    db_session.commit()
+    
+    stored = db_session.execute(
+        text("SELECT content FROM prd_blob WHERE hash = :hash"), {"hash": prd.content_hash}
+    ).scalar()
+    assert stored[0] == MARKER_ZLIB
+    assert len(stored) < len(DOCUMENT) / 4
+    
+    db_session.expire(prd)
+    assert prd.content == DOCUMENT
+    assert prd.content_length == len(DOCUMENT)
@@ -0,0 +1,126 @@
+"""Tests for database session helpers."""
+
+import pytest
+
+from app.db.session import get_async_database_url
+
+
+def test_async_url_for_postgres():
+    """Postgres URIs should be switched to the asyncpg driver."""
+    url = get_async_database_url("postgresql://user:secret@db/prd_generator")
+    
+    assert url.drivername == "postgresql+asyncpg"
+    assert url.password == "secret"
+    assert url.database == "prd_generator"
+
+
+def test_async_url_for_sqlite():
+    """SQLite URIs should be switched to the aiosqlite driver."""
+    url = get_async_database_url("sqlite:///prd_generator.db")
+    
+    assert url.drivername == "sqlite+aiosqlite"
+    assert url.database == "prd_generator.db"
+
+
+def test_async_url_unchanged_when_already_async():
+    """URIs that already use an async driver are returned unchanged."""
+    url = get_async_database_url("postgresql+asyncpg://user@db/prd_generator")
+    
+    assert url.drivername == "postgresql+asyncpg"
+
+
+def test_sqlite_engine_uses_wal_and_pool_settings(tmp_path):
+    """File-based SQLite engines get pooling options and fast-path pragmas."""
+    from sqlalchemy import create_engine, text
+    
+    from app.core.config import settings
+    from app.db.session import configure_engine, get_engine_options
+    
+    url = f"sqlite:///{tmp_path / 'pragmas.db'}"
+    engine = configure_engine(create_engine(url, **get_engine_options(url)), name="test")
+    try:
+        with engine.connect() as connection:
+            assert connection.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+            assert connection.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+            assert connection.execute(text("PRAGMA busy_timeout")).scalar() == settings.SQLITE_BUSY_TIMEOUT_MS
+        assert engine.pool.size() == settings.DB_POOL_SIZE
+    finally:
+        engine.dispose()
+
+
+def test_metrics_endpoint_reports_pool_usage(
+    client, test_auth_headers, test_superuser_auth_headers, monkeypatch
+):
+    """The metrics endpoint exposes connection pool gauges to superusers only."""
+    from app.api.deps import get_current_active_user, get_current_user
+    from app.main import app
+    
+    # Authenticate with the real dependencies so the superuser check applies
+    overrides = dict(app.dependency_overrides)
+    overrides.pop(get_current_user)
+    overrides.pop(get_current_active_user)
+    monkeypatch.setattr(app, "dependency_overrides", overrides)
+    
+    assert client.get("/api/v1/metrics").status_code == 401
+    assert client.get("/api/v1/metrics", headers=test_auth_headers).status_code == 403
+    response = client.get("/api/v1/metrics", headers=test_superuser_auth_headers)
+    
+    assert response.status_code == 200
+    gauges = response.json()["gauges"]
+    assert "db.primary.pool.size" in gauges
+    assert "db.primary.pool.checked_out" in gauges
+
+
+def test_routing_session_reads_replica_until_first_write(tmp_path):
+    """Replica-safe reads use the replica until the session writes."""
+    from sqlalchemy import Column, Integer, MetaData, Table, create_engine, insert, select
+    
+    from app.core.metrics import metrics
+    from app.db.session import RoutingSession, configure_engine
+    
+    table = Table("item", MetaData(), Column("id", Integer, primary_key=True))
+    primary = configure_engine(create_engine(f"sqlite:///{tmp_path / 'primary.db'}"), name="test_primary")
+    replica = configure_engine(create_engine(f"sqlite:///{tmp_path / 'replica.db'}"), name="test_replica")
+    for engine in (primary, replica):
+        table.metadata.create_all(engine)
+    with replica.begin() as connection:
+        connection.execute(insert(table).values(id=1))
+    
+    replica_read = select(table.c.id).execution_options(use_replica=True)
+    try:
+        with RoutingSession(bind=primary, replicas=[replica]) as session:
+            assert session.scalars(replica_read).all() == [1]
+            assert session.scalars(select(table.c.id)).all() == []
+            
+            session.execute(insert(table).values(id=2))
+            assert session.scalars(replica_read).all() == [2]
+            session.commit()
+        
+        timings = metrics.snapshot()["timings"]
+        assert timings["db.test_replica.query"]["count"] >= 1
+        assert timings["db.test_primary.query"]["count"] >= 2
+    finally:
+        primary.dispose()
+        replica.dispose()
+
+
+def test_failed_statements_leave_no_timer_state(tmp_path):
+    """A statement that raises leaves nothing behind on the pooled connection."""
+    from sqlalchemy import create_engine, text
+    from sqlalchemy.exc import OperationalError
+    
+    from app.core.metrics import metrics
+    from app.db.session import configure_engine
+    
+    engine = configure_engine(create_engine(f"sqlite:///{tmp_path / 'timer.db'}"), name="test_timer")
+    try:
+        with engine.connect() as connection:
+            for _ in range(3):
+                with pytest.raises(OperationalError):
+                    connection.execute(text("SELECT * FROM missing"))
+            before = metrics.snapshot()["timings"].get("db.test_timer.query", {}).get("count", 0)
+            assert connection.execute(text("SELECT 1")).scalar() == 1
+            assert metrics.snapshot()["timings"]["db.test_timer.query"]["count"] == before + 1
+            assert not any(isinstance(value, list) for value in connection.info.values())
+    finally:
+        engine.dispose()
@@ -0,0 +1,22 @@
+"""Tests for line-based revision deltas."""
+
+import json
+
+from app.core.delta import apply_delta, make_delta
+
+
+def test_delta_round_trips_edits():
+    """Deltas reproduce the target and reference unchanged lines by range."""
+    base = "".join(f"line {i}\n" for i in range(100))
+    target = base.replace("line 10\n", "changed\n").replace("line 60\n", "") + "tail without newline"
+    
+    delta = make_delta(base, target)
+    assert apply_delta(base, delta) == target
+    assert len(delta) < len(target) // 4
+    assert all(isinstance(segment, (list, str)) for segment in json.loads(delta))
+
+
+def test_delta_handles_empty_and_unrelated_text():
+    """Empty sides and texts without shared lines still round-trip."""
+    for base, target in [("", "new\n"), ("old\n", ""), ("a\nb\n", "c\nd"), ("", "")]:
+        assert apply_delta(base, make_delta(base, target)) == target
@@ -0,0 +1,110 @@
+"""Tests for monthly PRD partition helpers."""
+
+import asyncio
+from datetime import date, datetime
+
+import pytest
+
+from app.db.partitions import (
+    add_months,
+    create_partition_sql,
+    iter_months,
+    month_start,
+    partition_month,
+    partition_name,
+    split_default_partition_sql,
+)
+from app.manage import build_parser
+from app.services.partition_service import PartitionService
+
+
+def test_month_arithmetic_crosses_year_boundaries():
+    """Months are added and enumerated across December."""
+    assert month_start(datetime(2025, 11, 17, 9, 30)) == date(2025, 11, 1)
+    assert add_months(date(2025, 11, 1), 3) == date(2026, 2, 1)
+    assert add_months(date(2026, 1, 1), -1) == date(2025, 12, 1)
+    assert list(iter_months(date(2025, 12, 15), date(2026, 2, 1))) == [
+        date(2025, 12, 1),
+        date(2026, 1, 1),
+        date(2026, 2, 1),
+    ]
+
+
+def test_partition_names_round_trip():
+    """Partition names encode their month; other tables are not monthly."""
+    assert partition_name(date(2026, 3, 1)) == "prd_p2026_03"
+    assert partition_month("prd_p2026_03") == date(2026, 3, 1)
+    assert partition_month("prd_default") is None
+
+
+def test_partition_ddl_covers_one_month():
+    """Each partition's range ends where the next month starts."""
+    sql = create_partition_sql(date(2025, 12, 1))
+    assert "prd_p2025_12 PARTITION OF prd" in sql
+    assert "FROM ('2025-12-01') TO ('2026-01-01')" in sql
+
+
+class _RecordingSession:
+    """Stands in for a Postgres session, recording the SQL it is sent."""
+    
+    def __init__(self, partitions, default_months):
+        self.partitions = partitions
+        self.default_months = default_months
+        self.statements = []
+        self.commits = 0
+    
+    async def scalars(self, statement):
+        return iter(self.partitions)
+    
+    async def scalar(self, statement):
+        sql = str(statement)
+        self.statements.append(sql)
+        return any(f"created_at >= '{month.isoformat()}'" in sql for month in self.default_months)
+    
+    async def execute(self, statement):
+        self.statements.append(str(statement))
+    
+    async def commit(self):
+        self.commits += 1
+
+
+def test_rows_in_default_partition_are_moved_into_new_month():
+    """A month already holding default-partition rows is split out, then attached."""
+    db = _RecordingSession(["prd_default", "prd_p2026_10"], default_months=[date(2026, 11, 1)])
+    
+    created = asyncio.run(PartitionService.ensure_future(db, months_ahead=2, today=date(2026, 10, 19)))
+    
+    assert created == ["prd_p2026_11", "prd_p2026_12"]
+    november, december = db.statements[:4], db.statements[4:]
+    assert "FROM prd_default WHERE created_at >= '2026-11-01'" in november[0]
+    assert november[1:] == split_default_partition_sql(date(2026, 11, 1))
+    assert "DELETE FROM prd_default" in november[2] and "ATTACH PARTITION prd_p2026_11" in november[3]
+    assert december[1:] == [create_partition_sql(date(2026, 12, 1))]
+    assert db.commits == 2
+
+
+def test_sqlite_is_never_partitioned(test_async_session_factory):
+    """The maintenance command is a no-op outside Postgres."""
+    async def check():
+        async with test_async_session_factory() as db:
+            return await PartitionService.is_partitioned(db)
+    
+    assert asyncio.run(check()) is False
+
+
+def test_partitions_command_parses_months():
+    """--detach-before takes a month; archiving and dropping are exclusive."""
+    args = build_parser().parse_args(["partitions", "--detach-before", "2025-06", "--drop"])
+    assert args.detach_before == date(2025, 6, 1)
+    with pytest.raises(SystemExit):
+        build_parser().parse_args(["partitions", "--archive-schema", "old", "--drop"])
+
+
+def test_detach_rejects_unsafe_schema_names(test_async_session_factory):
+    """Archive schema names are interpolated into DDL, so they are validated."""
+    async def detach():
+        async with test_async_session_factory() as db:
+            await PartitionService.detach_before(db, date(2025, 1, 1), archive_schema="x; drop")
+    
+    with pytest.raises(ValueError):
+        asyncio.run(detach())
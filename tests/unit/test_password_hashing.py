@@ -0,0 +1,46 @@
+"""Tests for configurable password hashing and rehash-on-login."""
+
+import asyncio
+
+from sqlalchemy import select
+
+from app.core import security
+from app.core.security import build_crypt_context, calibrate_hash_cost
+from app.models.user import User
+from app.services.user_service import UserService
+
+
+def test_context_flags_hashes_with_other_settings():
+    """Hashes at another cost or scheme verify but need an update."""
+    cheap = build_crypt_context("bcrypt", cost=4)
+    hashed = cheap.hash("secret")
+    assert hashed.startswith("$2b$04$")
+    assert not cheap.needs_update(hashed)
+    assert build_crypt_context("bcrypt", cost=5).needs_update(hashed)
+    assert build_crypt_context("argon2").needs_update(hashed)
+    assert build_crypt_context("bcrypt", cost=5).verify("secret", hashed)
+
+
+def test_login_upgrades_outdated_hash(test_user, test_async_session_factory, monkeypatch):
+    """A successful login rewrites a hash made with old settings, once."""
+    monkeypatch.setattr(security, "pwd_context", build_crypt_context("bcrypt", cost=4))
+    
+    async def login():
+        async with test_async_session_factory() as db:
+            assert await UserService.authenticate(db, test_user.email, "wrong") is None
+            user = await UserService.authenticate(db, test_user.email, "password123")
+        async with test_async_session_factory() as db:
+            stored = await db.scalar(select(User.hashed_password).where(User.id == user.id))
+        return stored
+    
+    stored = asyncio.run(login())
+    assert stored.startswith("$2b$04$")
+    assert security.pwd_context.verify("password123", stored)
+    assert asyncio.run(login()) == stored
+
+
+def test_calibration_stops_past_target():
+    """Measuring stops once a cost is well over the target."""
+    recommended, timings = calibrate_hash_cost(0.0001, "bcrypt", samples=1)
+    assert recommended == 4
+    assert [cost for cost, _ in timings] == [4]
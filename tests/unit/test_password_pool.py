@@ -0,0 +1,59 @@
+"""Tests for the bounded password hashing pool and event-loop lag monitor."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.core.config import settings
+from app.core.loop_monitor import EventLoopLagMonitor
+from app.core.metrics import metrics
+from app.core.security import PasswordHasherBusy, PasswordHashPool, password_pool
+
+
+def test_pool_sheds_calls_beyond_workers_and_queue():
+    """Calls past workers + queue_limit fail fast; slots free when threads finish."""
+    pool = PasswordHashPool(workers=1, queue_limit=1)
+    release = threading.Event()
+    
+    async def storm():
+        waiting = [asyncio.ensure_future(pool.run("verify", release.wait)) for _ in range(2)]
+        await asyncio.sleep(0.01)
+        assert pool.in_flight == 2
+        with pytest.raises(PasswordHasherBusy):
+            await pool.run("verify", release.wait)
+        release.set()
+        return await asyncio.gather(*waiting)
+    
+    assert asyncio.run(storm()) == [True, True]
+    assert pool.in_flight == 0
+    pool.shutdown()
+
+
+def test_login_returns_429_when_pool_is_full(client, test_user, monkeypatch):
+    """A saturated pool turns logins into 429 with Retry-After."""
+    monkeypatch.setattr(password_pool, "workers", 0)
+    monkeypatch.setattr(password_pool, "queue_limit", 0)
+    
+    response = client.post(
+        f"{settings.API_V1_STR}/auth/login",
+        data={"username": test_user.email, "password": "password123"},
+    )
+    assert response.status_code == 429
+    assert response.headers["retry-after"] == "1"
+
+
+def test_lag_monitor_measures_blocking_work():
+    """Blocking the loop shows up as wake-up lag."""
+    monitor = EventLoopLagMonitor(interval=0.01)
+    
+    async def block():
+        monitor.start()
+        await asyncio.sleep(0.02)
+        time.sleep(0.1)
+        await asyncio.sleep(0.02)
+        await monitor.stop()
+    
+    asyncio.run(block())
+    assert metrics.snapshot()["timings"]["event_loop.lag"]["max_ms"] >= 50
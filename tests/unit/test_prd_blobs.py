@@ -0,0 +1,66 @@
+"""Tests for content-addressed PRD blob storage."""
+
+import asyncio
+
+from app.models.prd import PRD
+from app.models.prd_blob import PRDBlob, content_hash
+from app.services.blob_service import BlobService
+
+DOCUMENT = "# Shared\n\nThe same generated body.\n" * 20
+
+
+def test_identical_content_shares_one_blob(db_session, make_prd):
+    """Two PRDs with the same body reference a single blob."""
+    first, second = (db_session.get(PRD, make_prd(title, DOCUMENT).id) for title in ("First", "Second"))
+    
+    digest = content_hash(DOCUMENT)
+    blob = db_session.get(PRDBlob, digest)
+    assert first.content_hash == second.content_hash == digest
+    assert blob.ref_count == 2
+    assert blob.text == DOCUMENT
+    
+    db_session.delete(first)
+    db_session.commit()
+    db_session.refresh(blob)
+    assert blob.ref_count == 1
+    
+    db_session.delete(second)
+    db_session.commit()
+    db_session.refresh(blob)
+    assert blob.ref_count == 0
+
+
+def test_content_update_moves_reference(db_session, make_prd):
+    """Changing content releases the old blob and references the new one."""
+    prd = db_session.get(PRD, make_prd("Editable", "original body").id)
+    
+    prd.content = "revised body"
+    db_session.commit()
+    
+    assert db_session.get(PRDBlob, content_hash("original body")).ref_count == 0
+    assert db_session.get(PRDBlob, content_hash("revised body")).ref_count == 1
+    db_session.expire(prd)
+    assert prd.content == "revised body"
+    
+    db_session.delete(prd)
+    db_session.commit()
+
+
+def test_garbage_collection_removes_orphans(db_session, make_prd, test_async_session_factory):
+    """GC deletes unreferenced blobs and keeps referenced ones."""
+    kept = db_session.get(PRD, make_prd("Kept", "kept body").id)
+    dropped = db_session.get(PRD, make_prd("Dropped", "dropped body").id)
+    db_session.delete(dropped)
+    db_session.commit()
+    
+    async def collect():
+        async with test_async_session_factory() as session:
+            return await BlobService.collect_garbage(session, batch_size=1)
+    
+    assert asyncio.run(collect()) >= 1
+    db_session.expire_all()
+    assert db_session.get(PRDBlob, content_hash("dropped body")) is None
+    assert db_session.get(PRDBlob, content_hash("kept body")).ref_count == 1
+    
+    db_session.delete(kept)
+    db_session.commit()
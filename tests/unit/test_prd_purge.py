@@ -0,0 +1,57 @@
+"""Tests for PRD soft-delete and the purge worker."""
+
+import asyncio
+from datetime import datetime, timedelta
+
+from app.core.config import settings
+from app.models.prd import PRD
+from app.models.prd_blob import PRDBlob
+from app.services.purge_worker import PRDPurgeWorker, parse_window
+
+
+def test_delete_hides_prd_without_removing_row(client, test_auth_headers, db_session, make_prd):
+    """Deleted PRDs disappear from reads but stay in the table until purged."""
+    prd = make_prd("Soft deleted")
+    
+    response = client.delete(f"{settings.API_V1_STR}/prd/{prd.id}", headers=test_auth_headers)
+    assert response.status_code == 204
+    
+    assert client.get(f"{settings.API_V1_STR}/prd/{prd.id}", headers=test_auth_headers).status_code == 404
+    listed = client.get(f"{settings.API_V1_STR}/prd/summaries", headers=test_auth_headers).json()
+    assert str(prd.id) not in [item["id"] for item in listed]
+    
+    db_session.expire_all()
+    stored = db_session.get(PRD, prd.id)
+    assert stored.is_deleted and stored.deleted_at is not None
+
+
+def test_purge_removes_expired_rows_in_batches(db_session, make_prd, test_async_session_factory):
+    """Only rows past retention are purged, and their blob references released."""
+    now = datetime.utcnow()
+    expired = [db_session.get(PRD, make_prd(f"Expired {i}").id) for i in range(3)]
+    recent = db_session.get(PRD, make_prd("Recent").id)
+    for prd in expired:
+        prd.is_deleted, prd.deleted_at = True, now - timedelta(days=30)
+    recent.is_deleted, recent.deleted_at = True, now
+    db_session.commit()
+    expired_ids = [prd.id for prd in expired]
+    hashes = [prd.content_hash for prd in expired]
+    
+    worker = PRDPurgeWorker(retention=timedelta(days=7), batch_size=2, batch_pause=0, window="")
+    purged = asyncio.run(worker.run_once(test_async_session_factory))
+    
+    assert purged == 3
+    db_session.expire_all()
+    assert all(db_session.get(PRD, prd_id) is None for prd_id in expired_ids)
+    assert db_session.get(PRD, recent.id) is not None
+    assert all(db_session.get(PRDBlob, digest).ref_count == 0 for digest in hashes)
+
+
+def test_purge_window_wraps_midnight():
+    """Off-peak windows may span midnight."""
+    worker = PRDPurgeWorker(window="22-4")
+    
+    assert parse_window("") is None
+    assert worker.in_window(datetime(2026, 1, 1, 23))
+    assert worker.in_window(datetime(2026, 1, 1, 3))
+    assert not worker.in_window(datetime(2026, 1, 1, 12))
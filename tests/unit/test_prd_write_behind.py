@@ -0,0 +1,144 @@
+"""Tests for write-behind PRD persistence."""
+
+import asyncio
+import json
+
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError, OperationalError
+
+from app.core.metrics import metrics
+from app.models.prd import PRD
+from app.schemas.prd import Format, PRDCreate, TemplateType
+from app.services import prd_service
+from app.services.prd_service import PRDService
+from app.services.prd_writer import PRDWriteBehind
+
+
+def _prd_in(title):
+    return PRDCreate(
+        title=title,
+        input_prompt="Write-behind test",
+        format=Format.MARKDOWN,
+        template_type=TemplateType.CRUD,
+    )
+
+
+def test_queued_prds_are_group_committed(test_user, test_async_session_factory, monkeypatch):
+    """Queued PRDs are readable at once and committed together on stop."""
+    writer = PRDWriteBehind(max_batch=50, flush_interval=10)
+    monkeypatch.setattr(prd_service, "prd_writer", writer)
+    metrics.reset()
+    
+    async def scenario():
+        writer.start(test_async_session_factory)
+        async with test_async_session_factory() as db:
+            created = [
+                await PRDService.create(db, _prd_in(f"Queued {i}"), f"body {i}", test_user.id)
+                for i in range(5)
+            ]
+            # Read-your-writes before anything is committed
+            assert (await PRDService.get_by_id(db, created[0].id)).content == "body 0"
+            listed = await PRDService.get_summaries_by_user(db, test_user.id, limit=3)
+            assert [row.id for row in listed] == [prd.id for prd in reversed(created)][:3]
+        
+        await writer.stop()
+        
+        async with test_async_session_factory() as db:
+            stored = await db.scalar(
+                select(func.count(PRD.id)).where(PRD.id.in_([prd.id for prd in created]))
+            )
+            for prd in created:
+                await PRDService.delete(db, await PRDService.get_by_id(db, prd.id))
+        return stored
+    
+    assert asyncio.run(scenario()) == 5
+    counters = metrics.snapshot()["counters"]
+    assert counters["prd.write_behind.batches"] == 1
+    assert counters["prd.write_behind.written"] == 5
+
+
+def test_batches_are_bounded_by_size(test_user, test_async_session_factory, monkeypatch):
+    """A full batch is committed without waiting for the flush interval."""
+    writer = PRDWriteBehind(max_batch=2, flush_interval=10)
+    monkeypatch.setattr(prd_service, "prd_writer", writer)
+    metrics.reset()
+    
+    async def scenario():
+        writer.start(test_async_session_factory)
+        async with test_async_session_factory() as db:
+            first = await PRDService.create(db, _prd_in("First"), "first", test_user.id)
+            second = await PRDService.create(db, _prd_in("Second"), "second", test_user.id)
+            await asyncio.wait_for(writer.flush(), timeout=5)
+            assert writer.get_pending(first.id) is None
+            for prd in (first, second):
+                await PRDService.delete(db, await PRDService.get_by_id(db, prd.id))
+        await writer.stop()
+    
+    asyncio.run(scenario())
+    assert metrics.snapshot()["counters"]["prd.write_behind.written"] == 2
+
+
+def _failing_persist(monkeypatch, writer, error, times):
+    """Make the first ``times`` calls of persist_batch raise ``error``."""
+    real = PRDService.persist_batch
+    calls = []
+    
+    async def persist_batch(db, prds):
+        calls.append([writer.get_pending(prd.id) is not None for prd in prds])
+        if len(calls) <= times:
+            raise error
+        await real(db, prds)
+    
+    monkeypatch.setattr(PRDService, "persist_batch", staticmethod(persist_batch))
+    return calls
+
+
+def test_transient_failures_are_retried(test_user, test_async_session_factory, monkeypatch, tmp_path):
+    """A row whose write fails transiently stays readable and is written on retry."""
+    dead_letter = tmp_path / "dead.ndjson"
+    writer = PRDWriteBehind(max_batch=1, flush_interval=0, retry_base=0.01, dead_letter_path=str(dead_letter))
+    monkeypatch.setattr(prd_service, "prd_writer", writer)
+    calls = _failing_persist(
+        monkeypatch, writer, OperationalError("INSERT", {}, Exception("database is locked")), times=1
+    )
+    metrics.reset()
+    
+    async def scenario():
+        writer.start(test_async_session_factory)
+        async with test_async_session_factory() as db:
+            prd = await PRDService.create(db, _prd_in("Retried"), "retried", test_user.id)
+            await asyncio.wait_for(writer.flush(), timeout=5)
+        await writer.stop()
+        async with test_async_session_factory() as db:
+            stored = await PRDService.get_by_id(db, prd.id)
+            assert stored is not None and stored.content == "retried"
+            await PRDService.delete(db, stored)
+    
+    asyncio.run(scenario())
+    assert calls == [[True], [True]]
+    assert not dead_letter.exists()
+    counters = metrics.snapshot()["counters"]
+    assert counters["prd.write_behind.retries"] == 1
+    assert counters["prd.write_behind.written"] == 1
+
+
+def test_permanent_failures_are_dead_lettered(test_user, test_async_session_factory, monkeypatch, tmp_path):
+    """Rows that can never be written land in an importable dead-letter file."""
+    dead_letter = tmp_path / "dead.ndjson"
+    writer = PRDWriteBehind(max_batch=1, flush_interval=0, retry_base=0.01, dead_letter_path=str(dead_letter))
+    monkeypatch.setattr(prd_service, "prd_writer", writer)
+    _failing_persist(monkeypatch, writer, IntegrityError("INSERT", {}, Exception("constraint")), times=1)
+    metrics.reset()
+    
+    async def scenario():
+        writer.start(test_async_session_factory)
+        async with test_async_session_factory() as db:
+            prd = await PRDService.create(db, _prd_in("Doomed"), "doomed body", test_user.id)
+        await writer.stop()
+        return prd
+    
+    prd = asyncio.run(scenario())
+    [record] = [json.loads(line) for line in dead_letter.read_text().splitlines()]
+    assert record["id"] == str(prd.id) and record["content"] == "doomed body"
+    assert record["title"] == "Doomed" and record["error"].startswith("IntegrityError")
+    assert metrics.snapshot()["counters"]["prd.write_behind.dead_lettered"] == 1
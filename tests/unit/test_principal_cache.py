@@ -0,0 +1,62 @@
+"""Tests for the authenticated-principal cache."""
+
+import asyncio
+
+from sqlalchemy import event
+
+from app.core.cache import TTLCache
+from app.schemas.user import UserUpdate
+from app.services.principal_cache import principal_cache
+from app.services.user_service import UserService
+
+
+def test_ttl_cache_evicts_least_recently_used_and_expired():
+    """Entries leave by LRU order when full and by age after the TTL."""
+    now = [0.0]
+    cache = TTLCache("test", max_size=2, ttl=10, clock=lambda: now[0])
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (1, 3)
+    
+    now[0] = 10.5
+    assert cache.get("a") is None and len(cache) == 1
+
+
+def test_cached_principal_skips_queries_until_invalidated(test_user, test_async_session_factory):
+    """Repeat lookups hit no database; update and deactivation are seen at once."""
+    principal_cache.clear()
+    statements = []
+    engine = test_async_session_factory.kw["bind"].sync_engine
+    
+    def count(conn, cursor, statement, *args):
+        statements.append(statement)
+    
+    async def scenario():
+        async with test_async_session_factory() as db:
+            first = await UserService.get_principal(db, test_user.id)
+        event.listen(engine, "before_cursor_execute", count)
+        try:
+            async with test_async_session_factory() as db:
+                cached = await UserService.get_principal(db, test_user.id)
+            assert statements == []
+            assert cached is not first and cached.email == test_user.email
+            
+            # The cached copy can be updated like a loaded user
+            async with test_async_session_factory() as db:
+                await UserService.update(db, cached, UserUpdate(full_name="Renamed"))
+            async with test_async_session_factory() as db:
+                renamed = await UserService.get_principal(db, test_user.id)
+            assert renamed.full_name == "Renamed"
+            
+            async with test_async_session_factory() as db:
+                await UserService.deactivate(db, renamed)
+            async with test_async_session_factory() as db:
+                return await UserService.get_principal(db, test_user.id)
+        finally:
+            event.remove(engine, "before_cursor_execute", count)
+    
+    assert asyncio.run(scenario()).is_active is False
+    principal_cache.clear()
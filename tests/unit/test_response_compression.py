@@ -0,0 +1,98 @@
+"""Tests for the response compression middleware."""
+
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.core.metrics import metrics
+from app.core.response_compression import CompressionMiddleware, choose_encoding
+
+BODY = "# Requirements\n\n" + "- The system shall compress responses.\n" * 200
+
+
+def _client(**options):
+    app = FastAPI()
+    
+    @app.get("/doc")
+    async def doc(request: Request):
+        if request.headers.get("if-none-match", "").removeprefix("W/") == '"abc"':
+            return Response(status_code=304, headers={"ETag": '"abc"'})
+        return PlainTextResponse(BODY, headers={"ETag": '"abc"'})
+    
+    @app.get("/small")
+    async def small():
+        return {"ok": True}
+    
+    @app.get("/stream")
+    async def stream():
+        return StreamingResponse(iter([BODY, BODY]), media_type="text/plain")
+    
+    @app.get("/export/all")
+    async def export():
+        return PlainTextResponse(BODY)
+    
+    app.add_middleware(
+        CompressionMiddleware,
+        min_size=500,
+        encodings=["zstd", "br", "gzip"],
+        skip_paths=["/export"],
+        **options,
+    )
+    return TestClient(app)
+
+
+def test_encoding_negotiation_honours_weights():
+    """Server preference applies among encodings the client accepts."""
+    assert choose_encoding("gzip, deflate", ["br", "gzip"]) == "gzip"
+    assert choose_encoding("gzip;q=0, *;q=0.5", ["gzip"]) is None
+    assert choose_encoding("identity", ["gzip"]) is None
+    assert choose_encoding("*", ["unknown", "gzip"]) == "gzip"
+    assert choose_encoding("gzip;q=0.2, zstd", ["gzip", "zstd"]) == "zstd"
+
+
+def test_large_text_bodies_are_compressed():
+    """Compressed bodies round-trip and carry the right headers and metrics."""
+    metrics.reset()
+    client = _client()
+    
+    response = client.get("/doc", headers={"Accept-Encoding": "gzip"})
+    
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.headers["etag"] == 'W/"abc"'
+    assert response.text == BODY
+    snapshot = metrics.snapshot()
+    assert snapshot["counters"]["http.compression.bytes_in"] == len(BODY)
+    assert snapshot["timings"]["http.compression.gzip.cpu"]["count"] == 1
+    assert snapshot["gauges"]["http.compression.ratio"] > 10
+
+
+def test_not_modified_repeats_the_tag_form_of_the_200():
+    """A 304 revalidating a compressed 200 carries the same weak tag."""
+    client = _client()
+    etag = client.get("/doc", headers={"Accept-Encoding": "gzip"}).headers["etag"]
+    
+    cached = client.get("/doc", headers={"Accept-Encoding": "gzip", "If-None-Match": etag})
+    strong = client.get("/doc", headers={"Accept-Encoding": "gzip", "If-None-Match": '"abc"'})
+    
+    assert cached.status_code == 304 and cached.headers["etag"] == etag == 'W/"abc"'
+    assert strong.status_code == 304 and strong.headers["etag"] == '"abc"'
+
+
+def test_large_bodies_compress_in_worker_thread():
+    """Bodies over the thread threshold are still compressed correctly."""
+    response = _client(thread_min_size=1).get("/doc", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.text == BODY
+
+
+def test_small_streaming_and_skipped_responses_pass_through():
+    """Tiny, streamed and skip-listed responses are sent as is."""
+    client = _client()
+    headers = {"Accept-Encoding": "gzip"}
+    
+    assert "content-encoding" not in client.get("/small", headers=headers).headers
+    streamed = client.get("/stream", headers=headers)
+    assert "content-encoding" not in streamed.headers and streamed.text == BODY * 2
+    assert "content-encoding" not in client.get("/export/all", headers=headers).headers
+    assert "content-encoding" not in client.get("/doc", headers={"Accept-Encoding": "identity"}).headers
@@ -0,0 +1,53 @@
+"""Tests for the verified-token cache."""
+
+import time
+from datetime import timedelta
+
+import pytest
+
+from app.core import security
+from app.core.security import create_access_token, decode_access_token, token_cache
+
+
+@pytest.fixture
+def decodes(monkeypatch):
+    """Count calls into python-jose's verifying decode."""
+    calls = []
+    original = security.jwt.decode
+    
+    def counting(*args, **kwargs):
+        calls.append(args[0])
+        return original(*args, **kwargs)
+    
+    token_cache.clear()
+    monkeypatch.setattr(security.jwt, "decode", counting)
+    yield calls
+    token_cache.clear()
+
+
+def test_valid_tokens_are_verified_once(decodes):
+    """Repeat decodes are served from the cache; invalid tokens never are."""
+    token = create_access_token("user-1")
+    
+    first = decode_access_token(token)
+    second = decode_access_token(token)
+    assert first["sub"] == second["sub"] == "user-1"
+    assert len(decodes) == 1
+    with pytest.raises(TypeError):
+        second["sub"] = "someone-else"
+    
+    forged = token[:-2] + ("AA" if not token.endswith("AA") else "BB")
+    assert decode_access_token(forged) is None
+    assert decode_access_token(forged) is None
+    assert len(decodes) == 3
+
+
+def test_cache_never_outlives_token_expiry(decodes, monkeypatch):
+    """Once ``exp`` has passed the cached payload is no longer returned."""
+    token = create_access_token("user-2", expires_delta=timedelta(seconds=30))
+    assert decode_access_token(token)["sub"] == "user-2"
+    
+    later = time.time() + 60
+    monkeypatch.setattr(security.time, "time", lambda: later)
+    decode_access_token(token)
+    assert len(decodes) == 2
@@ -0,0 +1,64 @@
+"""Tests that service writes need no follow-up SELECT."""
+
+import asyncio
+import uuid
+
+import pytest
+from sqlalchemy import event
+
+from app.schemas.prd import Format, PRDCreate, PRDUpdate, TemplateType
+from app.schemas.user import UserCreate, UserUpdate
+from app.services.prd_service import PRDService
+from app.services.user_service import UserService
+
+
+@pytest.fixture
+def recorded_statements(test_async_session_factory):
+    """Capture SQL sent through the test engine for the duration of a test."""
+    statements = []
+    engine = test_async_session_factory.kw["bind"].sync_engine
+    
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+    
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
+def test_writes_issue_no_select(test_async_session_factory, recorded_statements):
+    """Creates and updates return complete objects without re-reading them."""
+    async def scenario():
+        async with test_async_session_factory() as db:
+            user = await UserService.create(
+                db, UserCreate(email=f"{uuid.uuid4().hex}@example.com", password="secret")
+            )
+            user = await UserService.update(db, user, UserUpdate(full_name="Renamed"))
+            prd = await PRDService.create(
+                db,
+                PRDCreate(
+                    title="Round trips",
+                    input_prompt="Round trip test",
+                    format=Format.MARKDOWN,
+                    template_type=TemplateType.CRUD,
+                ),
+                "# Round trips",
+                user.id,
+            )
+            prd = await PRDService.update(db, prd, PRDUpdate(title="Renamed PRD"))
+            writes = [s for s in recorded_statements if not s.lstrip().upper().startswith("SELECT")]
+            reads = [s for s in recorded_statements if s.lstrip().upper().startswith("SELECT")]
+            
+            assert user.full_name == "Renamed" and user.created_at is not None
+            assert prd.title == "Renamed PRD" and prd.updated_at >= prd.created_at
+            
+            await PRDService.delete(db, prd)
+            await db.delete(user)
+            await db.commit()
+            return writes, reads
+    
+    writes, reads = asyncio.run(scenario())
+    assert writes
+    assert reads == []
@@ -0,0 +1,40 @@
+"""Tests for the streaming ZIP writer."""
+
+import io
+import zipfile
+from datetime import datetime
+
+from app.core import zipstream
+from app.core.zipstream import ZipStream
+
+
+def _build(entries):
+    archive = ZipStream()
+    data = b"".join(archive.add(name, body, datetime(2026, 3, 4, 5, 6, 8)) for name, body in entries)
+    return data + b"".join(archive.close(chunk_size=7))
+
+
+def test_archive_is_readable_by_zipfile():
+    """Entries round-trip through the standard library reader."""
+    data = _build([("notes/été.md", "# Été ✓\n".encode() * 100), ("empty.json", b"")])
+    
+    archive = zipfile.ZipFile(io.BytesIO(data))
+    assert archive.testzip() is None
+    assert archive.namelist() == ["notes/été.md", "empty.json"]
+    assert archive.read("notes/été.md") == "# Été ✓\n".encode() * 100
+    info = archive.getinfo("empty.json")
+    assert info.compress_type == zipfile.ZIP_DEFLATED and info.date_time == (2026, 3, 4, 5, 6, 8)
+
+
+def test_zip64_records_written_past_classic_limits(monkeypatch):
+    """Large offsets and entry counts switch to Zip64 records."""
+    monkeypatch.setattr(zipstream, "ZIP64_LIMIT", 64)
+    monkeypatch.setattr(zipstream, "ZIP_MAX_ENTRIES", 3)
+    entries = [(f"{i}.txt", f"body {i}".encode() * 5) for i in range(5)]
+    
+    data = _build(entries)
+    
+    assert b"PK\x06\x06" in data and b"PK\x06\x07" in data
+    archive = zipfile.ZipFile(io.BytesIO(data))
+    assert archive.testzip() is None
+    assert [archive.read(name) for name, _ in entries] == [body for _, body in entries]